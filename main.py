@@ -3,11 +3,15 @@ from contextlib import asynccontextmanager
 import uvicorn
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from src.api.v1.routes import api_router
 from src.web.routes import web_router
 from src.core.config import Settings, settings
 from src.database.session import init_db
+from src.api.deps import remember_writes, version_conflict_handler
+from src.common.custom_exceptions import VersionConflict
+from sqlalchemy.orm.exc import StaleDataError
 import logging
 
 logging.basicConfig(
@@ -31,8 +35,10 @@ class App:
             redoc_url="/redoc",
             openapi_url="/openapi.json",
             lifespan=self.lifespan,
+            default_response_class=ORJSONResponse,
         )
         self.__setup_middlewares(settings=settings)
+        self.__setup_exception_handlers()
         self.__setup_api_routes(settings=settings, router=api_router)
         self.__setup_web_routes(router=web_router)
         self.__app.mount("/static", StaticFiles(directory="src/static"), name="static")
@@ -45,6 +51,11 @@ class App:
             allow_methods=["*"],
             allow_headers=["*"],
         )
+        self.__app.middleware("http")(remember_writes)
+
+    def __setup_exception_handlers(self):
+        for exception in (StaleDataError, VersionConflict):
+            self.__app.add_exception_handler(exception, version_conflict_handler)
 
     def __setup_api_routes(self, router: APIRouter, settings: Settings):
         self.__app.include_router(router, prefix=settings.API_V1_STR)
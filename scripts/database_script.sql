@@ -1,7 +1,9 @@
 INSERT INTO tournaments.tournament_format (id, type) 
 VALUES 
     (1, 'league'), 
-    (2, 'knockout');
+    (2, 'knockout'),
+    (3, 'swiss'),
+    (4, 'groups');
 
 INSERT INTO tournaments.match_format (id, type) 
 VALUES 
@@ -12,4 +14,74 @@ INSERT INTO tournaments.result_codes (id, result)
 VALUES 
     (1, 'player 1'),
     (2, 'player 2'), 
-    (3, 'draw');
\ No newline at end of file
+    (3, 'draw');
+
+-- Existing databases: request timestamps are generated by the database.
+ALTER TABLE tournaments.requests ALTER COLUMN created_at SET DEFAULT now();
+
+-- Existing databases: normalized player name used for indexed name lookups.
+ALTER TABLE tournaments.players ADD COLUMN IF NOT EXISTS name_key VARCHAR(101);
+UPDATE tournaments.players SET name_key = lower(regexp_replace(trim(first_name || ' ' || last_name), '\s+', ' ', 'g'));
+ALTER TABLE tournaments.players ALTER COLUMN name_key SET NOT NULL;
+CREATE INDEX IF NOT EXISTS ix_players_name_key ON tournaments.players (name_key);
+CREATE INDEX IF NOT EXISTS ix_players_name_key_prefix ON tournaments.players (name_key text_pattern_ops);
+
+-- Existing databases: knockout matches link to the match their winner advances to.
+ALTER TABLE tournaments.matches ADD COLUMN IF NOT EXISTS next_match_id UUID REFERENCES tournaments.matches (id);
+
+-- Existing databases: swiss tournaments and participants starting from zero points.
+INSERT INTO tournaments.tournament_format (id, type) VALUES (3, 'swiss') ON CONFLICT (id) DO NOTHING;
+ALTER TABLE tournaments.tournament_participants ALTER COLUMN score SET DEFAULT 0;
+UPDATE tournaments.tournament_participants SET score = 0 WHERE score IS NULL;
+
+-- Existing databases: groups tournaments with a knockout playoff.
+INSERT INTO tournaments.tournament_format (id, type) VALUES (4, 'groups') ON CONFLICT (id) DO NOTHING;
+ALTER TABLE tournaments.tournaments ADD COLUMN IF NOT EXISTS group_size INTEGER DEFAULT 4;
+ALTER TABLE tournaments.tournaments ADD COLUMN IF NOT EXISTS group_qualifiers INTEGER DEFAULT 2;
+ALTER TABLE tournaments.tournament_participants ADD COLUMN IF NOT EXISTS group_number INTEGER;
+ALTER TABLE tournaments.matches ADD COLUMN IF NOT EXISTS group_number INTEGER;
+ALTER TABLE tournaments.matches ADD COLUMN IF NOT EXISTS source_a VARCHAR(10);
+ALTER TABLE tournaments.matches ADD COLUMN IF NOT EXISTS source_b VARCHAR(10);
+
+-- Existing databases: knockout brackets whose later matches are created as they are reached.
+ALTER TABLE tournaments.tournaments ADD COLUMN IF NOT EXISTS lazy_bracket BOOLEAN NOT NULL DEFAULT FALSE;
+
+-- Existing databases: court a scheduled match is played on.
+ALTER TABLE tournaments.matches ADD COLUMN IF NOT EXISTS court INTEGER;
+
+-- Existing databases: time a match result was applied to the statistics.
+ALTER TABLE tournaments.matches ADD COLUMN IF NOT EXISTS finalized_at TIMESTAMP;
+
+-- Existing databases: row versions used for optimistic concurrency (ETag / If-Match).
+ALTER TABLE tournaments.matches ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
+ALTER TABLE tournaments.tournaments ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
+
+-- Existing databases: order in which the player statistics consume finalized matches.
+CREATE INDEX IF NOT EXISTS ix_matches_finalized_at_id ON tournaments.matches (finalized_at, id);
+
+-- Existing databases: matches between two players, whichever side each of them played on.
+CREATE INDEX IF NOT EXISTS ix_matches_player_pair ON tournaments.matches (LEAST(player_a_id, player_b_id), GREATEST(player_a_id, player_b_id), start_time, id);
+
+-- Existing databases: Elo ratings. Run `python -m scripts.recompute_ratings` afterwards.
+ALTER TABLE tournaments.players ADD COLUMN IF NOT EXISTS rating DOUBLE PRECISION NOT NULL DEFAULT 1500;
+CREATE INDEX IF NOT EXISTS ix_players_rating ON tournaments.players (rating);
+
+-- Existing databases: precomputed leaderboard positions. Run `python -m scripts.rebuild_player_stats` afterwards.
+ALTER TABLE tournaments.player_stats ADD COLUMN IF NOT EXISTS win_rate DOUBLE PRECISION NOT NULL DEFAULT 0;
+ALTER TABLE tournaments.player_stats ADD COLUMN IF NOT EXISTS rating_rank INTEGER;
+ALTER TABLE tournaments.player_stats ADD COLUMN IF NOT EXISTS wins_rank INTEGER;
+ALTER TABLE tournaments.player_stats ADD COLUMN IF NOT EXISTS win_rate_rank INTEGER;
+CREATE INDEX IF NOT EXISTS ix_player_stats_rating_rank ON tournaments.player_stats (rating_rank);
+CREATE INDEX IF NOT EXISTS ix_player_stats_wins_rank ON tournaments.player_stats (wins_rank);
+CREATE INDEX IF NOT EXISTS ix_player_stats_win_rate_rank ON tournaments.player_stats (win_rate_rank);
+
+-- Existing databases: schedule settings kept for later changes of a match time, and the scheduled matches of a player or court around a time.
+ALTER TABLE tournaments.tournaments ADD COLUMN IF NOT EXISTS courts INTEGER;
+ALTER TABLE tournaments.tournaments ADD COLUMN IF NOT EXISTS rest_minutes INTEGER NOT NULL DEFAULT 0;
+CREATE INDEX IF NOT EXISTS ix_matches_player_a_end_time ON tournaments.matches (player_a_id, end_time);
+CREATE INDEX IF NOT EXISTS ix_matches_player_b_end_time ON tournaments.matches (player_b_id, end_time);
+CREATE INDEX IF NOT EXISTS ix_matches_court_end_time ON tournaments.matches (tournament_id, court, end_time);
+
+-- Existing databases: leaderboard orders, to re-rank only the positions around changed players.
+CREATE INDEX IF NOT EXISTS ix_player_stats_wins_order ON tournaments.player_stats (wins DESC, win_rate DESC, player_id);
+CREATE INDEX IF NOT EXISTS ix_player_stats_win_rate_order ON tournaments.player_stats (win_rate DESC, matches_played DESC, player_id);
@@ -0,0 +1,47 @@
+"""
+Rebuild the player statistics and head-to-head records from the finalized matches.
+
+Run from the project root, e.g. after a backfill or a manual fix of match results:
+
+    python -m scripts.rebuild_player_stats
+    python -m scripts.rebuild_player_stats --player <player_id> --player <player_id>
+"""
+import argparse
+import logging
+from uuid import UUID
+
+from src.crud.stats import BATCH_SIZE, rebuild_player_stats
+from src.database.session import SessionLocal, init_db
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--player",
+        dest="player_ids",
+        action="append",
+        type=UUID,
+        help="Only rebuild this player (can be repeated). Rebuilds every player by default.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_SIZE,
+        help="How many matches are fetched from the database at a time.",
+    )
+    args = parser.parse_args()
+
+    init_db()
+    db_session = SessionLocal()
+    try:
+        consumed = rebuild_player_stats(db_session, args.player_ids, batch_size=args.batch_size)
+    finally:
+        db_session.close()
+    logger.info("Rebuilt the player statistics from %d finalized matches", consumed)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
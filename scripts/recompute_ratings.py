@@ -0,0 +1,40 @@
+"""
+Recompute every player rating and the rating history from the finalized matches.
+
+Run from the project root, e.g. after a backfill or after deleting finalized matches:
+
+    python -m scripts.recompute_ratings
+"""
+import argparse
+import logging
+import time
+
+from src.crud.ratings import BATCH_SIZE, recompute_ratings
+from src.database.session import SessionLocal, init_db
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_SIZE,
+        help="How many matches are fetched and history rows written at a time.",
+    )
+    args = parser.parse_args()
+
+    init_db()
+    db_session = SessionLocal()
+    started = time.perf_counter()
+    try:
+        replayed = recompute_ratings(db_session, batch_size=args.batch_size)
+    finally:
+        db_session.close()
+    logger.info("Replayed %d finalized matches in %.1fs", replayed, time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
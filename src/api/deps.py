@@ -1,14 +1,105 @@
+import time
 from typing import Generator
 
-from src.database.session import SessionLocal
+from fastapi import Header, HTTPException, Request, status
 
+from src.common.custom_exceptions import VersionConflict
+from src.common.custom_responses import PreconditionFailed
+from src.core.config import settings
+from src.database.session import RoutingSession, SessionLocal, pick_replica
 
-def get_db() -> Generator:
+# Cookie holding the time of the last write of a client, for read-your-writes.
+LAST_WRITE_COOKIE = "last_write"
+
+
+def get_db(request: Request) -> Generator:
     """
     Get a database connection from the connection pool and return it to the pool when the request is finished.
     """
     try:
         db = SessionLocal()
+        track_session(request, db)
+        yield db
+    finally:
+        db.close()
+
+
+def track_session(request: Request, db: RoutingSession):
+    """
+    Remember the sessions opened for a request, so `remember_writes` can tell whether it wrote.
+    """
+    if not hasattr(request.state, "db_sessions"):
+        request.state.db_sessions = []
+    request.state.db_sessions.append(db)
+
+
+def wrote_recently(request: Request) -> bool:
+    """
+    Check whether the client wrote within the read-your-writes window.
+    """
+    try:
+        last_write = float(request.cookies.get(LAST_WRITE_COOKIE, 0))
+    except ValueError:
+        return False
+    return time.time() - last_write < settings.READ_YOUR_WRITES_SECONDS
+
+
+def get_read_db(request: Request) -> Generator:
+    """
+    Get a database connection for read-only endpoints. Reads go to a replica, unless the
+    client wrote recently, so it always sees its own changes. Writes still go to the primary.
+    """
+    try:
+        db = SessionLocal(replica=None if wrote_recently(request) else pick_replica())
+        track_session(request, db)
         yield db
     finally:
         db.close()
+
+
+async def remember_writes(request: Request, call_next):
+    """
+    Middleware setting the read-your-writes cookie on the responses of requests that wrote to the database.
+    """
+    response = await call_next(request)
+    if any(db.wrote for db in getattr(request.state, "db_sessions", [])):
+        response.set_cookie(
+            LAST_WRITE_COOKIE,
+            str(time.time()),
+            max_age=settings.READ_YOUR_WRITES_SECONDS,
+            httponly=True,
+        )
+    return response
+
+
+def get_if_match(if_match: str | None = Header(default=None)) -> int | None:
+    """
+    Get the version the client expects to change from the `If-Match` header, i.e. the ETag
+    it received with the resource. Returns None when the header is missing or is `*`.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    try:
+        return int(if_match.strip().removeprefix("W/").strip('"'))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED, detail="Invalid If-Match header"
+        )
+
+
+def version_etag(version: int) -> str:
+    """
+    Build the ETag of a versioned resource.
+    """
+    return f'"{version}"'
+
+
+async def version_conflict_handler(request: Request, exc: Exception) -> PreconditionFailed:
+    """
+    Exception handler answering 412 to a change based on an outdated version of a resource,
+    i.e. a `VersionConflict`, or a `StaleDataError` raised when a versioned row was changed
+    by a concurrent request, wherever in the request it is flushed.
+    """
+    if isinstance(exc, VersionConflict):
+        return PreconditionFailed(content=str(exc))
+    return PreconditionFailed(content="The resource was modified by another request")
@@ -1,12 +1,13 @@
-from src.api.deps import get_db
+from src.api.deps import get_db, get_read_db, get_if_match, version_etag
 import logging
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Response, status
 from sqlalchemy.orm import Session
-from src.schemas.match import CreateMatchRequest, MatchResult, MatchUpdateTime
-from src.crud import matches
+from src.schemas.match import CreateMatchRequest, MatchOut, MatchResult, MatchUpdateTime, BatchMatchResults
+from src.crud import matches, stats
 from uuid import UUID
 from src.models.user import User, Role
 from src.core.auth import get_current_user
+from src.common.serialization import rows_response
 from src.common.custom_responses import (
     Unauthorized,
     ForbiddenAccess
@@ -18,7 +19,7 @@ router = APIRouter()
 
 
 
-@router.post("/", status_code=status.HTTP_201_CREATED)
+@router.post("/", status_code=status.HTTP_201_CREATED, response_model=MatchOut)
 def post_match(request: CreateMatchRequest, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     if current_user is None:
         return Unauthorized(content="The user is not authorized to perform this action")
@@ -29,54 +30,89 @@ def post_match(request: CreateMatchRequest, db: Session = Depends(get_db), curre
 
 
 
-@router.get("/matches")
+@router.get("/matches", response_model=list[MatchOut])
 def get_all_matches(
     tournament_id: UUID = None,
     sort_by_date: bool = False,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     all_matches = matches.read_all_matches(db, tournament_id=tournament_id, sort_by_date=sort_by_date)
-    return [match for match in all_matches]
+    return rows_response(all_matches)
 
-@router.get("/{match_id}")
-def get_match(match_id: UUID, db: Session = Depends(get_db)):
-    return matches.read_match_by_id(db, match_id)
+@router.patch("/scores")
+def patch_match_scores(request: BatchMatchResults, background_tasks: BackgroundTasks, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    if current_user is None:
+        return Unauthorized(content="The user is not authorized to perform this action")
+
+    if current_user.role not in {Role.ADMIN, Role.DIRECTOR}:
+        return ForbiddenAccess()
+    statuses = matches.update_match_scores(db, request.results, current_user)
+    background_tasks.add_task(stats.refresh_player_stats_task)
+    return statuses
+
+@router.get("/{match_id}", response_model=MatchOut)
+def get_match(match_id: UUID, response: Response, db: Session = Depends(get_read_db)):
+    match = matches.read_match_by_id(db, match_id)
+    response.headers["ETag"] = version_etag(match.version)
+    return match
 
 
 
-@router.patch("/{match_id}/score")
-def patch_match_score(match_id: UUID, updates: MatchResult, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+@router.patch("/{match_id}/score", response_model=MatchOut)
+def patch_match_score(match_id: UUID, updates: MatchResult, response: Response, expected_version: int | None = Depends(get_if_match), db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    if current_user is None:
+        return Unauthorized(content="The user is not authorized to perform this action")
+
+    if current_user.role not in {Role.ADMIN, Role.DIRECTOR}:
+        return ForbiddenAccess()
+    match = matches.update_match_score(match_id, updates, db, current_user, expected_version)
+    response.headers["ETag"] = version_etag(match.version)
+    return match
+
+@router.put("/{match_id}/finalize", response_model=MatchOut)
+def put_match_finalize(match_id: UUID, updates: MatchResult, background_tasks: BackgroundTasks, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     if current_user is None:
         return Unauthorized(content="The user is not authorized to perform this action")
 
     if current_user.role not in {Role.ADMIN, Role.DIRECTOR}:
         return ForbiddenAccess()
-    return matches.update_match_score(match_id, updates, db, current_user)
+    match = matches.finalize_match(db, match_id, updates, current_user)
+    background_tasks.add_task(stats.refresh_player_stats_task)
+    return match
 
-@router.patch("/{match_id}/date")
-def patch_match_date(match_id: UUID, updates: MatchUpdateTime, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+@router.patch("/{match_id}/date", response_model=MatchOut)
+def patch_match_date(match_id: UUID, updates: MatchUpdateTime, response: Response, expected_version: int | None = Depends(get_if_match), db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     if current_user is None:
         return Unauthorized(content="The user is not authorized to perform this action")
 
     if current_user.role not in {Role.ADMIN, Role.DIRECTOR}:
         return ForbiddenAccess()
-    return matches.update_match_date(db, match_id, updates, current_user)
+    match = matches.update_match_date(db, match_id, updates, current_user, expected_version)
+    response.headers["ETag"] = version_etag(match.version)
+    return match
 
 
 @router.delete("/{match_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_match(match_id: UUID, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def delete_match(match_id: UUID, background_tasks: BackgroundTasks, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     if current_user is None:
         return Unauthorized(content="The user is not authorized to perform this action")
 
     if current_user.role not in {Role.ADMIN, Role.DIRECTOR}:
         return ForbiddenAccess()
-    return matches.delete_match(db, match_id, current_user)
+    match = matches.read_match_by_id(db, match_id)
+    finalized_players = [match.player_a_id, match.player_b_id] if match.finalized_at is not None else None
+    deleted = matches.delete_match(db, match_id, current_user)
+    if finalized_players:
+        background_tasks.add_task(stats.rebuild_player_stats_task, finalized_players)
+    return deleted
 
 @router.put("/match/{match_id}/update_stats", status_code=status.HTTP_200_OK)
-def put_player_stats(match_id: UUID, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def put_player_stats(match_id: UUID, background_tasks: BackgroundTasks, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     if current_user is None:
         return Unauthorized(content="The user is not authorized to perform this action")
 
     if current_user.role not in {Role.ADMIN, Role.DIRECTOR}:
         return ForbiddenAccess()
-    return matches.update_player_stats_after_match(db, match_id, current_user)
\ No newline at end of file
+    result = matches.update_player_stats_after_match(db, match_id, current_user)
+    background_tasks.add_task(stats.refresh_player_stats_task)
+    return result
\ No newline at end of file
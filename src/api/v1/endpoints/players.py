@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
-from src.api.deps import get_db
-from src.schemas.player import CreatePlayerRequest, PlayerResponse, ParticipantResponse, PlayerUpdate
-from src.crud import players
+from src.api.deps import get_db, get_read_db
+from src.schemas.player import CreatePlayerRequest, PlayerResponse, ParticipantResponse, PlayerUpdate, PlayerSuggestion, PlayerStatsResponse, HeadToHeadResponse, MatchupResponse, PlayerRatingResponse, LeaderboardEntry
+from src.crud import matches, players, ratings, stats
 from uuid import UUID
+from typing import Literal
 from src.core.auth import get_current_user
+from src.common.serialization import list_response
 from src.models.user import User, Role
 from src.common.custom_responses import (
     Unauthorized,
@@ -24,22 +26,67 @@ def create_player(request: CreatePlayerRequest, db: Session = Depends(get_db), c
     return players.create_player(db, request)
 
 @router.get("/my_profile", response_model=PlayerResponse)
-def get_user_player_profile(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def get_user_player_profile(db: Session = Depends(get_read_db), current_user: User = Depends(get_current_user)):
     if current_user is None:
         return Unauthorized(content="The user is not authorized to perform this action")
     if current_user.role != Role.USER:
         return ForbiddenAccess()
     return players.read_current_user_player_profile(db, current_user)
 
+@router.get("/search", response_model=list[PlayerSuggestion])
+def search_players(q: str = Query(min_length=1, max_length=101, description="Beginning of the player's full name"),
+                   limit: int = Query(10, ge=1, le=50, description="Maximum number of suggestions"),
+                   db: Session = Depends(get_read_db)):
+    return players.search_players(db, q, limit)
+
+@router.get("/leaderboard", response_model=list[LeaderboardEntry])
+def get_leaderboard(sort: Literal["rating", "wins", "win_rate"] = Query("rating", description="rank players by rating, wins or win rate"),
+                    offset: int = Query(0, ge=0, description="offset the number of players returned"),
+                    limit: int = Query(10, ge=1, le=100, description="limit the number of players returned"),
+                    db: Session = Depends(get_read_db)):
+    return stats.read_leaderboard(db, sort, offset, limit)
+
 @router.get("/{player_id}", response_model=PlayerResponse)
-def get_player(player_id: UUID, db: Session = Depends(get_db)):
+def get_player(player_id: UUID, db: Session = Depends(get_read_db)):
     return players.read_player_by_id(db, player_id)
 
+@router.get("/{player_id}/rating", response_model=PlayerRatingResponse)
+def get_player_rating(player_id: UUID,
+                      limit: int = Query(20, ge=1, le=100, description="limit the number of rating changes returned"),
+                      db: Session = Depends(get_read_db)):
+    return ratings.read_player_rating(db, player_id, limit)
+
+@router.get("/{player_id}/rank", response_model=LeaderboardEntry)
+def get_player_rank(player_id: UUID,
+                    sort: Literal["rating", "wins", "win_rate"] = Query("rating", description="rank players by rating, wins or win rate"),
+                    db: Session = Depends(get_read_db)):
+    return stats.read_player_rank(db, player_id, sort)
+
+@router.get("/{player_id}/stats", response_model=PlayerStatsResponse)
+def get_player_stats(player_id: UUID, db: Session = Depends(get_read_db)):
+    return stats.get_player_stats(db, player_id)
+
+@router.get("/{player_id}/stats/{opponent_id}", response_model=HeadToHeadResponse)
+def get_head_to_head(player_id: UUID, opponent_id: UUID, db: Session = Depends(get_read_db)):
+    return stats.get_head_to_head(db, player_id, opponent_id)
+
+@router.get("/{player_id}/vs/{opponent_id}", response_model=MatchupResponse)
+def get_matchup(player_id: UUID, opponent_id: UUID,
+                offset: int = Query(0, ge=0, description="offset the number of matches returned"),
+                limit: int = Query(10, ge=1, le=100, description="limit the number of matches returned"),
+                db: Session = Depends(get_read_db)):
+    total, page = matches.read_matches_between(db, player_id, opponent_id, offset, limit)
+    return {
+        "record": stats.get_head_to_head(db, player_id, opponent_id),
+        "total_matches": total,
+        "matches": page,
+    }
+
 
 @router.get("/", response_model=list[PlayerResponse])
-def get_all_players(db: Session = Depends(get_db), tournament_id: UUID | None = None):
+def get_all_players(db: Session = Depends(get_read_db), tournament_id: UUID | None = None):
     all_players = players.read_all_players(db, tournament_id)
-    return [player for player in all_players]  #PlayerResponse.model_validate
+    return list_response(PlayerResponse, all_players)
 
 
 @router.put("/{player_id}", response_model=PlayerResponse)
@@ -68,5 +115,5 @@ def connect_user_to_player(player_id: UUID, user_id: UUID, db: Session = Depends
     return players.update_player_with_user(db, player_id, user_id)
 
 @router.get("/{player_id}/{tournament_id}", response_model=ParticipantResponse)
-def get_player_in_tournament(player_id: UUID, tournament_id: UUID, db: Session = Depends(get_db)):
+def get_player_in_tournament(player_id: UUID, tournament_id: UUID, db: Session = Depends(get_read_db)):
     return players.read_player_by_id_and_tournament(db, player_id, tournament_id)
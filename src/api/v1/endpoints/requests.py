@@ -11,9 +11,10 @@ from src.core.auth import get_current_user
 
 from src.models.user import User
 from src.models.request import RequestType, RequestStatus, RequestAction
-from src.schemas.request import CreateRequest
+from src.schemas.request import CreateRequest, BatchRequestAction
 
-from src.crud.requests import view_requests, accept_request, reject_request, open_request, creating_request
+from src.crud.requests import (view_requests, accept_request, reject_request, open_request, creating_request,
+                               count_requests_by_status, moderate_requests)
 
 
 logger = logging.getLogger(__name__)
@@ -33,8 +34,21 @@ def create_request(request: CreateRequest,
 def view_requests_by_status(db: Session = Depends(get_db), current_user: User = Depends(get_current_user),
                             search: Optional[RequestStatus] = Query(RequestStatus.PENDING,
                                                                     alias='status',
-                                                                    description='Filter requests by status')):
-    return view_requests(db, current_user, search)
+                                                                    description='Filter requests by status'),
+                            offset: int = Query(0, ge=0, description='Number of requests to skip'),
+                            limit: int = Query(50, ge=1, le=200, description='Number of requests to return')):
+    return view_requests(db, current_user, search, offset, limit)
+
+
+@router.get("/counts")
+def view_request_counts(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    return count_requests_by_status(db, current_user)
+
+
+@router.post("/batch")
+def moderate_in_batch(batch: BatchRequestAction, db: Session = Depends(get_db),
+                      current_user: User = Depends(get_current_user)):
+    return moderate_requests(db, batch.request_ids, current_user, batch.action)
 
 
 @router.get("/{request_id}")
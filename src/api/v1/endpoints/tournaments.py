@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, Query, Path, HTTPException, status
+from fastapi import APIRouter, Depends, Query, Path, HTTPException, Response, status
 from src.schemas.tournament import (
     TournamentSchema,
     CreateTournamentResponse,
     Participant,
     UpdateTournamentRequest,
     UpdateTournamentResponse,
+    ScheduleRequest,
+    TournamentOut,
 )
 from psycopg2.errors import UniqueViolation
 from sqlalchemy.exc import IntegrityError
@@ -18,12 +20,15 @@ from src.common.custom_responses import (
     BadRequest,
 )
 from src.common import custom_exceptions
+from src.common.serialization import list_response
 from sqlalchemy.orm import Session
-from src.api.deps import get_db
+from src.api.deps import get_db, get_read_db, get_if_match, version_etag
 from src.crud import tournaments
 from uuid import UUID
 from src.core.auth import get_current_user
 from src.models.user import User, Role
+from src.models.match import Match
+from src.models.tournament import Tournament
 from typing import Literal
 
 import logging
@@ -34,7 +39,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.post("/", status_code=201)
+@router.post("/", status_code=201, response_model=CreateTournamentResponse)
 def create_tournament(
     tournament: TournamentSchema,
     db_session: Session = Depends(get_db),
@@ -76,45 +81,21 @@ def create_tournament(
                 )
         return InternalServerError(f"Database error: {str(e)}")
 
-    response = CreateTournamentResponse(
-        tournament_id=new_tournament.id,
-        name=new_tournament.name,
-        format=new_tournament.format.type,
-        match_format=new_tournament.match_format.type,
-        start_time=new_tournament.start_time,
-        end_time=new_tournament.end_time,
-        prize=new_tournament.prize,
-        win_points=new_tournament.win_points,
-        draw_points=new_tournament.draw_points,
-        author_id=new_tournament.author_id,
-        total_participants=len(new_tournament.participants),
-        participants=[],
-        total_matches=len(new_tournament.matches),
-        matches=[],
-    )
-    return response
+    return _tournament_response(new_tournament, participants=[], matches=[])
 
 
-@router.get("/{tournament_id}")
-def view_tournament(tournament_id: UUID, db_session: Session = Depends(get_db)):
+@router.get("/{tournament_id}", response_model=CreateTournamentResponse)
+def view_tournament(
+    tournament_id: UUID, response: Response, db_session: Session = Depends(get_read_db)
+):
 
     tournament = tournaments.get_tournament(db_session, tournament_id)
     if tournament is None:
         return NotFound(key="tournament_id", key_value=tournament_id)
+    response.headers["ETag"] = version_etag(tournament.version)
 
-    response = CreateTournamentResponse(
-        tournament_id=tournament.id,
-        name=tournament.name,
-        format=tournament.format.type,
-        match_format=tournament.match_format.type,
-        start_time=tournament.start_time,
-        end_time=tournament.end_time,
-        prize=tournament.prize,
-        win_points=tournament.win_points,
-        draw_points=tournament.draw_points,
-        author_id=tournament.author_id,
-        total_participants=len(tournament.participants),
-        total_matches=len(tournament.matches),
+    return _tournament_response(
+        tournament,
         participants=[
             {
                 "player_id": participant.id,
@@ -127,13 +108,55 @@ def view_tournament(tournament_id: UUID, db_session: Session = Depends(get_db)):
                 "match_id": match.id,
                 "match_name": tournaments.get_match_name(match),
             }
-            for match in tournament.matches
+            for match in tournament.bracket
         ],
     )
-    return response
 
 
-@router.get("/")
+def _tournament_response(
+    tournament: Tournament, participants: list[dict], matches: list[dict]
+) -> CreateTournamentResponse:
+    return CreateTournamentResponse(
+        tournament_id=tournament.id,
+        name=tournament.name,
+        format=tournament.format.type,
+        match_format=tournament.match_format.type,
+        start_time=tournament.start_time,
+        end_time=tournament.end_time,
+        prize=tournament.prize,
+        win_points=tournament.win_points,
+        draw_points=tournament.draw_points,
+        author_id=tournament.author_id,
+        total_participants=len(tournament.participants),
+        total_matches=len(tournament.matches),
+        participants=participants,
+        matches=matches,
+    )
+
+
+@router.get("/{tournament_id}/participants")
+def view_participants(
+    tournament_id: UUID,
+    offset: int = Query(
+        description="offset the number of participants returned", default=0, ge=0
+    ),
+    limit: int = Query(
+        description="limit the number of participants returned", default=50, ge=1, le=500
+    ),
+    sort: Literal["score", "name"] = Query(
+        description="sort by score (highest first) or by name", default="score"
+    ),
+    db_session: Session = Depends(get_read_db),
+):
+    participants = tournaments.read_participants(
+        db_session, tournament_id, offset=offset, limit=limit, sort=sort
+    )
+    if not participants and tournaments.get_tournament(db_session, tournament_id) is None:
+        return NotFound(key="tournament_id", key_value=tournament_id)
+    return participants
+
+
+@router.get("/", response_model=list[TournamentOut])
 def view_all_tournaments(
     offset: int = Query(
         description="offset the number of tournaments returned", default=0, ge=0
@@ -145,10 +168,13 @@ def view_all_tournaments(
         description="sort by start date", default=None
     ),
     search: str | None = Query(description="search by tournament name", default=None),
-    db_session: Session = Depends(get_db),
+    db_session: Session = Depends(get_read_db),
 ):
-    return tournaments.view_all_tournaments(
-        db_session, offset=offset, limit=limit, sort=sort, search=search
+    return list_response(
+        TournamentOut,
+        tournaments.view_all_tournaments(
+            db_session, offset=offset, limit=limit, sort=sort, search=search
+        ),
     )
 
 
@@ -210,6 +236,8 @@ def delete_players(
 def update_tournament(
     tournament_id: UUID,
     data: UpdateTournamentRequest,
+    response: Response,
+    expected_version: int | None = Depends(get_if_match),
     db_session: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -228,11 +256,14 @@ def update_tournament(
         return ForbiddenAccess()
 
     try:
-        tournament = tournaments.update_tournament(tournament_id, data, db_session)
+        tournament = tournaments.update_tournament(
+            tournament_id, data, db_session, expected_version=expected_version
+        )
     except custom_exceptions.InvalidRequest as e:
         return BadRequest(content=str(e))
 
-    response = UpdateTournamentResponse(
+    response.headers["ETag"] = version_etag(tournament.version)
+    return UpdateTournamentResponse(
         tournament_id=tournament.id,
         name=tournament.name,
         format=tournament.format.type,
@@ -240,7 +271,6 @@ def update_tournament(
         end_time=tournament.end_time,
         prize=tournament.prize,
     )
-    return response
 
 
 @router.put("/{tournament_id}/matches")
@@ -263,13 +293,88 @@ def create_matches(
         return ForbiddenAccess()
 
     try:
-        matches = tournaments.create_matches(tournament_id, db_session, current_user)
+        total_matches = tournaments.create_matches(tournament_id, db_session, current_user)
     except (
         custom_exceptions.InvalidNumberOfPlayers,
         custom_exceptions.InvalidRequest,
     ) as e:
         return BadRequest(content=str(e))
 
+    return {"tournament_id": tournament_id, "total_matches": total_matches}
+
+
+@router.put("/{tournament_id}/matches/next")
+def create_next_round(
+    tournament_id: UUID,
+    db_session: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    if current_user is None:
+        return Unauthorized(content="The user is not authorized to perform this action")
+
+    tournament = tournaments.get_tournament(
+        db_session,
+        tournament_id,
+    )
+    if tournament is None:
+        return NotFound(key="tournament_id", key_value=tournament_id)
+
+    if not tournaments.can_update_tournament(current_user, tournament):
+        return ForbiddenAccess()
+
+    try:
+        matches = tournaments.create_next_round(tournament_id, db_session, current_user)
+    except custom_exceptions.InvalidRequest as e:
+        return BadRequest(content=str(e))
+
+    return _list_matches(matches)
+
+
+@router.put("/{tournament_id}/schedule")
+def schedule_matches(
+    tournament_id: UUID,
+    schedule: ScheduleRequest,
+    db_session: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    if current_user is None:
+        return Unauthorized(content="The user is not authorized to perform this action")
+
+    tournament = tournaments.get_tournament(
+        db_session,
+        tournament_id,
+    )
+    if tournament is None:
+        return NotFound(key="tournament_id", key_value=tournament_id)
+
+    if not tournaments.can_update_tournament(current_user, tournament):
+        return ForbiddenAccess()
+
+    try:
+        matches = tournaments.schedule_matches(
+            tournament_id,
+            db_session,
+            slot_minutes=schedule.slot_minutes,
+            courts=schedule.courts,
+            rest_minutes=schedule.rest_minutes,
+        )
+    except custom_exceptions.InvalidRequest as e:
+        return BadRequest(content=str(e))
+
+    return [
+        {
+            "match_id": match.id,
+            "stage": match.stage,
+            "serial": match.serial_number,
+            "start_time": match.start_time,
+            "end_time": match.end_time,
+            "court": match.court,
+        }
+        for match in matches
+    ]
+
+
+def _list_matches(matches: list[Match]) -> list[dict]:
     return [
         {
             "match_id": match.id,
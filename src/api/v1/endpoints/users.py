@@ -10,12 +10,12 @@ from src.core.auth import get_current_user
 
 from src.models.user import User, Role
 from src.schemas.user import (CreateUserRequest, UpdateUserRequest, LoginRequest,
-                              UpdateEmailRequest)
+                              UpdateEmailRequest, DeleteUsersRequest)
 
 from src.crud.users import (get_all_users, create_user, login_user,
                             get_me, update_email,
                             update_user, get_by_username,
-                            get_by_email, delete_user)
+                            get_by_email, delete_user, delete_users)
 
 
 logger = logging.getLogger(__name__)
@@ -75,3 +75,9 @@ def delete_user_by_username(db: Session = Depends(get_db), current_user: User =
                             username: str = Query(None, min_length=3, max_length=50,
                             description="Delete user by username")):
     return delete_user(db, username, current_user)
+
+
+@router.delete("/batch")
+def delete_users_in_batch(users: DeleteUsersRequest, db: Session = Depends(get_db),
+                          current_user: User = Depends(get_current_user)):
+    return delete_users(db, users.usernames, current_user)
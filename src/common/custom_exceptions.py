@@ -20,12 +20,22 @@ class InvalidNumberOfPlayers(Exception):
         if tournament_format == "knockout":
             super().__init__(
                 f"Knockout tournament has {number_of_players} player(s). "
-                "The number of players must be a power of two."
+                "The number of players must be at least 2"
+            )
+        elif tournament_format == "groups":
+            super().__init__(
+                f"Groups tournament has {number_of_players} player(s). "
+                "Every group must have at least 3 players and more players than qualify from it"
+            )
+        elif tournament_format == "swiss":
+            super().__init__(
+                f"Swiss tournament has {number_of_players} player(s). "
+                "The number of players must be at least 2"
             )
         else:
             super().__init__(
                 f"League tournament has {number_of_players} player(s). "
-                "The number of players must be at least 4 and even"
+                "The number of players must be at least 3"
             )
 
 
@@ -35,6 +45,15 @@ class InvalidRequest(Exception):
     def __init__(self, error_messag: str):
         super().__init__(error_messag)
 
+
+class VersionConflict(Exception):
+    """Custom exception for changes based on an outdated version of a resource"""
+
+    def __init__(self, key: str, key_value: str):
+        self.key = key
+        self.key_value = key_value
+        super().__init__(f"{key} '{key_value}' was modified by another request.")
+
         
 class ScoreLimit(Exception):
     """Custom exception for errors with game points different from the score limit"""
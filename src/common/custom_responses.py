@@ -51,6 +51,11 @@ class AlreadyExists(JSONResponse):
         )
 
 
+class PreconditionFailed(JSONResponse):
+    def __init__(self, content=""):
+        super().__init__(status_code=412, content={"detail": content})
+
+
 class OK(JSONResponse):
     def __init__(self, content=""):
         super().__init__(status_code=200, content={"detail": content})
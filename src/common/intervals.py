@@ -0,0 +1,89 @@
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Any, Hashable
+
+
+class IntervalIndex:
+    """
+    Half-open time intervals grouped by key (e.g. a player or a court).
+
+    The intervals of a key are kept ordered by their start, together with a running
+    maximum of their ends (the furthest any interval started so far reaches). An interval
+    overlaps [start, end) exactly when it starts before `end` and reaches past `start`, so
+    a query is a binary search for `end` and one look at the running maximum, O(log n),
+    whether the stored intervals overlap each other or not.
+
+    The running maximum is rebuilt lazily from the first position changed by `add` or
+    `remove`, so intervals added in time order, as a scheduler does, keep it up to date
+    at no extra cost.
+    """
+
+    def __init__(self):
+        self._starts = defaultdict(list)
+        self._ends = defaultdict(list)
+        self._values = defaultdict(list)
+        # _reach[key][i] is the position of the interval with the furthest end among 0..i.
+        self._reach = defaultdict(list)
+
+    def add(self, key: Hashable, start: Any, end: Any, value: Any = None) -> None:
+        """
+        Add the interval [start, end) under `key`, carrying `value` (e.g. a match id).
+        """
+        starts = self._starts[key]
+        position = bisect_right(starts, start)
+        starts.insert(position, start)
+        self._ends[key].insert(position, end)
+        self._values[key].insert(position, value)
+        del self._reach[key][position:]
+
+    def remove(self, key: Hashable, start: Any, value: Any = None) -> bool:
+        """
+        Remove the interval of `key` starting at `start` and carrying `value`.
+
+        Returns:
+            bool: True if the interval was found and removed.
+        """
+        starts = self._starts.get(key, [])
+        position = bisect_left(starts, start)
+        while position < len(starts) and starts[position] == start:
+            if self._values[key][position] == value:
+                del starts[position]
+                del self._ends[key][position]
+                del self._values[key][position]
+                del self._reach[key][position:]
+                return True
+            position += 1
+        return False
+
+    def overlapping(self, key: Hashable, start: Any, end: Any) -> tuple[Any, Any, Any] | None:
+        """
+        Find an interval of `key` overlapping [start, end).
+
+        Returns:
+            tuple | None: The (start, end, value) of the overlapping interval, or None.
+        """
+        starts = self._starts.get(key)
+        if not starts:
+            return None
+
+        position = bisect_left(starts, end) - 1
+        if position < 0:
+            return None
+        furthest = self._furthest(key, position)
+        if self._ends[key][furthest] > start:
+            return starts[furthest], self._ends[key][furthest], self._values[key][furthest]
+        return None
+
+    def _furthest(self, key: Hashable, position: int) -> int:
+        """
+        Return the position of the interval reaching furthest among the first `position` + 1.
+        """
+        ends = self._ends[key]
+        reach = self._reach[key]
+        while len(reach) <= position:
+            current = len(reach)
+            if current and ends[reach[-1]] >= ends[current]:
+                reach.append(reach[-1])
+            else:
+                reach.append(current)
+        return reach[position]
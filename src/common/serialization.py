@@ -0,0 +1,53 @@
+from functools import cache
+from typing import Any, Iterable
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+
+class JSONBytesResponse(Response):
+    """
+    Response whose body is already serialized to JSON.
+    """
+    media_type = "application/json"
+
+
+@cache
+def list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    """
+    The adapter validating and serializing a list of `model`, built once per model.
+    """
+    return TypeAdapter(list[model])
+
+
+def list_response(model: type[BaseModel], objects: Iterable[Any]) -> JSONBytesResponse:
+    """
+    Serializes ORM objects as a list of `model` straight to JSON bytes, without going
+    through `jsonable_encoder` and FastAPI's per-request response validation.
+
+    Args:
+        model (type[BaseModel]): The schema of one item of the list.
+        objects (Iterable[Any]): The objects to serialize, read through their attributes.
+
+    Returns:
+        JSONBytesResponse: The serialized list.
+    """
+    adapter = list_adapter(model)
+    return JSONBytesResponse(adapter.dump_json(adapter.validate_python(objects, from_attributes=True)))
+
+
+def rows_response(rows: list[dict]) -> JSONBytesResponse:
+    """
+    Serializes rows read from the database straight to JSON bytes, skipping validation.
+
+    Only for rows selected with the columns of the response schema: their values are
+    already of the right types, UUIDs and datetimes are serialized by orjson.
+
+    Args:
+        rows (list[dict]): The rows, as dicts of column name to value.
+
+    Returns:
+        JSONBytesResponse: The serialized rows.
+    """
+    return JSONBytesResponse(orjson.dumps(rows))
@@ -23,6 +23,14 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = os.getenv("JWT_ALGORITHM", "HS256")
     JWT_EXPIRATION: int = int(os.getenv("JWT_EXPIRATION", 3600))
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///:memory:")
+    # Comma separated URLs of read replicas of DATABASE_URL, e.g. "postgresql://replica1/db,postgresql://replica2/db"
+    DATABASE_REPLICA_URLS: str = os.getenv("DATABASE_REPLICA_URLS", "")
+    # After a client writes, its reads go to the primary for this many seconds (read-your-writes)
+    READ_YOUR_WRITES_SECONDS: int = int(os.getenv("READ_YOUR_WRITES_SECONDS", 5))
+
+    @property
+    def replica_urls(self) -> list[str]:
+        return [url.strip() for url in self.DATABASE_REPLICA_URLS.split(",") if url.strip()]
 
     class Config:
         case_sensitive = True
@@ -3,11 +3,17 @@ from src.models.match import Match, MatchFormat, ResultCodes
 from src.models.player import Player
 from src.models.user import User
 from src.models.tournament import Tournament, TournamentParticipants
-from src.crud.tournaments import get_tournament
-from datetime import timedelta
+from src.crud.tournaments import get_tournament, create_next_knockout_match, read_busy_matches
+from src.crud.ratings import rate_match
+from datetime import datetime, timedelta
+from src.common.custom_exceptions import VersionConflict
+from src.common.intervals import IntervalIndex
 from uuid import UUID
 from fastapi import HTTPException, status
-from src.schemas.match import CreateMatchRequest, MatchUpdateTime, MatchResult
+from src.schemas.match import CreateMatchRequest, MatchOut, MatchUpdateTime, MatchResult, MatchScoreEntry
+
+# The columns of `MatchOut`, so match rows can be returned without building Match objects.
+MATCH_OUT_COLUMNS = tuple(getattr(Match, name) for name in MatchOut.model_fields)
 
 def match_format_to_id(value: str, db_session: Session):
     """
@@ -106,19 +112,22 @@ def read_match_by_id(db: Session, match_id: UUID) -> Match:
     return match
 
 
-def read_all_matches(db: Session, tournament_id: UUID = None, sort_by_date: bool = False):
+def read_all_matches(db: Session, tournament_id: UUID = None, sort_by_date: bool = False) -> list[dict]:
     """
     Retrieves all matches, optionally filtered by tournament ID or sorted by date.
 
+    Only the columns of `MatchOut` are selected and the rows are returned as dicts, so
+    the list can be serialized without loading or validating Match objects.
+
     Args:
         db (Session): The database session.
         tournament_id (UUID, optional): The ID of the tournament to filter matches. Defaults to None.
         sort_by_date (bool, optional): Whether to sort matches by start date. Defaults to False.
 
     Returns:
-        list: A list of all matches matching the criteria.
+        list[dict]: A list of all matches matching the criteria.
     """
-    query = db.query(Match)
+    query = db.query(*MATCH_OUT_COLUMNS)
 
     if tournament_id is not None:
         query = query.filter(Match.tournament_id == tournament_id)
@@ -126,7 +135,7 @@ def read_all_matches(db: Session, tournament_id: UUID = None, sort_by_date: bool
     if sort_by_date:
         query = query.order_by(Match.start_time)
 
-    matches = query.all()
+    matches = [dict(row._mapping) for row in query.all()]
 
     if not matches:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No Matches")
@@ -135,6 +144,33 @@ def read_all_matches(db: Session, tournament_id: UUID = None, sort_by_date: bool
 
 
 
+def read_matches_between(db: Session, player_id: UUID, opponent_id: UUID, offset: int = 0, limit: int = 10) -> tuple[int, list[Match]]:
+    """
+    Retrieves the matches two players played against each other, newest first.
+
+    The players are looked up as an ordered pair, (least, greatest) of the two ids, which
+    is served by the `ix_matches_player_pair` index whichever side each player was on.
+
+    Args:
+        db (Session): The database session.
+        player_id (UUID): The unique identifier of the first player.
+        opponent_id (UUID): The unique identifier of the second player.
+        offset (int): How many matches to skip.
+        limit (int): How many matches to return.
+
+    Returns:
+        tuple[int, list[Match]]: The total number of matches between the players and the requested page.
+    """
+    if player_id == opponent_id:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="A player can't play against themselves")
+
+    low, high = Match.player_pair()
+    query = db.query(Match).filter(low == min(player_id, opponent_id), high == max(player_id, opponent_id))
+    total = query.count()
+    matches = query.order_by(Match.start_time.desc(), Match.id.desc()).offset(offset).limit(limit).all()
+    return total, matches
+
+
 def check_score_limit(end_condition, score_a, score_b):
     """
     Validates that the match score does not exceed the end condition.
@@ -155,7 +191,58 @@ def check_score_limit(end_condition, score_a, score_b):
     if score_a > end_condition or score_b > end_condition or (score_a == end_condition and score_b == end_condition) or (score_a != end_condition and score_b != end_condition):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="One and only one score must be as the end condition")
 
-def update_match_score(match_id: UUID, updates: MatchResult, db: Session, current_user: User):
+def validate_match_result(match: Match, updates: MatchResult, current_user: User):
+    """
+    Validates a match result against the match and the user submitting it.
+
+    Args:
+        match (Match): The match the result is for.
+        updates (MatchResult): The submitted match result.
+        current_user (User): The current authenticated user.
+
+    Raises:
+        HTTPException: If the user can't update the match, the result doesn't match the scores
+            or the scores don't adhere to the end condition.
+    """
+    if match.author_id != current_user.id and current_user.role !='ADMIN':
+         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Current user can't update this match")
+    if (updates.score_a > updates.score_b and (updates.result_code == 'player 2' or updates.result_code == 'draw')) or (updates.score_a < updates.score_b and (updates.result_code == 'player 1' or updates.result_code == 'draw')) or (updates.score_a == updates.score_b and (updates.result_code == 'player 1' or updates.result_code == 'player 2')):
+        raise HTTPException(status_code=status.HTTP_406_NOT_ACCEPTABLE, detail="Invalid result")
+    if match.format_id == 1:
+        check_score_limit(match.end_condition, updates.score_a, updates.score_b)
+
+def check_match_version(match: Match, expected_version: int | None):
+    """
+    Checks that a match hasn't changed since the version the client based its update on.
+
+    Args:
+        match (Match): The match to update.
+        expected_version (int | None): The version sent by the client, if any.
+
+    Raises:
+        VersionConflict: If the match has a different version.
+    """
+    if expected_version is not None and match.version != expected_version:
+        raise VersionConflict(key="match", key_value=match.id)
+
+
+def commit_versioned_match(db: Session, match: Match):
+    """
+    Commits the changes of a match, failing fast if a concurrent request committed first.
+
+    Args:
+        db (Session): The database session.
+        match (Match): The updated match.
+
+    Raises:
+        StaleDataError: If the stored version of the match no longer matches the loaded one,
+                        answered with 412 by the app's version conflict handler.
+    """
+    db.commit()
+    db.refresh(match)
+
+
+def update_match_score(match_id: UUID, updates: MatchResult, db: Session, current_user: User, expected_version: int | None = None):
     """
     Updates the score of a match.
 
@@ -164,6 +251,7 @@ def update_match_score(match_id: UUID, updates: MatchResult, db: Session, curren
         updates (MatchResult): The updated match result data.
         db (Session): The database session.
         current_user (User): The current authenticated user.
+        expected_version (int | None): The version of the match the update is based on, if known.
 
     Returns:
         Match: The updated match.
@@ -171,13 +259,10 @@ def update_match_score(match_id: UUID, updates: MatchResult, db: Session, curren
     match = db.query(Match).filter(Match.id == match_id).first()
     if not match:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Match not found")
-    if match.author_id != current_user.id and current_user.role !='ADMIN':
-         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Current user can't update this match")
-    if (updates.score_a > updates.score_b and (updates.result_code == 'player 2' or updates.result_code == 'draw')) or (updates.score_a < updates.score_b and (updates.result_code == 'player 1' or updates.result_code == 'draw')) or (updates.score_a == updates.score_b and (updates.result_code == 'player 1' or updates.result_code == 'player 2')):
-        raise HTTPException(status_code=status.HTTP_406_NOT_ACCEPTABLE, detail="Invalid result")
-    if match.format_id == 1:
-        check_score_limit(match.end_condition, updates.score_a, updates.score_b)
-
+    check_match_version(match, expected_version)
+    if match.finalized_at is not None:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Match is already finalized")
+    validate_match_result(match, updates, current_user)
         
     match.score_a = updates.score_a
     match.score_b = updates.score_b
@@ -185,12 +270,190 @@ def update_match_score(match_id: UUID, updates: MatchResult, db: Session, curren
     match.result_code = result_id
     
     db.add(match)
+    commit_versioned_match(db, match)
+    
+    return match
+
+def update_match_scores(db: Session, results: list[MatchScoreEntry], current_user: User) -> dict[str, str]:
+    """
+    Updates the scores of many matches and applies them to the players statistics.
+
+    The matches, players, tournaments, tournament participants and result codes are loaded
+    with one query each, every entry is validated with the same rules as `update_match_score`
+    and all valid entries are applied in a single transaction. Finalized matches, and repeated
+    entries, are not applied again, so the statistics are never counted twice. A match scored
+    with `update_match_score` but not finalized yet is finalized with the submitted score.
+
+    The matches, then the players, then the tournament participants are locked for update in
+    id order, like in `finalize_match`, so concurrent submissions sharing matches or players
+    wait for each other instead of deadlocking or overwriting each other's statistics.
+
+    Args:
+        db (Session): The database session.
+        results (list[MatchScoreEntry]): The match results to apply.
+        current_user (User): The current authenticated user.
+
+    Returns:
+        dict[str, str]: The status of every submitted match, keyed by match id.
+    """
+    matches = {
+        match.id: match
+        for match in db.query(Match)
+        .filter(Match.id.in_([entry.match_id for entry in results]))
+        .order_by(Match.id)
+        .with_for_update()
+        .all()
+    }
+    players_ids = {
+        player_id
+        for match in matches.values()
+        for player_id in (match.player_a_id, match.player_b_id)
+        if player_id is not None
+    }
+    tournaments_ids = {match.tournament_id for match in matches.values() if match.tournament_id}
+    players = {
+        player.id: player
+        for player in db.query(Player)
+        .filter(Player.id.in_(players_ids))
+        .order_by(Player.id)
+        .with_for_update()
+        .all()
+    }
+    tournaments = {
+        tournament.id: tournament
+        for tournament in db.query(Tournament).filter(Tournament.id.in_(tournaments_ids)).all()
+    }
+    participants = {
+        (participant.tournament_id, participant.player_id): participant
+        for participant in db.query(TournamentParticipants)
+        .filter(
+            TournamentParticipants.tournament_id.in_(tournaments_ids),
+            TournamentParticipants.player_id.in_(players_ids),
+        )
+        .order_by(TournamentParticipants.tournament_id, TournamentParticipants.player_id)
+        .with_for_update()
+        .all()
+    }
+    result_codes = {code.result: code.id for code in db.query(ResultCodes).all()}
+
+    statuses = {}
+    for entry in results:
+        if str(entry.match_id) in statuses:
+            continue
+        match = matches.get(entry.match_id)
+        if match is None:
+            statuses[str(entry.match_id)] = "Match not found"
+            continue
+        if match.finalized_at is not None:
+            statuses[str(entry.match_id)] = "Match is already finalized"
+            continue
+        player_1 = players.get(match.player_a_id)
+        player_2 = players.get(match.player_b_id)
+        if player_1 is None or player_2 is None:
+            statuses[str(entry.match_id)] = "Match players are not set"
+            continue
+        try:
+            validate_match_result(match, entry, current_user)
+        except HTTPException as e:
+            statuses[str(entry.match_id)] = e.detail
+            continue
+        except ValueError as e:
+            statuses[str(entry.match_id)] = str(e)
+            continue
+
+        match.score_a = entry.score_a
+        match.score_b = entry.score_b
+        match.result_code = result_codes[entry.result_code]
+        apply_match_stats(
+            db,
+            match,
+            player_1,
+            player_2,
+            tournaments.get(match.tournament_id),
+            participants.get((match.tournament_id, player_1.id)),
+            participants.get((match.tournament_id, player_2.id)),
+        )
+        match.finalized_at = datetime.now()
+        statuses[str(entry.match_id)] = "Updated"
+
+    db.commit()
+    return statuses
+
+def finalize_match(db: Session, match_id: UUID, updates: MatchResult, current_user: User) -> Match:
+    """
+    Records the result of a match and applies it in one transaction.
+
+    The match row is locked (`SELECT ... FOR UPDATE`), so concurrent submissions for the
+    same match are serialized and only the first one is applied. The players, then their
+    tournament participants, are locked next, in id order. The score and result are
+    validated like in `update_match_score`, then the players statistics, the tournament
+    standings and the bracket are updated and everything is committed at once.
+
+    Args:
+        db (Session): The database session.
+        match_id (UUID): The unique identifier of the match.
+        updates (MatchResult): The match result.
+        current_user (User): The current authenticated user.
+
+    Returns:
+        Match: The finalized match.
+    """
+    match = db.query(Match).filter(Match.id == match_id).with_for_update().first()
+    if not match:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Match not found")
+    if match.finalized_at is not None:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Match is already finalized")
+    validate_match_result(match, updates, current_user)
+
+    players = {
+        player.id: player
+        for player in db.query(Player)
+        .filter(Player.id.in_([match.player_a_id, match.player_b_id]))
+        .order_by(Player.id)
+        .with_for_update()
+        .all()
+    }
+    player_1 = players.get(match.player_a_id)
+    player_2 = players.get(match.player_b_id)
+    if not player_1 or not player_2:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Match players are not set")
+
+    tournament = None
+    participants = {}
+    if match.tournament_id:
+        tournament = db.query(Tournament).filter(Tournament.id == match.tournament_id).first()
+        participants = {
+            participant.player_id: participant
+            for participant in db.query(TournamentParticipants)
+            .filter(
+                TournamentParticipants.tournament_id == match.tournament_id,
+                TournamentParticipants.player_id.in_([player_1.id, player_2.id]),
+            )
+            .order_by(TournamentParticipants.player_id)
+            .with_for_update()
+            .all()
+        }
+
+    match.score_a = updates.score_a
+    match.score_b = updates.score_b
+    match.result_code = match_result_to_id(updates.result_code, db)
+    apply_match_stats(
+        db,
+        match,
+        player_1,
+        player_2,
+        tournament,
+        participants.get(player_1.id),
+        participants.get(player_2.id),
+    )
+    match.finalized_at = datetime.now()
+
     db.commit()
     db.refresh(match)
-    
+
     return match
 
-def update_match_date(db: Session, match_id: UUID, updates: MatchUpdateTime, current_user: User):
+def update_match_date(db: Session, match_id: UUID, updates: MatchUpdateTime, current_user: User, expected_version: int | None = None):
     """
     Updates the datetime of a match.
 
@@ -199,6 +462,7 @@ def update_match_date(db: Session, match_id: UUID, updates: MatchUpdateTime, cur
         updates (MatchResult): The updated match result data.
         db (Session): The database session.
         current_user (User): The current authenticated user.
+        expected_version (int | None): The version of the match the update is based on, if known.
 
     Returns:
         Match: The updated match.
@@ -206,25 +470,102 @@ def update_match_date(db: Session, match_id: UUID, updates: MatchUpdateTime, cur
     match = db.query(Match).filter(Match.id == match_id).first()
     if not match:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Match not found")
+    check_match_version(match, expected_version)
     if match.author_id != current_user.id and current_user.role !='ADMIN':
          raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Current user can't update this match")
-    if match.start_time > updates.start_time:
+    if match.start_time and match.start_time > updates.start_time:
         raise HTTPException(status_code=status.HTTP_406_NOT_ACCEPTABLE, detail="Start time can't be before the original time")
     
     if match.format_id == 0:
-        match.start_time = updates.start_time
-        match.end_time = updates.start_time + timedelta(minutes=match.end_condition)
+        end_time = updates.start_time + timedelta(minutes=match.end_condition)
     else:
-        match.start_time = updates.start_time
-        match.end_time = updates.end_time
+        end_time = updates.end_time
+    court = check_schedule_conflicts(db, match, updates.start_time, end_time or updates.start_time)
+
+    match.start_time = updates.start_time
+    match.end_time = end_time
+    match.court = court
     
     db.add(match)
-    db.commit()
-    db.refresh(match)
+    commit_versioned_match(db, match)
     
     return match
 
 
+def check_schedule_conflicts(db: Session, match: Match, start_time: datetime, end_time: datetime) -> int | None:
+    """
+    Checks that a match can be moved to the given times, with the rules of `schedule_matches`.
+
+    The players must be free, in any tournament, and rest the `rest_minutes` of the tournament
+    between their matches. The court of the match must be free; a match of a tournament
+    scheduled on `courts` courts without a court is given a free one. Matches without a
+    court take up court capacity too. Only the matches around the new times are read, and
+    every player and court is then checked in an `IntervalIndex`, in O(log n).
+
+    Args:
+        db (Session): The database session.
+        match (Match): The match being moved.
+        start_time (datetime): The new start time of the match.
+        end_time (datetime): The new end time of the match.
+
+    Returns:
+        int | None: The court of the match at the new times.
+
+    Raises:
+        HTTPException: 409 if a player or the court is already busy.
+    """
+    tournament = match.tournament if match.tournament_id else None
+    rest = timedelta(minutes=tournament.rest_minutes or 0) if tournament else timedelta(0)
+    courts = tournament.courts if tournament else None
+    players = [player_id for player_id in (match.player_a_id, match.player_b_id) if player_id]
+
+    others = read_busy_matches(
+        db,
+        players,
+        start_time,
+        end_time,
+        rest,
+        tournament_id=match.tournament_id,
+        exclude_match_id=match.id,
+    )
+
+    busy = IntervalIndex()
+    without_court = 0
+    for other in others:
+        other_end = other.end_time or other.start_time
+        for player_id in (other.player_a_id, other.player_b_id):
+            if player_id in players:
+                busy.add(player_id, other.start_time, other_end, other.id)
+        if match.tournament_id and other.tournament_id == match.tournament_id:
+            if other.court is not None:
+                busy.add(("court", other.court), other.start_time, other_end, other.id)
+            elif other.start_time < end_time and other_end > start_time:
+                without_court += 1
+
+    def court_is_free(number: int) -> bool:
+        return busy.overlapping(("court", number), start_time, end_time) is None
+
+    conflict = any(
+        busy.overlapping(player_id, start_time - rest, end_time + rest) for player_id in players
+    )
+    court = match.court
+    if court is None and courts:
+        court = next((number for number in range(1, courts + 1) if court_is_free(number)), None)
+        conflict = conflict or court is None
+    elif court is not None:
+        conflict = conflict or not court_is_free(court)
+    if courts:
+        taken = sum(1 for number in range(1, courts + 1) if not court_is_free(number))
+        conflict = conflict or taken + without_court >= courts
+
+    if conflict:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A player or the court of the match is busy at that time",
+        )
+    return court
+
+
 def delete_match(db: Session, match_id: UUID, current_user: User) -> bool:
     """
     Deletes a match by its ID.
@@ -258,7 +599,7 @@ def update_player_stats_after_match(db: Session, match_id: UUID, current_user: U
     Returns:
         Message for succsessfuly updated stats
     """
-    match = db.query(Match).filter_by(id=match_id).first()
+    match = db.query(Match).filter_by(id=match_id).with_for_update().first()
 
     if  match is None:
         raise HTTPException(
@@ -267,43 +608,127 @@ def update_player_stats_after_match(db: Session, match_id: UUID, current_user: U
     
     if match.author_id != current_user.id and current_user.role !='ADMIN':
          raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Current user can't update this match")
-
-    player_1 = db.query(Player).filter_by(id=match.player_a_id).first()
+    if match.result_code is None:
+        raise HTTPException(status_code=status.HTTP_406_NOT_ACCEPTABLE, detail="Match doesn't have a result yet")
+    if match.finalized_at is not None:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Match is already finalized")
+
+    players = {
+        player.id: player
+        for player in db.query(Player)
+        .filter(Player.id.in_([match.player_a_id, match.player_b_id]))
+        .order_by(Player.id)
+        .with_for_update()
+        .all()
+    }
+    player_1 = players.get(match.player_a_id)
 
     if not player_1:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="First player not found"
         )
     
-    player_2 = db.query(Player).filter_by(id=match.player_b_id).first()
+    player_2 = players.get(match.player_b_id)
 
     if not player_2:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Second player not found"
         )
     
-    player_1.matches_played += 1
-    player_2.matches_played += 1 
-
+    tournament = participant_1 = participant_2 = None
     if match.tournament_id:
         tournament = db.query(Tournament).filter_by(id=match.tournament_id).first()
-        participant_1 = db.query(TournamentParticipants).filter_by(tournament_id=match.tournament_id , player_id=player_1.id).first()
-        participant_2 = db.query(TournamentParticipants).filter_by(tournament_id=match.tournament_id , player_id=player_2.id).first()
-        next_match = db.query(Match).filter_by(serial_number = match.serial_number // 2).first()
+        participants = {
+            participant.player_id: participant
+            for participant in db.query(TournamentParticipants)
+            .filter(
+                TournamentParticipants.tournament_id == match.tournament_id,
+                TournamentParticipants.player_id.in_([player_1.id, player_2.id]),
+            )
+            .order_by(TournamentParticipants.player_id)
+            .with_for_update()
+            .all()
+        }
+        participant_1 = participants.get(player_1.id)
+        participant_2 = participants.get(player_2.id)
+
+    apply_match_stats(db, match, player_1, player_2, tournament, participant_1, participant_2)
+    match.finalized_at = datetime.now()
+
+    db.commit()
+    for player in [player_1, player_2]:
+        db.refresh(player)
+    
+    return {"detail": "Player statistics updated successfully"}
+
+def advance_knockout_winner(db: Session, match: Match, winner: TournamentParticipants):
+    """
+    Moves the winner of a knockout match into the match it advances to.
+
+    The winner of an even serial number takes the first slot of the next match
+    and the winner of an odd one the second slot. Nothing is done for the final.
+    In a lazy bracket the next match may not exist yet; it is created once both
+    matches feeding it are decided.
+
+    Args:
+        db (Session): The database session.
+        match (Match): The decided knockout match.
+        winner (TournamentParticipants): The tournament participant who won the match.
+    """
+    winner.stage = str(match.stage + 1)
+    if match.next_match_id is None:
+        if match.tournament.lazy_bracket:
+            create_next_knockout_match(db, match.tournament, match)
+        return
+
+    next_match = db.query(Match).filter_by(id=match.next_match_id).first()
+    if match.serial_number % 2 == 0:
+        next_match.player_a_id = winner.player_id
+    else:
+        next_match.player_b_id = winner.player_id
+
+
+def apply_match_stats(
+    db: Session,
+    match: Match,
+    player_1: Player,
+    player_2: Player,
+    tournament: Tournament | None = None,
+    participant_1: TournamentParticipants | None = None,
+    participant_2: TournamentParticipants | None = None,
+):
+    """
+    Applies the result of a match to the players statistics and ratings and, for a
+    tournament match, to the tournament standings or bracket. Nothing is committed.
 
-        if tournament.format_id == 1:
+    The counters and ratings are read, changed and written back, so the caller must hold
+    the locks of the match, then of the players and participants in id order.
+
+    Args:
+        db (Session): The database session.
+        match (Match): The decided match.
+        player_1 (Player): The first player of the match.
+        player_2 (Player): The second player of the match.
+        tournament (Tournament | None): The tournament of the match, if any.
+        participant_1 (TournamentParticipants | None): The first player in the tournament.
+        participant_2 (TournamentParticipants | None): The second player in the tournament.
+    """
+    player_1.matches_played += 1
+    player_2.matches_played += 1 
+    rate_match(db, match, player_1, player_2)
+
+    if tournament is not None:
+        if tournament.format.type in ("league", "swiss") or match.group_number is not None:
 
             if match.result_code == 1:
                 player_1.wins += 1
                 player_2.losses += 1
                 participant_1.score += tournament.win_points
-                participant_1.stage += 1
 
             elif match.result_code == 2:
                 player_1.losses += 1
                 player_2.wins += 1
                 participant_2.score += tournament.win_points
-                participant_2.stage += 1
 
             else:
                 player_1.draws += 1
@@ -315,20 +740,12 @@ def update_player_stats_after_match(db: Session, match_id: UUID, current_user: U
             if match.result_code == 1:
                 player_1.wins += 1
                 player_2.losses += 1
-                participant_1.stage += 1
-                if not next_match.player_a:
-                    next_match.player_a = player_1.id
-                else:
-                    next_match.player_b = player_1.id
+                advance_knockout_winner(db, match, participant_1)
 
             elif match.result_code == 2:
                 player_1.losses += 1
                 player_2.wins += 1
-                participant_2.stage += 1
-                if not next_match.player_a:
-                    next_match.player_a = player_2.id
-                else:
-                    next_match.player_b = player_2.id
+                advance_knockout_winner(db, match, participant_2)
 
             else:
                 player_1.draws += 1
@@ -346,9 +763,3 @@ def update_player_stats_after_match(db: Session, match_id: UUID, current_user: U
         else:
             player_1.draws += 1
             player_2.draws += 1
-
-    db.commit()
-    for player in [player_1, player_2]:
-        db.refresh(player)
-    
-    return {"detail": "Player statistics updated successfully"}
\ No newline at end of file
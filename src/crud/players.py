@@ -1,5 +1,8 @@
 from sqlalchemy.orm import Session
+from collections import OrderedDict
+from threading import Lock
 from uuid import UUID
+import time
 from fastapi import HTTPException, status
 from src.models.player import Player
 from src.models.user import User
@@ -8,6 +11,13 @@ from src.models.tournament import TournamentParticipants
 from src.schemas.player import CreatePlayerRequest, PlayerUpdate
 
 
+SEARCH_CACHE_SIZE = 512
+SEARCH_CACHE_TTL = 30
+
+_search_cache: OrderedDict[tuple[str, int], tuple[float, list[dict]]] = OrderedDict()
+_search_cache_lock = Lock()
+
+
 def create_player(db: Session, request: CreatePlayerRequest):
     """Create a new player in the database.
     
@@ -22,6 +32,7 @@ def create_player(db: Session, request: CreatePlayerRequest):
     db.add(new_player)
     db.commit()
     db.refresh(new_player)
+    clear_search_cache()
     return new_player
 
 
@@ -87,6 +98,55 @@ def read_all_players(db: Session, tournament_id: UUID | None = None):
     return query.all()
 
 
+def search_players(db: Session, query: str, limit: int = 10) -> list[dict]:
+    """Find players whose full name starts with the given text, for typeahead suggestions.
+
+    The lookup is a prefix match on the indexed `name_key` column. Results for a
+    prefix are kept in a small in-process LRU cache for `SEARCH_CACHE_TTL` seconds.
+
+    Args:
+        db (Session): The database session.
+        query (str): The beginning of the player's full name.
+        limit (int): The maximum number of suggestions to return.
+
+    Returns:
+        list[dict]: The matching players' id, first name, last name and country, ordered by name.
+    """
+    prefix = " ".join(query.split()).casefold()
+    cache_key = (prefix, limit)
+    now = time.monotonic()
+
+    with _search_cache_lock:
+        cached = _search_cache.get(cache_key)
+        if cached and now - cached[0] < SEARCH_CACHE_TTL:
+            _search_cache.move_to_end(cache_key)
+            return cached[1]
+
+    pattern = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+    rows = (
+        db.query(Player.id, Player.first_name, Player.last_name, Player.country)
+        .filter(Player.name_key.like(pattern, escape="\\"))
+        .order_by(Player.name_key)
+        .limit(limit)
+        .all()
+    )
+    players = [dict(row._mapping) for row in rows]
+
+    with _search_cache_lock:
+        _search_cache[cache_key] = (now, players)
+        _search_cache.move_to_end(cache_key)
+        while len(_search_cache) > SEARCH_CACHE_SIZE:
+            _search_cache.popitem(last=False)
+
+    return players
+
+
+def clear_search_cache():
+    """Drop all cached typeahead suggestions after players were added, renamed or removed."""
+    with _search_cache_lock:
+        _search_cache.clear()
+
+
 def update_player(db: Session, player_id: UUID, updates: PlayerUpdate, current_user: User) -> Player:
     """Update an existing player's information.
     
@@ -115,6 +175,7 @@ def update_player(db: Session, player_id: UUID, updates: PlayerUpdate, current_u
         setattr(player, key, value)
     db.commit()
     db.refresh(player)
+    clear_search_cache()
 
     return player
 
@@ -144,6 +205,7 @@ def delete_player(db: Session, player_id: UUID, current_user: User):
                 )
     db.delete(player)
     db.commit()
+    clear_search_cache()
     return True
 
 def update_player_with_user(db: Session, player_id: UUID, user_id: UUID):
@@ -219,20 +281,4 @@ def read_player_by_id_and_tournament(db: Session, player_id: UUID, tournament_id
             detail="Player not found in the specified tournament"
         )
     
-    player_data = {
-        "id": player.id,
-        "first_name": player.first_name,
-        "last_name": player.last_name,
-        "country": player.country,
-        "team_id": player.team_id,
-        "matches_played": player.matches_played,
-        "wins": player.wins,
-        "losses": player.losses,
-        "draws": player.draws,
-        "user_id": player.user_id,
-        "tournament_id": player.tournament_id,
-        "score": player.score,
-        "stage": player.stage
-    }
-    
-    return player_data
\ No newline at end of file
+    return dict(player._mapping)
\ No newline at end of file
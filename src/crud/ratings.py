@@ -0,0 +1,144 @@
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from src.crud.stats import PLAYER_1_WINS, PLAYER_2_WINS, finalized_matches, get_projection_state, refresh_ranks
+from src.models.match import Match
+from src.models.player import INITIAL_RATING, Player
+from src.models.rating import RatingHistory
+
+K_FACTOR = 32.0
+BATCH_SIZE = 10000
+
+
+def expected_score(rating: float, opponent_rating: float) -> float:
+    """
+    The score a player is expected to get against an opponent, between 0 and 1.
+    """
+    return 1.0 / (1.0 + 10.0 ** ((opponent_rating - rating) / 400.0))
+
+
+def elo_ratings(rating_a: float, rating_b: float, result_code: int, k_factor: float = K_FACTOR) -> tuple[float, float]:
+    """
+    Calculates the Elo ratings of two players after a match between them.
+
+    Args:
+        rating_a (float): The rating of player A before the match.
+        rating_b (float): The rating of player B before the match.
+        result_code (int): The result code of the match.
+        k_factor (float): The maximum rating change of a single match.
+
+    Returns:
+        tuple[float, float]: The ratings of player A and player B after the match.
+    """
+    if result_code == PLAYER_1_WINS:
+        score_a = 1.0
+    elif result_code == PLAYER_2_WINS:
+        score_a = 0.0
+    else:
+        score_a = 0.5
+    change = k_factor * (score_a - expected_score(rating_a, rating_b))
+    return rating_a + change, rating_b - change
+
+
+def rate_match(db_session: Session, match: Match, player_1: Player, player_2: Player):
+    """
+    Updates the ratings of the players of a finalized match and records them in the
+    rating history. Nothing is committed. The players must be locked for update, like
+    `apply_match_stats` callers do, or a concurrent result overwrites the new ratings.
+
+    Args:
+        db_session (Session): The database session.
+        match (Match): The decided match.
+        player_1 (Player): The first player of the match.
+        player_2 (Player): The second player of the match.
+    """
+    rating_1 = player_1.rating if player_1.rating is not None else INITIAL_RATING
+    rating_2 = player_2.rating if player_2.rating is not None else INITIAL_RATING
+    player_1.rating, player_2.rating = elo_ratings(rating_1, rating_2, match.result_code)
+
+    rated_at = match.finalized_at or datetime.now()
+    db_session.add_all([
+        RatingHistory(player_id=player_1.id, match_id=match.id, rating_before=rating_1, rating_after=player_1.rating, rated_at=rated_at),
+        RatingHistory(player_id=player_2.id, match_id=match.id, rating_before=rating_2, rating_after=player_2.rating, rated_at=rated_at),
+    ])
+
+
+def recompute_ratings(db_session: Session, batch_size: int = BATCH_SIZE) -> int:
+    """
+    Recomputes every rating and the whole rating history by replaying the finalized
+    matches in the order they were finalized, starting from the initial rating.
+
+    The matches are streamed and the ratings are kept in a dict, so the pass is linear
+    in the number of matches. Elo updates depend on the previous ones, so the replay is
+    sequential. History rows are written in batches of `batch_size`.
+
+    The projection state is locked first, so the replay does not run together with a
+    player statistics refresh or another replay. Every player is then locked in id order,
+    like when a match is finalized, so results finalized during the replay wait for it
+    and are rated from the recomputed ratings instead of being overwritten by them.
+
+    Args:
+        db_session (Session): The database session.
+        batch_size (int): How many matches are fetched and history rows written at a time.
+
+    Returns:
+        int: The number of matches replayed.
+    """
+    get_projection_state(db_session)
+    db_session.query(Player.id).order_by(Player.id).with_for_update().all()
+    db_session.query(RatingHistory).delete(synchronize_session=False)
+
+    ratings = {}
+    history = []
+    replayed = 0
+    for match in finalized_matches(db_session).yield_per(batch_size):
+        rating_a = ratings.get(match.player_a_id, INITIAL_RATING)
+        rating_b = ratings.get(match.player_b_id, INITIAL_RATING)
+        new_a, new_b = elo_ratings(rating_a, rating_b, match.result_code)
+        ratings[match.player_a_id] = new_a
+        ratings[match.player_b_id] = new_b
+        history.append({"player_id": match.player_a_id, "match_id": match.id, "rating_before": rating_a, "rating_after": new_a, "rated_at": match.finalized_at})
+        history.append({"player_id": match.player_b_id, "match_id": match.id, "rating_before": rating_b, "rating_after": new_b, "rated_at": match.finalized_at})
+        replayed += 1
+        if len(history) >= batch_size:
+            db_session.bulk_insert_mappings(RatingHistory, history)
+            history = []
+    db_session.bulk_insert_mappings(RatingHistory, history)
+
+    db_session.query(Player).update({Player.rating: INITIAL_RATING}, synchronize_session=False)
+    db_session.bulk_update_mappings(
+        Player, [{"id": player_id, "rating": rating} for player_id, rating in ratings.items()]
+    )
+    refresh_ranks(db_session)
+    db_session.commit()
+    return replayed
+
+
+def read_player_rating(db_session: Session, player_id: UUID, limit: int = 20) -> dict:
+    """
+    Retrieves the rating of a player and their most recent rating changes.
+
+    Args:
+        db_session (Session): The database session.
+        player_id (UUID): The unique identifier of the player.
+        limit (int): How many rating changes to return.
+
+    Returns:
+        dict: The current rating and the rating history of the player, newest first.
+    """
+    rating = db_session.query(Player.rating).filter(Player.id == player_id).scalar()
+    if rating is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Player not found")
+
+    history = (
+        db_session.query(RatingHistory)
+        .filter(RatingHistory.player_id == player_id)
+        .order_by(RatingHistory.rated_at.desc(), RatingHistory.id.desc())
+        .limit(limit)
+        .all()
+    )
+    return {"player_id": player_id, "rating": rating, "history": history}
+
@@ -1,5 +1,6 @@
+from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Dict, List, Optional
 import logging
 import uuid
 import re
@@ -8,7 +9,7 @@ from src.common.custom_responses import NotFound, BadRequest, ForbiddenAccess, U
 
 from src.models.request import RequestType, Requests, RequestStatus, RequestAction
 from src.models.user import User, Role
-from src.models.player import Player
+from src.models.player import Player, player_name_key
 
 from src.schemas.request import CreateRequest, RequestResponse
 
@@ -63,7 +64,7 @@ def creating_request(db: Session, request: CreateRequest, current_user: User, r_
             return BadRequest("Invalid player name format")
 
         firstname, lastname = request.reason.split()
-        player = db.query(Player).filter(Player.first_name == firstname, Player.last_name == lastname).first()
+        player = db.query(Player).filter(Player.name_key == player_name_key(firstname, lastname)).first()
 
         if not player:
             return NotFound(key="Player", key_value=request.reason)
@@ -82,22 +83,25 @@ def creating_request(db: Session, request: CreateRequest, current_user: User, r_
                            reason=db_request.reason, status=db_request.status)
 
 
-def view_requests(db: Session, current_user: User, search: Optional[str]) -> (List[RequestResponse] |
-                                                                              Unauthorized |
-                                                                              NotFound |
-                                                                              BadRequest |
-                                                                              ForbiddenAccess):
+def view_requests(db: Session, current_user: User, search: Optional[str],
+                  offset: int = 0, limit: int = 50) -> (List[RequestResponse] |
+                                                        Unauthorized |
+                                                        NotFound |
+                                                        BadRequest |
+                                                        ForbiddenAccess):
 
     """
-    Retrieve all requests from the database.
+    Retrieve a page of requests from the database, oldest first.
 
     Parameters:
         db (Session): An instance of the SQLAlchemy Session class.
         current_user (User): The user making the request.
         search (Optional[str]): The status of the requests to retrieve.
+        offset (int): The number of requests to skip.
+        limit (int): The maximum number of requests to return.
 
     Returns:
-        List[RequestResponse]: A list of all requests in the database.
+        List[RequestResponse]: A page of requests sorted by creation time.
         Alternatively, an Unauthorized, NotFound, or ForbiddenAccess response.
     """
 
@@ -107,22 +111,48 @@ def view_requests(db: Session, current_user: User, search: Optional[str]) -> (Li
     if not current_user.role == Role.ADMIN:
         return ForbiddenAccess()
 
-    if not db.query(Requests).all():
-        return NotFound(key="Requests", key_value="")
+    query = db.query(Requests)
 
     if search:
-        requests = db.query(Requests).filter(Requests.status == search).all()
-        if not requests:
-            return NotFound(key="Requests", key_value="")
+        query = query.filter(Requests.status == search)
+
+    requests = query.order_by(Requests.created_at, Requests.id).offset(offset).limit(limit).all()
 
-    else:
-        requests = db.query(Requests).all()
+    if not requests:
+        return NotFound(key="Requests", key_value="")
 
     return [RequestResponse(id=request.id, created_at=request.created_at, type=request.type.value,
                             user_id=request.user_id, reason=request.reason, status=request.status)
             for request in requests]
 
 
+def count_requests_by_status(db: Session, current_user: User) -> (Dict[str, int] |
+                                                                  Unauthorized |
+                                                                  ForbiddenAccess):
+
+    """
+    Count the requests in every status with a single aggregate query.
+
+    Parameters:
+        db (Session): An instance of the SQLAlchemy Session class.
+        current_user (User): The user making the request.
+
+    Returns:
+        Dict[str, int]: The number of requests for every request status.
+        Alternatively, an Unauthorized or ForbiddenAccess response.
+    """
+
+    if current_user is None:
+        return Unauthorized()
+
+    if not current_user.role == Role.ADMIN:
+        return ForbiddenAccess()
+
+    counts = dict(db.query(Requests.status, func.count(Requests.id)).group_by(Requests.status).all())
+
+    return {status.value: counts.get(status, 0) for status in RequestStatus}
+
+
 def open_request(db: Session, request_id: uuid.UUID, current_user: User, action) -> (RequestResponse |
                                                                                      Unauthorized |
                                                                                      NotFound |
@@ -196,7 +226,7 @@ def accept_request(db, request: Requests) -> (str |
     if request.type == RequestType.LINK:
 
         firstname, lastname = request.reason.split(" ")
-        player = db.query(Player).filter(Player.first_name == firstname, Player.last_name == lastname).first()
+        player = db.query(Player).filter(Player.name_key == player_name_key(firstname, lastname)).first()
 
         update_player_with_user(db, player.id, request.user_id)
 
@@ -237,3 +267,129 @@ def reject_request(db, request: Requests) -> (str |
     db.refresh(request)
 
     return f"{request.type.value} from {user.username} rejected"
+
+
+def moderate_requests(db: Session, request_ids: List[uuid.UUID], current_user: User,
+                      action: RequestAction) -> (Dict[str, str] |
+                                                 Unauthorized |
+                                                 ForbiddenAccess):
+
+    """
+    Accept or reject many requests in a single transaction.
+
+    Requests, the users that made them and the players they reference are loaded with
+    one query each. Role changes and request statuses are applied with set-based updates
+    and everything is committed once.
+
+    Parameters:
+        db (Session): An instance of the SQLAlchemy Session class.
+        request_ids (List[uuid.UUID]): The IDs of the requests to process.
+        current_user (User): The user making the request.
+        action (RequestAction): The action to be taken on every request.
+
+    Returns:
+        Dict[str, str]: The outcome for every request ID.
+        Alternatively, an Unauthorized or ForbiddenAccess response.
+    """
+
+    if current_user is None:
+        return Unauthorized()
+
+    if not current_user.role == Role.ADMIN:
+        return ForbiddenAccess()
+
+    result = {str(request_id): "Not Found" for request_id in request_ids}
+
+    requests = db.query(Requests).filter(Requests.id.in_(request_ids)).all()
+    pending = []
+    for request in requests:
+        if request.status != RequestStatus.PENDING:
+            result[str(request.id)] = "Already processed"
+        else:
+            pending.append(request)
+
+    if not pending:
+        return result
+
+    if action == RequestAction.REJECT:
+        _set_requests_status(db, [request.id for request in pending], RequestStatus.REJECTED)
+        db.commit()
+        result.update({str(request.id): "Rejected" for request in pending})
+        return result
+
+    users = db.query(User).filter(User.id.in_({request.user_id for request in pending})).all()
+    users_by_id = {user.id: user for user in users}
+
+    link_keys = [player_name_key(*request.reason.split(" ", 1)) for request in pending
+                 if request.type == RequestType.LINK]
+    unlink_user_ids = [request.user_id for request in pending if request.type == RequestType.UNLINK]
+    players = db.query(Player).filter(
+        or_(Player.name_key.in_(link_keys), Player.user_id.in_(unlink_user_ids))
+    ).all() if link_keys or unlink_user_ids else []
+    players_by_name = {player.name_key: player for player in players}
+    linked_user_ids = {player.user_id for player in players if player.user_id}
+    linked_player_ids = set()
+
+    accepted = []
+    promote_ids, demote_ids, unlink_ids = [], [], []
+    links = []
+    for request in pending:
+        if request.user_id not in users_by_id:
+            result[str(request.id)] = "User not found"
+            continue
+
+        if request.type == RequestType.PROMOTE:
+            promote_ids.append(request.user_id)
+
+        elif request.type == RequestType.DEMOTE:
+            demote_ids.append(request.user_id)
+
+        elif request.type == RequestType.LINK:
+            player = players_by_name.get(player_name_key(*request.reason.split(" ", 1)))
+            if player is None:
+                result[str(request.id)] = "Player not found"
+                continue
+            if player.user_id or player.id in linked_player_ids or request.user_id in linked_user_ids:
+                result[str(request.id)] = "Player or user already linked"
+                continue
+            linked_player_ids.add(player.id)
+            linked_user_ids.add(request.user_id)
+            links.append({"id": player.id, "user_id": request.user_id})
+
+        elif request.type == RequestType.UNLINK:
+            unlink_ids.append(request.user_id)
+
+        accepted.append(request.id)
+        result[str(request.id)] = "Accepted"
+
+    if promote_ids:
+        db.query(User).filter(User.id.in_(promote_ids)).update(
+            {User.role: Role.DIRECTOR}, synchronize_session=False
+        )
+    if demote_ids:
+        db.query(User).filter(User.id.in_(demote_ids)).update(
+            {User.role: Role.USER}, synchronize_session=False
+        )
+    if unlink_ids:
+        db.query(Player).filter(Player.user_id.in_(unlink_ids)).update(
+            {Player.user_id: None}, synchronize_session=False
+        )
+    if links:
+        db.bulk_update_mappings(Player, links)
+
+    _set_requests_status(db, accepted, RequestStatus.ACCEPTED)
+    db.commit()
+
+    return result
+
+
+def _set_requests_status(db: Session, request_ids: List[uuid.UUID], status: RequestStatus) -> None:
+
+    """
+    Set the status of many requests with one UPDATE statement. Nothing is committed here.
+    """
+
+    if request_ids:
+        db.query(Requests).filter(Requests.id.in_(request_ids)).update(
+            {Requests.status: status}, synchronize_session=False
+        )
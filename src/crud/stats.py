@@ -0,0 +1,639 @@
+from collections import deque
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, delete, exists, func, or_, select, true, tuple_, update
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import operators
+
+from src.database.session import SessionLocal
+from src.models.match import Match
+from src.models.player import Player
+from src.models.stats import ConsumedMatch, HeadToHead, PlayerStats, ProjectionState
+
+PROJECTION_NAME = "player_stats"
+BATCH_SIZE = 1000
+# How far behind the high-water mark a match may still commit: `finalized_at` is stamped
+# before the commit, so a slow transaction commits after later matches were consumed.
+# Matches committing later than this after their `finalized_at` are only counted by a rebuild.
+SAFETY_WINDOW = timedelta(minutes=10)
+
+PLAYER_1_WINS = 1
+PLAYER_2_WINS = 2
+
+WIN = "wins"
+LOSS = "losses"
+DRAW = "draws"
+
+# Leaderboards: the rank column of each sort key and the order it ranks the players in.
+LEADERBOARD_ORDER = {
+    "rating": (PlayerStats.rating_rank, (Player.rating.desc(), PlayerStats.wins.desc())),
+    "wins": (PlayerStats.wins_rank, (PlayerStats.wins.desc(), PlayerStats.win_rate.desc())),
+    "win_rate": (PlayerStats.win_rate_rank, (PlayerStats.win_rate.desc(), PlayerStats.matches_played.desc())),
+}
+# Players need this many matches to be ranked by win rate.
+MIN_MATCHES_FOR_WIN_RATE = 5
+
+
+def _empty_player_row(player_id: UUID) -> dict:
+    return {
+        "player_id": player_id,
+        "matches_played": 0,
+        "wins": 0,
+        "losses": 0,
+        "draws": 0,
+        "current_streak": 0,
+        "longest_win_streak": 0,
+        "longest_loss_streak": 0,
+        "win_rate": 0.0,
+        "last_match_at": None,
+    }
+
+
+def _empty_pair_row(player_id: UUID, opponent_id: UUID) -> dict:
+    return {
+        "player_id": player_id,
+        "opponent_id": opponent_id,
+        "matches_played": 0,
+        "wins": 0,
+        "losses": 0,
+        "draws": 0,
+        "last_match_at": None,
+    }
+
+
+def match_outcomes(result_code: int) -> tuple[str, str]:
+    """
+    Translates the result code of a match into the outcome for each of its players.
+
+    Args:
+        result_code (int): The result code of the match.
+
+    Returns:
+        tuple[str, str]: The outcome (`wins`, `losses` or `draws`) for player A and player B.
+    """
+    if result_code == PLAYER_1_WINS:
+        return WIN, LOSS
+    if result_code == PLAYER_2_WINS:
+        return LOSS, WIN
+    return DRAW, DRAW
+
+
+class StatsProjection:
+    """
+    Player statistics and head-to-head rows touched by a pass over finalized matches.
+
+    Rows are kept as plain dicts keyed like the table columns, so they can be written with
+    the bulk insert / update mappings once the pass is over. `loaded_*` remember which of
+    them already exist in the database.
+    """
+
+    def __init__(self, players: Iterable[UUID] | None = None):
+        self.scope = set(players) if players is not None else None
+        self.players: dict[UUID, dict] = {}
+        self.pairs: dict[tuple[UUID, UUID], dict] = {}
+        self.loaded_players: set[UUID] = set()
+        self.loaded_pairs: set[tuple[UUID, UUID]] = set()
+
+    def load(self, db_session: Session, matches: list) -> None:
+        """
+        Loads the existing rows of the players and pairs of `matches`.
+        """
+        player_ids = {match.player_a_id for match in matches} | {match.player_b_id for match in matches}
+        pairs = {(match.player_a_id, match.player_b_id) for match in matches}
+        pairs |= {(opponent_id, player_id) for player_id, opponent_id in pairs}
+
+        for row in db_session.query(*PlayerStats.__table__.columns).filter(
+            PlayerStats.player_id.in_(player_ids - set(self.players))
+        ):
+            self.players[row.player_id] = dict(row._mapping)
+            self.loaded_players.add(row.player_id)
+
+        for row in db_session.query(*HeadToHead.__table__.columns).filter(
+            tuple_(HeadToHead.player_id, HeadToHead.opponent_id).in_(list(pairs - set(self.pairs)))
+        ):
+            self.pairs[(row.player_id, row.opponent_id)] = dict(row._mapping)
+            self.loaded_pairs.add((row.player_id, row.opponent_id))
+
+    def apply(self, match) -> None:
+        """
+        Adds a finalized match to the statistics of its players.
+        """
+        outcome_a, outcome_b = match_outcomes(match.result_code)
+        for player_id, opponent_id, outcome in (
+            (match.player_a_id, match.player_b_id, outcome_a),
+            (match.player_b_id, match.player_a_id, outcome_b),
+        ):
+            if self.scope is None or player_id in self.scope:
+                player = self.players.get(player_id)
+                if player is None:
+                    player = self.players[player_id] = _empty_player_row(player_id)
+                self._add_outcome(player, outcome, match.finalized_at)
+
+            pair = self.pairs.get((player_id, opponent_id))
+            if pair is None:
+                pair = self.pairs[(player_id, opponent_id)] = _empty_pair_row(player_id, opponent_id)
+            pair["matches_played"] += 1
+            pair[outcome] += 1
+            pair["last_match_at"] = match.finalized_at
+
+    @staticmethod
+    def _add_outcome(player: dict, outcome: str, finalized_at: datetime) -> None:
+        player["matches_played"] += 1
+        player[outcome] += 1
+        if outcome == WIN:
+            player["current_streak"] = max(player["current_streak"], 0) + 1
+            player["longest_win_streak"] = max(player["longest_win_streak"], player["current_streak"])
+        elif outcome == LOSS:
+            player["current_streak"] = min(player["current_streak"], 0) - 1
+            player["longest_loss_streak"] = max(player["longest_loss_streak"], -player["current_streak"])
+        else:
+            player["current_streak"] = 0
+        player["win_rate"] = player["wins"] / player["matches_played"]
+        player["last_match_at"] = finalized_at
+
+    def write(self, db_session: Session) -> None:
+        """
+        Writes the touched rows, inserting the new ones and updating the loaded ones.
+        """
+        db_session.bulk_insert_mappings(
+            PlayerStats, [row for key, row in self.players.items() if key not in self.loaded_players]
+        )
+        db_session.bulk_update_mappings(
+            PlayerStats, [row for key, row in self.players.items() if key in self.loaded_players]
+        )
+        db_session.bulk_insert_mappings(
+            HeadToHead, [row for key, row in self.pairs.items() if key not in self.loaded_pairs]
+        )
+        db_session.bulk_update_mappings(
+            HeadToHead, [row for key, row in self.pairs.items() if key in self.loaded_pairs]
+        )
+
+
+def finalized_matches(db_session: Session):
+    """
+    Builds the query of the finalized matches between two players, in the order the
+    projection consumes them. Only the columns the projection needs are selected.
+    """
+    return (
+        db_session.query(
+            Match.id,
+            Match.player_a_id,
+            Match.player_b_id,
+            Match.result_code,
+            Match.finalized_at,
+        )
+        .filter(
+            Match.finalized_at.isnot(None),
+            Match.player_a_id.isnot(None),
+            Match.player_b_id.isnot(None),
+            Match.result_code.isnot(None),
+        )
+        .order_by(Match.finalized_at, Match.id)
+    )
+
+
+def get_projection_state(db_session: Session) -> ProjectionState:
+    """
+    Gets the high-water mark of the player statistics, locking it so that only one
+    refresh or rebuild runs at a time.
+    """
+    state = (
+        db_session.query(ProjectionState)
+        .filter(ProjectionState.name == PROJECTION_NAME)
+        .with_for_update()
+        .first()
+    )
+    if state is None:
+        state = ProjectionState(name=PROJECTION_NAME)
+        db_session.add(state)
+    return state
+
+
+def refresh_player_stats(db_session: Session, batch_size: int = BATCH_SIZE) -> int:
+    """
+    Consumes the matches finalized since the high-water mark, in (finalized_at, id) order,
+    and adds them to the player statistics and head-to-head records.
+
+    The `SAFETY_WINDOW` behind the mark is read again, so a match committed after later
+    matches were consumed is still counted. The matches consumed within the window are
+    recorded in `consumed_matches` and skipped, so every match is counted once, no matter
+    how many times the refresh runs.
+
+    Args:
+        db_session (Session): The database session.
+        batch_size (int): How many matches are read and written at a time.
+
+    Returns:
+        int: The number of matches consumed.
+    """
+    state = get_projection_state(db_session)
+    consumed = 0
+    touched = set()
+    while True:
+        query = finalized_matches(db_session)
+        if state.last_finalized_at is not None:
+            query = query.filter(
+                Match.finalized_at > state.last_finalized_at - SAFETY_WINDOW,
+                ~exists().where(
+                    ConsumedMatch.projection == PROJECTION_NAME, ConsumedMatch.match_id == Match.id
+                ),
+            )
+        batch = query.limit(batch_size).all()
+        if not batch:
+            break
+
+        projection = StatsProjection()
+        projection.load(db_session, batch)
+        for match in batch:
+            projection.apply(match)
+        projection.write(db_session)
+        _record_consumed(db_session, batch)
+        touched.update(projection.players)
+
+        if state.last_finalized_at is None or batch[-1].finalized_at > state.last_finalized_at:
+            state.last_finalized_at = batch[-1].finalized_at
+            state.last_match_id = batch[-1].id
+        consumed += len(batch)
+        if len(batch) < batch_size:
+            break
+
+    if consumed:
+        _prune_consumed(db_session, state)
+        refresh_ranks(db_session, touched)
+    db_session.commit()
+    return consumed
+
+
+def _record_consumed(db_session: Session, matches: Iterable) -> None:
+    db_session.bulk_insert_mappings(
+        ConsumedMatch,
+        [
+            {"projection": PROJECTION_NAME, "match_id": match.id, "finalized_at": match.finalized_at}
+            for match in matches
+        ],
+    )
+
+
+def _prune_consumed(db_session: Session, state: ProjectionState) -> None:
+    db_session.execute(
+        delete(ConsumedMatch).where(
+            ConsumedMatch.projection == PROJECTION_NAME,
+            ConsumedMatch.finalized_at <= state.last_finalized_at - SAFETY_WINDOW,
+        )
+    )
+
+
+def rebuild_player_stats(
+    db_session: Session, player_ids: Iterable[UUID] | None = None, batch_size: int = BATCH_SIZE
+) -> int:
+    """
+    Rebuilds the player statistics from scratch with one streaming pass over the
+    finalized matches.
+
+    Without `player_ids` every row is rebuilt and the high-water mark is moved to the
+    last finalized match. With `player_ids` only the statistics of those players and
+    their head-to-head records are rebuilt from the matches already consumed, e.g. after
+    one of their matches was deleted.
+
+    Args:
+        db_session (Session): The database session.
+        player_ids (Iterable[UUID] | None): The players to rebuild, or None for all players.
+        batch_size (int): How many matches are fetched from the database at a time.
+
+    Returns:
+        int: The number of matches consumed.
+    """
+    state = get_projection_state(db_session)
+    query = finalized_matches(db_session)
+
+    if player_ids is None:
+        db_session.query(HeadToHead).delete(synchronize_session=False)
+        db_session.query(PlayerStats).delete(synchronize_session=False)
+        db_session.query(ConsumedMatch).filter(
+            ConsumedMatch.projection == PROJECTION_NAME
+        ).delete(synchronize_session=False)
+        projection = StatsProjection()
+    else:
+        player_ids = list(player_ids)
+        db_session.query(HeadToHead).filter(
+            or_(HeadToHead.player_id.in_(player_ids), HeadToHead.opponent_id.in_(player_ids))
+        ).delete(synchronize_session=False)
+        db_session.query(PlayerStats).filter(
+            PlayerStats.player_id.in_(player_ids)
+        ).delete(synchronize_session=False)
+        projection = StatsProjection(players=player_ids)
+        if state.last_finalized_at is None:
+            db_session.commit()
+            return 0
+        query = query.filter(
+            or_(Match.player_a_id.in_(player_ids), Match.player_b_id.in_(player_ids)),
+            or_(
+                Match.finalized_at <= state.last_finalized_at - SAFETY_WINDOW,
+                exists().where(
+                    ConsumedMatch.projection == PROJECTION_NAME, ConsumedMatch.match_id == Match.id
+                ),
+            ),
+        )
+
+    consumed = 0
+    last_match = None
+    # The matches within the safety window of the last one, to record as consumed.
+    recent = deque()
+    for match in query.yield_per(batch_size):
+        projection.apply(match)
+        last_match = match
+        consumed += 1
+        if player_ids is None:
+            recent.append(match)
+            while recent[0].finalized_at <= match.finalized_at - SAFETY_WINDOW:
+                recent.popleft()
+    projection.write(db_session)
+
+    if player_ids is None:
+        _record_consumed(db_session, recent)
+        state.last_finalized_at = last_match.finalized_at if last_match else None
+        state.last_match_id = last_match.id if last_match else None
+    refresh_ranks(db_session)
+    db_session.commit()
+    return consumed
+
+
+def refresh_ranks(db_session: Session, player_ids: Iterable[UUID] | None = None):
+    """
+    Recomputes the leaderboard positions with a window function per sort key. Only the
+    rows whose position changed are written. Nothing is committed.
+
+    Without `player_ids` every player is ranked again. With `player_ids`, the players whose
+    statistics or rating changed since the last refresh, only the positions between their
+    old and new positions are ranked again, the others cannot move: see `_refresh_rank_range`.
+
+    Args:
+        db_session (Session): The database session.
+        player_ids (Iterable[UUID] | None): The changed players, or None to rank everyone.
+    """
+    for sort in LEADERBOARD_ORDER:
+        if player_ids is None:
+            _write_ranks(db_session, sort)
+        else:
+            _refresh_rank_range(db_session, sort, set(player_ids))
+
+
+def _rank_eligible(sort: str):
+    if sort == "win_rate":
+        return PlayerStats.matches_played >= MIN_MATCHES_FOR_WIN_RATE
+    return true()
+
+
+def _write_ranks(db_session: Session, sort: str, first: int = 1, last: int | None = None, player_ids: set = ()):
+    """
+    Ranks again the players at positions `first` to `last` (to the end if None), and the
+    players in `player_ids`, numbering them from `first`.
+    """
+    rank_column, order = LEADERBOARD_ORDER[sort]
+    ranked = (
+        select(
+            PlayerStats.player_id,
+            (func.row_number().over(order_by=(*order, PlayerStats.player_id)) + (first - 1)).label("rank"),
+        )
+        .join(Player, Player.id == PlayerStats.player_id)
+        .where(_rank_eligible(sort))
+    )
+    if first > 1 or last is not None or player_ids:
+        in_range = rank_column >= first if last is None else rank_column.between(first, last)
+        ranked = ranked.where(or_(in_range, PlayerStats.player_id.in_(player_ids)))
+    ranked = ranked.subquery()
+
+    db_session.execute(
+        update(PlayerStats)
+        .where(PlayerStats.player_id == ranked.c.player_id, rank_column.is_distinct_from(ranked.c.rank))
+        .values({rank_column: ranked.c.rank})
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _leaderboard_key(sort: str, row) -> tuple:
+    """
+    Sort key of a row of `_rank_rows`, in leaderboard order.
+    """
+    _, order = LEADERBOARD_ORDER[sort]
+    values = [
+        -row[index] if item.modifier is operators.desc_op else row[index]
+        for index, item in enumerate(order, start=3)
+    ]
+    return (*values, row.player_id)
+
+
+def _ranked_before(sort: str, row, before: bool = True):
+    """
+    The condition of a player coming before (or after) `row` on the leaderboard.
+    """
+    _, order = LEADERBOARD_ORDER[sort]
+    conditions = []
+    ties = []
+    for index, item in enumerate(order, start=3):
+        column = item.element
+        ahead = item.modifier is operators.desc_op
+        conditions.append(and_(*ties, column > row[index] if ahead == before else column < row[index]))
+        ties.append(column == row[index])
+    conditions.append(
+        and_(*ties, PlayerStats.player_id < row.player_id if before else PlayerStats.player_id > row.player_id)
+    )
+    return or_(*conditions)
+
+
+def _refresh_rank_range(db_session: Session, sort: str, player_ids: set):
+    """
+    Ranks again only the positions between the old and new positions of changed players.
+
+    The other players keep their order, so the players above the first position a changed
+    player leaves or takes, and below the last one, keep their positions. The first new
+    position is found from the nearest unchanged player above the best changed player,
+    the last one from the nearest below the worst, with one index scan each. When players
+    enter or leave the ranking, every position below them moves, so the range runs to the end.
+    """
+    rank_column, order = LEADERBOARD_ORDER[sort]
+    rows = db_session.execute(
+        select(
+            PlayerStats.player_id,
+            rank_column.label("rank"),
+            _rank_eligible(sort).label("eligible"),
+            *(item.element for item in order),
+        )
+        .join(Player, Player.id == PlayerStats.player_id)
+        .where(PlayerStats.player_id.in_(player_ids))
+    ).all()
+    old_ranks = [row.rank for row in rows if row.rank is not None]
+    ranked = sorted((row for row in rows if row.eligible), key=lambda row: _leaderboard_key(sort, row))
+    if not old_ranks and not ranked:
+        return
+
+    def nearest_unchanged_rank(row, before: bool):
+        nearest_first = (*order, PlayerStats.player_id.asc())
+        if before:
+            nearest_first = [
+                item.element.asc() if item.modifier is operators.desc_op else item.element.desc()
+                for item in nearest_first
+            ]
+        return db_session.execute(
+            select(rank_column)
+            .join(Player, Player.id == PlayerStats.player_id)
+            .where(
+                rank_column.isnot(None),
+                PlayerStats.player_id.notin_(player_ids),
+                _ranked_before(sort, row, before),
+            )
+            .order_by(*nearest_first)
+            .limit(1)
+        ).scalar()
+
+    positions = list(old_ranks)
+    to_the_end = any(bool(row.eligible) != (row.rank is not None) for row in rows)
+    if ranked:
+        above = nearest_unchanged_rank(ranked[0], before=True)
+        positions.append(above - sum(rank < above for rank in old_ranks) + 1 if above else 1)
+        below = nearest_unchanged_rank(ranked[-1], before=False)
+        if below is None:
+            to_the_end = True
+        else:
+            positions.append(below - sum(rank < below for rank in old_ranks) + len(ranked) - 1)
+
+    _write_ranks(
+        db_session,
+        sort,
+        first=min(positions),
+        last=None if to_the_end else max(positions),
+        player_ids={row.player_id for row in ranked},
+    )
+    leaving = [row.player_id for row in rows if not row.eligible and row.rank is not None]
+    if leaving:
+        db_session.execute(
+            update(PlayerStats)
+            .where(PlayerStats.player_id.in_(leaving))
+            .values({rank_column: None})
+            .execution_options(synchronize_session=False)
+        )
+
+
+def _leaderboard_query(db_session: Session, sort: str):
+    rank_column = LEADERBOARD_ORDER[sort][0]
+    return db_session.query(
+        rank_column.label("rank"),
+        Player.id,
+        Player.first_name,
+        Player.last_name,
+        Player.country,
+        Player.rating,
+        PlayerStats.matches_played,
+        PlayerStats.wins,
+        PlayerStats.losses,
+        PlayerStats.draws,
+        PlayerStats.win_rate,
+    ).join(Player, Player.id == PlayerStats.player_id), rank_column
+
+
+def read_leaderboard(db_session: Session, sort: str = "rating", offset: int = 0, limit: int = 10) -> list[dict]:
+    """
+    Retrieves a page of the leaderboard. The page is a range of the precomputed rank
+    column, so it is read straight from its index however deep it is.
+
+    Args:
+        db_session (Session): The database session.
+        sort (str): The sort key, `rating`, `wins` or `win_rate`.
+        offset (int): How many players to skip.
+        limit (int): How many players to return.
+
+    Returns:
+        list[dict]: The ranked players of the page.
+    """
+    query, rank_column = _leaderboard_query(db_session, sort)
+    rows = query.filter(rank_column.between(offset + 1, offset + limit)).order_by(rank_column).all()
+    return [dict(row._mapping) for row in rows]
+
+
+def read_player_rank(db_session: Session, player_id: UUID, sort: str = "rating") -> dict:
+    """
+    Retrieves the leaderboard entry of a player, a primary key lookup.
+
+    Args:
+        db_session (Session): The database session.
+        player_id (UUID): The unique identifier of the player.
+        sort (str): The sort key, `rating`, `wins` or `win_rate`.
+
+    Returns:
+        dict: The leaderboard entry of the player.
+    """
+    query, rank_column = _leaderboard_query(db_session, sort)
+    row = query.filter(PlayerStats.player_id == player_id).first()
+    if row is None or row.rank is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Player is not ranked")
+    return dict(row._mapping)
+
+
+def refresh_player_stats_task():
+    """
+    Refreshes the player statistics in its own session, to run as a background task
+    once the request that finalized the matches is committed.
+    """
+    db_session = SessionLocal()
+    try:
+        refresh_player_stats(db_session)
+    finally:
+        db_session.close()
+
+
+def rebuild_player_stats_task(player_ids: list[UUID]):
+    """
+    Rebuilds the statistics of some players in its own session, to run as a background task.
+    """
+    db_session = SessionLocal()
+    try:
+        rebuild_player_stats(db_session, player_ids)
+    finally:
+        db_session.close()
+
+
+def get_player_stats(db_session: Session, player_id: UUID) -> PlayerStats:
+    """
+    Retrieves the career statistics of a player.
+
+    Args:
+        db_session (Session): The database session.
+        player_id (UUID): The unique identifier of the player.
+
+    Returns:
+        PlayerStats: The statistics of the player, all zero if they have no finalized matches.
+    """
+    stats = db_session.query(PlayerStats).filter(PlayerStats.player_id == player_id).first()
+    if stats is None:
+        if db_session.query(Player.id).filter(Player.id == player_id).first() is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Player not found")
+        stats = PlayerStats(**_empty_player_row(player_id))
+    return stats
+
+
+def get_head_to_head(db_session: Session, player_id: UUID, opponent_id: UUID) -> HeadToHead:
+    """
+    Retrieves the record of a player against an opponent.
+
+    Args:
+        db_session (Session): The database session.
+        player_id (UUID): The unique identifier of the player.
+        opponent_id (UUID): The unique identifier of the opponent.
+
+    Returns:
+        HeadToHead: The record of the player, all zero if they never played each other.
+    """
+    record = (
+        db_session.query(HeadToHead)
+        .filter(HeadToHead.player_id == player_id, HeadToHead.opponent_id == opponent_id)
+        .first()
+    )
+    if record is None:
+        found = db_session.query(Player.id).filter(Player.id.in_([player_id, opponent_id])).count()
+        if found < len({player_id, opponent_id}):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Player not found")
+        record = HeadToHead(**_empty_pair_row(player_id, opponent_id))
+    return record
@@ -1,25 +1,48 @@
 from src.schemas.tournament import TournamentSchema, Participant, UpdateTournamentRequest
 from src.models.tournament import Tournament, TournamentFormat, TournamentParticipants
 from src.models.match import Match, MatchFormat
-from src.models.player import Player
+from src.models.player import INITIAL_RATING, Player, player_name_key
+from src.models.stats import PlayerStats
+from src.models.base import uuid7
+from src.crud.players import clear_search_cache
+from src.common.intervals import IntervalIndex
 from src.models.user import User, Role
 from sqlalchemy.orm import Session
-from sqlalchemy import asc, desc, and_
+from sqlalchemy import asc, desc, and_, or_, delete, func
+from sqlalchemy.dialects.postgresql import insert
 from src.common.custom_responses import AlreadyExists
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import StaleDataError
 from uuid import UUID
 from src.common.custom_exceptions import (
     NotFound,
     InvalidNumberOfPlayers,
     InvalidRequest,
+    VersionConflict,
 )
 import random
-from datetime import datetime
-from itertools import combinations
+from datetime import datetime, timedelta
+from itertools import chain
+from typing import Iterable, Iterator
 import logging
 
 logger = logging.getLogger(__name__)
 
+# The `Match` columns a fixture may set; every inserted row has all of them, so a batch
+# of fixtures with different keys is still one executemany.
+FIXTURE_COLUMNS = (
+    "id",
+    "player_a_id",
+    "player_b_id",
+    "stage",
+    "serial_number",
+    "group_number",
+    "next_match_id",
+    "source_a",
+    "source_b",
+    "result_code",
+)
+
 
 def tournament_format_to_id(value: str, db_session: Session) -> int | None:
     """
@@ -71,11 +94,15 @@ def get_match_name(match: Match) -> str:
     match_name = ""
     if match.player_a:
         match_name = f"{match.player_a.first_name} {match.player_a.last_name}"
+    elif match.source_a:
+        match_name = match.source_a
     else:
         match_name = f"Winner of m{match.serial_number*2 + 1} s{match.stage}"
 
     if match.player_b:
         match_name += f" vs {match.player_b.first_name} {match.player_b.last_name}"
+    elif match.source_b:
+        match_name += f" vs {match.source_b}"
     else:
         match_name += f" vs Winner of m{match.serial_number*2 + 2} s{match.stage}"
 
@@ -122,6 +149,9 @@ def create(
         prize=tournament.prize,
         win_points=tournament.win_points,
         draw_points=tournament.draw_points,
+        group_size=tournament.group_size,
+        group_qualifiers=tournament.group_qualifiers,
+        lazy_bracket=tournament.lazy_bracket,
         author_id=current_user.id,
     )
     db_session.add(db_tournament)
@@ -194,16 +224,15 @@ def get_participant(
 ) -> Participant | None:
     """
     Retrieve a participant from the `Player` table by matching
-    their first and last name (case-insensitively).
+    their first and last name (case-insensitively) through the indexed `name_key`.
+    Among players with the same name, the one with the lowest id is picked.
     """
     db_participant = (
         db_session.query(Player)
         .filter(
-            and_(
-                Player.first_name.ilike(participant.first_name),
-                Player.last_name.ilike(participant.last_name),
-            )
+            Player.name_key == player_name_key(participant.first_name, participant.last_name)
         )
+        .order_by(Player.id)
         .first()
     )
     return db_participant
@@ -220,6 +249,7 @@ def create_player(db_session: Session, participant: Participant) -> Player:
     db_session.add(new_profile)
     db_session.commit()
     db_session.refresh(new_profile)
+    clear_search_cache()
 
     return new_profile
 
@@ -304,27 +334,109 @@ def get_tournament_participant(
     return tournament_participant
 
 
-def get_tournament_participants_by_id(
+def read_participants(
     db_session: Session,
-    participant_ids: list[UUID],
-) -> list[Participant]:
+    tournament_id: UUID,
+    offset: int = 0,
+    limit: int | None = None,
+    sort: str = "score",
+) -> list[dict]:
     """
-    The function takes a list of participant IDs and converts them
-    to a list of Participant
+    Retrieve the participants of a tournament with their tournament standing and career
+    statistics in a single query.
+
+    The rows are turned into dicts straight from the result tuples, no ORM objects are built.
+    Players without finalized matches get zero statistics.
+
+    Args:
+        db_session (Session): The database session.
+        tournament_id (UUID): The ID of the tournament.
+        offset (int): How many participants to skip.
+        limit (int | None): How many participants to return, or None for all of them.
+        sort (str): `score` for the highest score first, or `name` for alphabetical order.
+
+    Returns:
+        list[dict]: The participants of the requested page.
     """
-    participants = []
-    for participant_id in participant_ids:
-        db_player = db_session.query(Player).filter_by(id=participant_id).first()
-        if db_player is None:
-            continue
-        participants.append(
-            Participant(
-                first_name=db_player.first_name,
-                last_name=db_player.last_name,
-            )
+    query = (
+        db_session.query(
+            Player.id,
+            Player.first_name,
+            Player.last_name,
+            Player.country,
+            Player.rating,
+            TournamentParticipants.score,
+            TournamentParticipants.stage,
+            TournamentParticipants.group_number,
+            func.coalesce(PlayerStats.matches_played, 0).label("matches_played"),
+            func.coalesce(PlayerStats.wins, 0).label("wins"),
+            func.coalesce(PlayerStats.losses, 0).label("losses"),
+            func.coalesce(PlayerStats.draws, 0).label("draws"),
+            func.coalesce(PlayerStats.win_rate, 0.0).label("win_rate"),
+        )
+        .join(TournamentParticipants, Player.id == TournamentParticipants.player_id)
+        .outerjoin(PlayerStats, PlayerStats.player_id == Player.id)
+        .filter(TournamentParticipants.tournament_id == tournament_id)
+    )
+    if sort == "name":
+        query = query.order_by(Player.last_name, Player.first_name, Player.id)
+    else:
+        query = query.order_by(
+            desc(func.coalesce(TournamentParticipants.score, 0)), Player.last_name, Player.first_name, Player.id
         )
+    query = query.offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
+
+    return [dict(row._mapping) for row in query]
+
+
+def add_participants_by_id(
+    db_session: Session, tournament_id: UUID, player_ids: list[UUID]
+) -> dict[UUID, dict[str, str]]:
+    """
+    Add existing players to a tournament by their IDs.
 
-    return participants
+    The selected players are loaded with a single `IN` query and inserted with a single
+    `INSERT ... ON CONFLICT DO NOTHING RETURNING player_id`, so players that are already
+    registered are reported without a rollback per row. Unknown IDs are skipped.
+
+    Returns:
+        dict[UUID, dict[str, str]]: The same structure as `add_participants` - the player's
+                                    `first_name`, `last_name` and a `status` of "Added" or
+                                    "Already exists", keyed by player ID.
+    """
+    players = (
+        db_session.query(Player.id, Player.first_name, Player.last_name)
+        .filter(Player.id.in_(player_ids))
+        .all()
+    )
+    if not players:
+        return {}
+
+    added = set(
+        db_session.execute(
+            insert(TournamentParticipants)
+            .values(
+                [
+                    {"tournament_id": tournament_id, "player_id": player.id}
+                    for player in players
+                ]
+            )
+            .on_conflict_do_nothing()
+            .returning(TournamentParticipants.player_id)
+        ).scalars()
+    )
+    db_session.commit()
+
+    return {
+        player.id: {
+            "first_name": player.first_name,
+            "last_name": player.last_name,
+            "status": "Added" if player.id in added else "Already exists",
+        }
+        for player in players
+    }
 
 
 def delete_players(
@@ -333,10 +445,12 @@ def delete_players(
     """
     Remove participants from a tournament.
 
-    The function removes a list of participants from a specified tournament. For each participant:
-    - It checks if the participant is registered in the given tournament.
-    - If found, the participant's association with the tournament is deleted.
-    - If not found, the function notes that the participant was not registered in the tournament.
+    The function removes a list of participants from a specified tournament:
+    - All names are resolved to players with a single query on the indexed `name_key`.
+      Every name resolves to one player, the one `get_participant` picks when registering,
+      so removing one of two homonyms leaves the other registered.
+    - The registrations are removed with a single `DELETE ... RETURNING player_id`.
+    - Participants whose IDs are not returned were not registered in the tournament.
 
     Args:
         db_session (Session): The database session used for querying and committing changes.
@@ -350,23 +464,39 @@ def delete_players(
               - "Deleted": The participant was successfully removed from the tournament.
               - "Not Found": The participant was not registered in the specified tournament.
     """
-    result = {}
-
-    for participant in participants:
-        full_name = f"{participant.first_name} {participant.last_name}"
-        result[full_name] = {}
-        tournament_participant = get_tournament_participant(
-            db_session, participant, tournament_id
+    full_names = {
+        f"{participant.first_name} {participant.last_name}": player_name_key(
+            participant.first_name, participant.last_name
         )
-        if tournament_participant is None:
-            result[full_name]["status"] = "Not Found"
-            continue
-
-        db_session.delete(tournament_participant)
+        for participant in participants
+    }
+    players = {}
+    for player in (
+        db_session.query(Player.id, Player.name_key)
+        .filter(Player.name_key.in_(set(full_names.values())))
+        .order_by(Player.name_key, Player.id)
+        .all()
+    ):
+        players.setdefault(player.name_key, player.id)
+
+    deleted_keys = set()
+    if players:
+        name_keys = {player_id: name_key for name_key, player_id in players.items()}
+        deleted_ids = db_session.execute(
+            delete(TournamentParticipants)
+            .where(
+                TournamentParticipants.tournament_id == tournament_id,
+                TournamentParticipants.player_id.in_(name_keys),
+            )
+            .returning(TournamentParticipants.player_id)
+        ).scalars()
+        deleted_keys = {name_keys[player_id] for player_id in deleted_ids}
         db_session.commit()
-        result[full_name]["status"] = "Deleted"
 
-    return result
+    return {
+        full_name: {"status": "Deleted" if name_key in deleted_keys else "Not Found"}
+        for full_name, name_key in full_names.items()
+    }
 
 
 def remove_player(
@@ -406,7 +536,10 @@ def remove_player(
 
 
 def update_tournament(
-    tournament_id: UUID, data: UpdateTournamentRequest, db_session: Session
+    tournament_id: UUID,
+    data: UpdateTournamentRequest,
+    db_session: Session,
+    expected_version: int | None = None,
 ) -> Tournament:
     """
     The function modifies the details of an existing tournament based on the provided data.
@@ -421,8 +554,15 @@ def update_tournament(
             - `end_time` (datetime): The new end time of the tournament.
             - `prize` (str): The updated prize for the tournament.
         db_session (Session): The database session used for querying and committing changes.
+        expected_version (int | None): The version of the tournament the changes are based on, if known.
+
+    Raises:
+        VersionConflict: If the tournament was changed since `expected_version`, or by a
+                         concurrent request while it was being updated.
     """
     tournament = get_tournament(db_session=db_session, tournament_id=tournament_id)
+    if expected_version is not None and tournament.version != expected_version:
+        raise VersionConflict(key="tournament", key_value=tournament_id)
 
     if data.name:
         if tournament_name_exists(db_session, data.name) and tournament.name != data.name:
@@ -440,45 +580,261 @@ def update_tournament(
         tournament.end_time = data.end_time
     if data.prize:
         tournament.prize = data.prize
-    db_session.commit()
+    try:
+        db_session.commit()
+    except StaleDataError:
+        db_session.rollback()
+        raise VersionConflict(key="tournament", key_value=tournament_id)
     db_session.refresh(tournament)
 
     return tournament
 
 
-def validate_number_of_players(tournament: Tournament) -> bool:
-    valid_count_players = (4, 8, 16, 32, 64, 128, 256, 512, 1024)
-    total_players = len(tournament.participants)
-    return total_players in valid_count_players
+def schedule_matches(
+    tournament_id: UUID,
+    db_session: Session,
+    slot_minutes: int,
+    courts: int = 1,
+    rest_minutes: int = 0,
+) -> list[Match]:
+    """
+    Assign a start time, end time and court to the unscheduled matches of a tournament.
+
+    The tournament time is divided in slots of `slot_minutes`, each played on up to `courts`
+    courts. The matches are placed stage by stage, each in the earliest slot with a free court
+    where both players are free and have rested at least `rest_minutes` since their previous
+    match, including their matches in other tournaments. Knockout, playoff and swiss matches
+    depend on the results of the earlier stages, so they start only after those stages are
+    over. Matches already scheduled, or decided, are kept as they are; those without a court
+    are given one, so they take up court capacity too. Conflicts are looked up in an
+    `IntervalIndex`, in O(log n). `courts` and `rest_minutes` are stored on the tournament,
+    so that `update_match_date` applies the same rules to a match moved later.
 
+    Args:
+        tournament_id (UUID): The unique identifier of the tournament.
+        db_session (Session): The database session used for querying and committing changes.
+        slot_minutes (int): The length of a match slot.
+        courts (int): How many matches can be played at the same time.
+        rest_minutes (int): The minimum time between two matches of a player.
 
-def randomize_players(tournament: Tournament) -> tuple[list[UUID], list[UUID]]:
+    Returns:
+        list[Match]: All matches of the tournament ordered by start time and court.
+
+    Raises:
+        InvalidRequest: If the tournament has no matches, they do not fit before its end time
+                        or the matches already scheduled need more than `courts` courts.
     """
-    Randomly divide tournament participants into two groups.
+    tournament = get_tournament(db_session=db_session, tournament_id=tournament_id)
+    if not has_matches(tournament):
+        raise InvalidRequest("Tournament doesn't have matches")
+
+    slot = timedelta(minutes=slot_minutes)
+    rest = timedelta(minutes=rest_minutes)
+    busy_players = IntervalIndex()
+    busy_courts = IntervalIndex()
+    stage_ends = {}
+    scheduled = []
+
+    for other in read_busy_matches(
+        db_session,
+        [player.id for player in tournament.participants],
+        tournament.start_time,
+        tournament.end_time,
+        rest,
+        exclude_tournament_id=tournament.id,
+    ):
+        for player_id in (other.player_a_id, other.player_b_id):
+            if player_id is not None:
+                busy_players.add(player_id, other.start_time, other.end_time or other.start_time, other.id)
+
+    def book(match: Match, start_time: datetime, end_time: datetime, court: int | None):
+        for player_id in (match.player_a_id, match.player_b_id):
+            if player_id is not None:
+                busy_players.add(player_id, start_time, end_time, match.id)
+        if court is not None:
+            busy_courts.add(court, start_time, end_time, match.id)
+        stage_ends[match.stage] = max(stage_ends.get(match.stage, end_time), end_time)
+
+    unscheduled = []
+    without_court = []
+    for match in tournament.matches:
+        if match.start_time is None:
+            if match.result_code is None:
+                unscheduled.append(match)
+        elif match.court is None:
+            without_court.append(match)
+        else:
+            book(match, match.start_time, match.end_time or match.start_time, match.court)
+    unscheduled.sort(key=lambda match: (match.stage, match.serial_number))
+
+    for match in sorted(without_court, key=lambda match: match.start_time):
+        end_time = match.end_time or match.start_time
+        court = next(
+            (
+                court
+                for court in range(1, courts + 1)
+                if busy_courts.overlapping(court, match.start_time, end_time) is None
+            ),
+            None,
+        )
+        if court is None:
+            raise InvalidRequest(
+                f"The matches scheduled at {match.start_time} need more than {courts} courts"
+            )
+        book(match, match.start_time, end_time, court)
+        scheduled.append(
+            {
+                "id": match.id,
+                "version": match.version,
+                "start_time": match.start_time,
+                "end_time": match.end_time,
+                "court": court,
+            }
+        )
 
-    The function takes a tournament and splits its participants into two random groups of 
-    equal size. The order of participants in each group is randomized.
+    courts_used = {}
+    first_open_slot = 0
+    for match in unscheduled:
+        earliest = tournament.start_time
+        if _depends_on_previous_stages(tournament, match):
+            earliest = max(
+                [earliest] + [end + rest for stage, end in stage_ends.items() if stage < match.stage]
+            )
+        slot_number = max(first_open_slot, -(-(earliest - tournament.start_time) // slot))
+
+        while True:
+            start_time = tournament.start_time + slot_number * slot
+            end_time = start_time + slot
+            if end_time > tournament.end_time:
+                raise InvalidRequest("Matches don't fit between the tournament start and end time")
+            court = None
+            if courts_used.get(slot_number, 0) < courts and not any(
+                busy_players.overlapping(player_id, start_time - rest, end_time + rest)
+                for player_id in (match.player_a_id, match.player_b_id)
+                if player_id is not None
+            ):
+                court = next(
+                    (
+                        court
+                        for court in range(1, courts + 1)
+                        if busy_courts.overlapping(court, start_time, end_time) is None
+                    ),
+                    None,
+                )
+            if court is not None:
+                break
+            slot_number += 1
+
+        book(match, start_time, end_time, court)
+        courts_used[slot_number] = courts_used.get(slot_number, 0) + 1
+        while courts_used.get(first_open_slot, 0) >= courts:
+            first_open_slot += 1
+        scheduled.append(
+            {
+                "id": match.id,
+                "version": match.version,
+                "start_time": start_time,
+                "end_time": end_time,
+                "court": court,
+            }
+        )
+
+    db_session.bulk_update_mappings(Match, scheduled)
+    tournament.courts = courts
+    tournament.rest_minutes = rest_minutes
+    db_session.commit()
+
+    return (
+        db_session.query(Match)
+        .filter(Match.tournament_id == tournament.id)
+        .order_by(Match.start_time, Match.court)
+        .all()
+    )
+
+
+def read_busy_matches(
+    db_session: Session,
+    players_ids: list[UUID],
+    start_time: datetime,
+    end_time: datetime,
+    rest: timedelta = timedelta(0),
+    tournament_id: UUID | None = None,
+    exclude_match_id: UUID | None = None,
+    exclude_tournament_id: UUID | None = None,
+) -> list:
+    """
+    Retrieve the scheduled matches a match played between `start_time` and `end_time`
+    could clash with.
+
+    These are the matches of the players, in any tournament, within `rest` of the match,
+    and the matches of the tournament `tournament_id` at the same time, which take up its
+    courts. Both are read through the indexes on the end time of the matches of a player
+    or of a court, so only the matches around the window are read. A match without an end
+    time takes no time after its start.
 
     Args:
-        tournament (Tournament): The tournament object containing the participants to be randomized.
-                                 Each participant is expected to have a unique `id`.
+        db_session (Session): The database session.
+        players_ids (list[UUID]): The players of the match.
+        start_time (datetime): The start of the match.
+        end_time (datetime): The end of the match.
+        rest (timedelta): The minimum time between two matches of a player.
+        tournament_id (UUID | None): The tournament whose courts the match uses, if any.
+        exclude_match_id (UUID | None): A match to leave out, e.g. the one being moved.
+        exclude_tournament_id (UUID | None): A tournament whose matches to leave out.
 
     Returns:
-        tuple[list[UUID], list[UUID]]: A tuple containing two lists:
-            - The first list contains the IDs of players in the first group.
-            - The second list contains the IDs of players in the second group.
+        list: The clashing matches, with their id, players, tournament, court and times.
     """
-    players_ids = []
-    for participant in tournament.participants:
-        players_ids.append(participant.id)
+    conditions = [
+        and_(
+            or_(Match.player_a_id.in_(players_ids), Match.player_b_id.in_(players_ids)),
+            _scheduled_between(start_time - rest, end_time + rest),
+        )
+    ]
+    if tournament_id is not None:
+        conditions.append(
+            and_(Match.tournament_id == tournament_id, _scheduled_between(start_time, end_time))
+        )
+
+    criteria = [Match.start_time.isnot(None), or_(*conditions)]
+    if exclude_match_id is not None:
+        criteria.append(Match.id != exclude_match_id)
+    if exclude_tournament_id is not None:
+        criteria.append(
+            or_(Match.tournament_id.is_(None), Match.tournament_id != exclude_tournament_id)
+        )
 
-    random.shuffle(players_ids)
     return (
-        players_ids[: len(tournament.participants) // 2],
-        players_ids[len(tournament.participants) // 2 :],
+        db_session.query(
+            Match.id,
+            Match.player_a_id,
+            Match.player_b_id,
+            Match.tournament_id,
+            Match.court,
+            Match.start_time,
+            Match.end_time,
+        )
+        .filter(*criteria)
+        .all()
     )
 
 
+def _scheduled_between(start_time: datetime, end_time: datetime):
+    return and_(
+        Match.start_time < end_time,
+        or_(
+            Match.end_time > start_time,
+            and_(Match.end_time.is_(None), Match.start_time > start_time),
+        ),
+    )
+
+
+def _depends_on_previous_stages(tournament: Tournament, match: Match) -> bool:
+    if tournament.format.type in ("knockout", "swiss"):
+        return True
+    return tournament.format.type == "groups" and match.group_number is None
+
+
 def get_tournament_format(tournament_id: UUID, db_session: Session) -> str:
     tournament = get_tournament(db_session=db_session, tournament_id=tournament_id)
     return tournament.format.type
@@ -488,17 +844,17 @@ def has_matches(tournament: Tournament) -> bool:
     return bool(tournament.matches)
 
 
-def create_matches(tournament_id: UUID, db_session: Session, current_user: User) -> list[Match]:
+def create_matches(tournament_id: UUID, db_session: Session, current_user: User) -> int:
     """
     Creates matches for the specified tournament based on its format.
 
     Returns:
-        list[Match]: A list of `Match` objects representing all matches for the tournament.
+        int: The number of matches created.
 
     Raises:
         InvalidRequest: If the tournament already has matches.
         InvalidNumberOfPlayers: If the tournament has an invalid number of participants
-                                for the chosen format (e.g., not a power of two for knockout).
+                                for the chosen format (e.g., fewer than three for league).
     """
         
     tournament = get_tournament(db_session=db_session, tournament_id=tournament_id)
@@ -513,114 +869,230 @@ def create_matches(tournament_id: UUID, db_session: Session, current_user: User)
             number_of_players=len(tournament.participants), tournament_format="league"
         )
         matches = _create_league_matches(tournament, db_session, current_user)
+    elif tournament.format.type == "swiss":
+        matches = len(_create_swiss_matches(tournament, db_session, current_user))
+    elif tournament.format.type == "groups":
+        matches = _create_groups_matches(tournament, db_session, current_user)
     
     return matches
 
 
-def _create_match(
-    db_session: Session,
-    tournament: Tournament,
-    current_user: User,
-    player_a_id: UUID | None = None,
-    player_b_id: UUID | None = None,
-    stage: int | None = None,
-    serial_number: int | None = None,
-    start_time: datetime | None = None,
-    end_time: datetime | None = None,
-):
-    match = Match(
+def _create_knockout_matches(
+    tournament: Tournament, db_session: Session, current_user: User
+) -> int:
+    """
+    Create matches for a knockout tournament.
+
+    The participants are seeded (see `seed_players`) and placed in the bracket in standard
+    seeding order, so the strongest players cannot meet before the late stages. Any number
+    of participants from two up is supported: the bracket is padded with byes which go to
+    the top seeds, who enter directly in the second stage.
+
+    With `lazy_bracket` only the matches whose players are known are created: the first
+    stage and the second stage matches of the players with a bye. Every other match is
+    created by `create_next_knockout_match` once both matches feeding it are decided.
+
+    Returns:
+        int: The number of matches created.
+    """
+        
+    if not tournament.valid_number_of_players:
+        raise InvalidNumberOfPlayers(
+            number_of_players=len(tournament.participants), tournament_format="knockout"
+        )
+
+    players_ids = [player.id for player in seed_players(tournament.participants)]
+    fixtures = build_knockout_bracket(players_ids)
+    if tournament.lazy_bracket:
+        fixtures = [
+            {**fixture, "next_match_id": None}
+            for fixture in fixtures
+            if fixture["player_a_id"] is not None or fixture["player_b_id"] is not None
+        ]
+
+    return _insert_matches(db_session, tournament, current_user, fixtures)
+
+
+def create_next_knockout_match(
+    db_session: Session, tournament: Tournament, match: Match
+) -> Match | None:
+    """
+    Move the winner of a decided match of a lazy bracket into the next stage.
+
+    The next match is found from the bracket structure (next stage, half the serial number).
+    If it already exists, which happens only next to a bye, the winner takes its slot. Otherwise
+    it is created once the sibling match is decided too, with both winners. The caller commits.
+
+    Returns:
+        Match | None: The next match, or None if it cannot be created yet or `match` is the final.
+    """
+    if match.stage + 1 >= tournament.num_stages:
+        return None
+
+    next_match = (
+        db_session.query(Match)
+        .filter(
+            Match.tournament_id == tournament.id,
+            Match.stage == match.stage + 1,
+            Match.serial_number == match.serial_number // 2,
+        )
+        .first()
+    )
+    if next_match is not None:
+        if match.serial_number % 2 == 0:
+            next_match.player_a_id = match_winner_id(match)
+        else:
+            next_match.player_b_id = match_winner_id(match)
+        return next_match
+
+    sibling = (
+        db_session.query(Match)
+        .filter(
+            Match.tournament_id == tournament.id,
+            Match.stage == match.stage,
+            Match.serial_number == match.serial_number ^ 1,
+        )
+        .first()
+    )
+    if sibling is None or match_winner_id(sibling) is None:
+        return None
+
+    winners = {
+        match.serial_number % 2: match_winner_id(match),
+        sibling.serial_number % 2: match_winner_id(sibling),
+    }
+    next_match = Match(
         format_id=tournament.match_format_id,
-        player_a_id=player_a_id,
-        player_b_id=player_b_id,
+        player_a_id=winners[0],
+        player_b_id=winners[1],
         score_a=0,
         score_b=0,
-        start_time=start_time,
-        end_time=end_time,
-        author_id=current_user.id,
+        author_id=match.author_id,
         tournament_id=tournament.id,
-        stage=stage,
-        serial_number=serial_number,
+        stage=match.stage + 1,
+        serial_number=match.serial_number // 2,
     )
-    db_session.add(match)
-    db_session.commit()
-    db_session.refresh(match)
-    return match
+    db_session.add(next_match)
+    return next_match
 
 
-def calculate_stages(tournament: Tournament) -> int:
-    total_players = len(tournament.participants)
-    stages = 0
-    while total_players > 1:
-        stages += 1
-        total_players = total_players // 2
+def match_winner_id(match: Match) -> UUID | None:
+    """
+    Return the id of the player who won the match, or None if it is undecided or a draw.
+    """
+    if match.result_code == 1:
+        return match.player_a_id
+    if match.result_code == 2:
+        return match.player_b_id
+    return None
 
-    return stages
 
+def seed_players(players: Iterable[Player]) -> list[Player]:
+    """
+    Order players from the strongest to the weakest for seeding.
 
-def _create_knockout_matches(
-    tournament: Tournament, db_session: Session, current_user: User
-) -> list[Match]:
+    Players are ranked by rating; ties are broken randomly.
     """
-    Create matches for a knockout tournament.
+    seeded = list(players)
+    random.shuffle(seeded)
+    seeded.sort(key=lambda player: -(player.rating if player.rating is not None else INITIAL_RATING))
+    return seeded
 
-    The function generates Matches for a knockout tournament,
-    organizing matches in a tree-like structure where winners progress to the next round.
 
-    Returns:
-        list[Match]: A list of `Match` objects representing all the matches in the knockout tournament.
+def seeding_order(bracket_size: int) -> list[int]:
     """
-        
-    if not validate_number_of_players(tournament):
-        raise InvalidNumberOfPlayers(
-            number_of_players=len(tournament.participants), tournament_format="knockout"
-        )
+    Return the standard seeding order of a bracket with `bracket_size` slots (a power of two).
 
-    all_matches = []
-    players_group_1, players_group_2 = randomize_players(tournament)
-    all_stages = calculate_stages(tournament)
-    stage = 0
-    serial_number = 0
-    for player_a_id, player_b_id in zip(players_group_1, players_group_2):
-        temp_match = _create_match(
-            db_session,
-            tournament,
-            current_user,
-            player_a_id,
-            player_b_id,
-            stage,
-            serial_number,
-        )
-        serial_number += 1
-        all_matches.append(temp_match)
-
-    number_of_stage_matches = len(tournament.participants) // 2
-    for stage in range(1, all_stages):
-        number_of_stage_matches = number_of_stage_matches // 2
-        for serial_number in range(number_of_stage_matches):
-            temp_match = _create_match(
-                db_session,
-                tournament,
-                current_user,
-                stage=stage,
-                serial_number=serial_number,
+    Seeds are zero-based and listed in bracket order, e.g. [0, 7, 3, 4, 1, 6, 2, 5] for eight
+    slots: seed 0 and seed 1 can only meet in the final, the top four only in the semi-finals
+    and so on. Each doubling pairs every seed `s` with `size - 1 - s`, so the whole order is
+    built in O(n).
+    """
+    order = [0]
+    while len(order) < bracket_size:
+        size = len(order) * 2
+        order = [seed for top_seed in order for seed in (top_seed, size - 1 - top_seed)]
+
+    return order
+
+
+def build_knockout_bracket(entrants: list) -> list[dict]:
+    """
+    Build the complete bracket tree for `entrants`, ordered from the strongest seed.
+
+    The bracket has the next power-of-two number of slots and the missing entrants are byes.
+    A first stage match against a bye is not created; its entrant is placed straight into
+    the second stage match. Match ids are assigned up front so every match carries the id of
+    the match its winner advances to (`next_match_id`), with the slot given by the parity
+    of its serial number. The tree is built in O(n).
+
+    Args:
+        entrants (list): The entrants in seeding order, e.g. player ids.
+
+    Returns:
+        list[dict]: `Match` column values, from the final back to the first stage, so that
+        every match comes after the match it feeds into.
+    """
+    num_entrants = len(entrants)
+    num_stages = (num_entrants - 1).bit_length()
+    bracket_size = 1 << num_stages
+    slots = [
+        entrants[seed] if seed < num_entrants else None
+        for seed in seeding_order(bracket_size)
+    ]
+
+    matches_ids = [
+        [uuid7() for _ in range(bracket_size >> (stage + 1))]
+        for stage in range(num_stages)
+    ]
+    players = [[[None, None] for _ in stage_ids] for stage_ids in matches_ids]
+    players[0] = [[slots[2 * serial], slots[2 * serial + 1]] for serial in range(bracket_size // 2)]
+
+    byes = set()
+    for serial_number, (player_a, player_b) in enumerate(players[0]):
+        if player_a is None or player_b is None:
+            byes.add(serial_number)
+            players[1][serial_number // 2][serial_number % 2] = player_a if player_b is None else player_b
+
+    fixtures = []
+    for stage in reversed(range(num_stages)):
+        for serial_number, match_id in enumerate(matches_ids[stage]):
+            if stage == 0 and serial_number in byes:
+                continue
+            player_a, player_b = players[stage][serial_number]
+            fixtures.append(
+                {
+                    "id": match_id,
+                    "player_a_id": player_a,
+                    "player_b_id": player_b,
+                    "stage": stage,
+                    "serial_number": serial_number,
+                    "next_match_id": (
+                        matches_ids[stage + 1][serial_number // 2]
+                        if stage + 1 < num_stages
+                        else None
+                    ),
+                }
             )
-            all_matches.append(temp_match)
 
-    return all_matches
+    return fixtures
 
 
 def _create_league_matches(
     tournament: Tournament, db_session: Session, current_user: User
-) -> list[Match]:
+) -> int:
     """
     Generate league matches for a tournament.
 
     The function creates Matches for a league tournament, ensuring that:
     - Every participant plays against every other participant exactly once.
-    - Matches are organized into stages (rounds), where each player participates in one match per stage.
+    - Matches are organized into stages (rounds), where each player participates in at most one match per stage.
+    - With an odd number of participants one player per stage has a bye.
+
+    The fixtures are generated lazily and inserted in batches with a single commit.
 
     Returns:
-        list[Match]: A list of `Match` objects representing all the league matches.
+        int: The number of matches created.
     """
 
     if len(tournament.participants) < 3:
@@ -631,180 +1103,691 @@ def _create_league_matches(
     players_ids = [participant.id for participant in tournament.participants]
 
     random.shuffle(players_ids)
-    all_staged_matches = split_in_stages(players_ids)
-    all_matches = []
-    for stage, staged_matches in enumerate(all_staged_matches):
-        for serial_number, pair in enumerate(staged_matches):
-            temp_match = _create_match(
-                db_session,
-                tournament,
-                current_user,
-                player_a_id=pair[0],
-                player_b_id=pair[1],
-                stage=stage,
-                serial_number=serial_number,
-            )
-            all_matches.append(temp_match)
+    fixtures = (
+        {
+            "player_a_id": player_a_id,
+            "player_b_id": player_b_id,
+            "stage": stage,
+            "serial_number": serial_number,
+        }
+        for stage, staged_matches in enumerate(round_robin_stages(players_ids))
+        for serial_number, (player_a_id, player_b_id) in enumerate(staged_matches)
+    )
 
-    return all_matches
+    return _insert_matches(db_session, tournament, current_user, fixtures)
 
 
-def split_in_stages(players_ids: list[UUID]) -> list[list[tuple[str, str]]]:
+def _insert_matches(
+    db_session: Session,
+    tournament: Tournament,
+    current_user: User,
+    fixtures: Iterable[dict],
+    batch_size: int = 1000,
+) -> int:
     """
-    Split player pairs into stages.
-    https://medium.com/moove-it/algorithm-for-the-generation-of-a-soccer-or-any-sport-or-event-fixture-c9798732121d
+    Insert the matches described by `fixtures` in batches and commit once.
 
-    The function organizes player pairs into a specified number of stages, ensuring that:
-    - Each player participates in one match per stage.
-    - All players play against every other player exactly once across all stages.
+    Each fixture is a dictionary of `Match` column values (see `FIXTURE_COLUMNS`); the
+    tournament, author, match format and initial score are filled in here. The fixtures are
+    consumed lazily and every batch is written with one executemany of a core INSERT, so
+    no `Match` objects are built and memory stays bounded by `batch_size`, whatever the
+    number of fixtures. Fixtures linked through `next_match_id` carry their ids already.
 
     Returns:
-        list[list[tuple[str, str]]]: A list where each element represents a stage, 
-        containing the matches (pairs of players) for that stage.
+        int: The number of matches inserted.
+    """
+    statement = Match.__table__.insert()
+    defaults = {
+        "format_id": tournament.match_format_id,
+        "score_a": 0,
+        "score_b": 0,
+        "author_id": current_user.id,
+        "tournament_id": tournament.id,
+    }
+    inserted = 0
+    batch = []
+    for fixture in fixtures:
+        row = {column: fixture.get(column) for column in FIXTURE_COLUMNS}
+        row["id"] = row["id"] or uuid7()
+        row.update(defaults)
+        batch.append(row)
+        if len(batch) >= batch_size:
+            db_session.execute(statement, batch)
+            inserted += len(batch)
+            batch = []
+    if batch:
+        db_session.execute(statement, batch)
+        inserted += len(batch)
+    db_session.commit()
+
+    return inserted
+
+
+def round_robin_stages(
+    players_ids: list[UUID],
+) -> Iterator[list[tuple[UUID, UUID]]]:
+    """
+    Lazily generate a round-robin schedule with the circle method.
+
+    One player is kept fixed and the others rotate around the circle, so the opponents of
+    every stage are computed arithmetically from the stage number instead of being moved
+    around in lists. The guarantees are:
+    - Every player meets every other player exactly once.
+    - Each player plays at most one match per stage.
+    - With an odd number of players a bye is added, and whoever is paired with it sits the stage out.
+    - Home and away (first and second player of a pair) alternate, so every player is at home
+      in half of their matches (+/- one) and never more than two stages in a row.
+
+    Yields:
+        list[tuple[UUID, UUID]]: The matches (home player, away player) of one stage.
     """
-    num_players = len(players_ids)
-    num_stages = num_players - 1
-    num_matches_per_stage = num_players // 2
-    all_matches = []
-    last_player = players_ids[-1]
-    for stage in range(num_stages):
+    players = list(players_ids)
+    if len(players) % 2:
+        players.append(None)
+
+    num_players = len(players)
+    num_rotating = num_players - 1
+    fixed_player = players[-1]
+    rotating_players = players[:-1]
+
+    for stage in range(num_rotating):
         stage_matches = []
-        stage_players = []
-        if stage == 0:
-            for i in range(num_matches_per_stage):
-                pair = (players_ids[i], players_ids[-1-i])
-                stage_matches.append(pair)
-                stage_players.extend(pair)
-        else:
-            previous_stage_last_player = previous_stage_players.pop()
-            previous_stage_players.remove(last_player)
-            if stage // 2 == 0:
-                pair = (previous_stage_last_player, last_player)
+
+        opponent = rotating_players[stage]
+        if fixed_player is not None:
+            if stage % 2:
+                stage_matches.append((fixed_player, opponent))
+            else:
+                stage_matches.append((opponent, fixed_player))
+
+        for offset in range(1, num_players // 2):
+            player_a = rotating_players[(stage + offset) % num_rotating]
+            player_b = rotating_players[(stage - offset) % num_rotating]
+            if player_a is None or player_b is None:
+                continue
+            if offset % 2:
+                stage_matches.append((player_a, player_b))
             else:
-                pair = (last_player, previous_stage_last_player)
-            stage_matches.append(pair)
-            stage_players.extend(pair)
-            while previous_stage_players:
-                player_b = previous_stage_players.pop()
-                player_a = previous_stage_players.pop()
-                pair = (player_a, player_b)
-                stage_matches.append(pair)
-                stage_players.extend(pair)
+                stage_matches.append((player_b, player_a))
 
-        previous_stage_players = stage_players
-        all_matches.append(stage_matches)
+        yield stage_matches
 
-    return all_matches
 
+def split_in_stages(players_ids: list[UUID]) -> list[list[tuple[UUID, UUID]]]:
+    """
+    Split the players of a league into stages.
 
-def split_in_stages_old(
-    player_pairs: list[tuple[str, str]], num_players: int
-) -> list[list[tuple[str, str]]]:
+    Returns:
+        list[list[tuple[UUID, UUID]]]: A list where each element represents a stage,
+        containing the matches (pairs of players) for that stage.
     """
-    Split player pairs into stages.
+    return list(round_robin_stages(players_ids))
 
-    The function organizes player pairs into a specified number of stages, ensuring that:
-    - Each player participates in one match per stage.
-    - All players play against every other player exactly once across all stages.
+
+def _create_swiss_matches(
+    tournament: Tournament, db_session: Session, current_user: User
+) -> list[Match]:
+    """
+    Create the first round of a swiss tournament.
+
+    Each round is paired from the standings after the previous one, so only the first
+    round is created here; the following rounds are created by `create_next_round`.
 
     Returns:
-        list[list[tuple[str, str]]]: A list where each element represents a stage, 
-        containing the matches (pairs of players) for that stage.
+        list[Match]: A list of `Match` objects representing the matches of the first round.
     """
 
-    num_stages = num_players - 1
-    num_matches_per_stage = num_players // 2
-    all_matches = []
-    for _ in range(num_stages):
-        stage_matches = []
-        while len(stage_matches) < num_matches_per_stage:
-            players_in_stage = set()
-            while stage_matches:
-                player_pairs.append(stage_matches.pop())
-            random.shuffle(player_pairs)
-            for _ in range(num_matches_per_stage):
-                for player_a, player_b in player_pairs.copy():
-                    if player_a in players_in_stage or player_b in players_in_stage:
-                        continue
-                    stage_matches.append((player_a, player_b))
-                    players_in_stage.add(player_a)
-                    players_in_stage.add(player_b)
-                    player_pairs.remove((player_a, player_b))
-                    break
+    if not tournament.valid_number_of_players:
+        raise InvalidNumberOfPlayers(
+            number_of_players=len(tournament.participants), tournament_format="swiss"
+        )
 
-        all_matches.append(stage_matches)
+    return _create_swiss_round(tournament, db_session, current_user, stage=0)
 
-    return all_matches
 
+def create_next_round(tournament_id: UUID, db_session: Session, current_user: User) -> list[Match]:
+    """
+    Create the next round of a swiss tournament once the current round is finished,
+    or draw the playoff of a groups tournament once its group stage is finished.
 
-def get_combinations(players: list[str]) -> list[tuple[str, str]]:
+    Returns:
+        list[Match]: A list of `Match` objects representing the matches of the new round.
+
+    Raises:
+        InvalidRequest: If the tournament is not a swiss or groups tournament, has no matches yet,
+                        its current round is not finalized or all its rounds are played.
     """
-    Generate all possible pair combinations from a list of players.
+    tournament = get_tournament(db_session=db_session, tournament_id=tournament_id)
+    if tournament.format.type not in ("swiss", "groups"):
+        raise InvalidRequest("Only swiss and groups tournaments are played round by round")
+    if not has_matches(tournament):
+        raise InvalidRequest("Tournament doesn't have matches")
+    if tournament.format.type == "groups":
+        return _draw_playoff(tournament, db_session)
+
+    current_stage = max(match.stage for match in tournament.matches)
+    if not all(
+        is_decided(match) for match in tournament.matches if match.stage == current_stage
+    ):
+        raise InvalidRequest("Current round is not finished")
+    if current_stage + 1 >= tournament.num_stages:
+        raise InvalidRequest("All rounds of the tournament are played")
+
+    return _create_swiss_round(tournament, db_session, current_user, stage=current_stage + 1)
+
+
+def is_decided(match: Match) -> bool:
+    """
+    Whether the result of a match is counted in the tournament standings.
+
+    A score entered without finalizing the match has a result code, but no points in the
+    standings yet, so only finalized matches and byes (decided when they are created,
+    without a second player) count.
+    """
+    return match.finalized_at is not None or (match.player_b_id is None and match.result_code is not None)
+
+
+def _create_swiss_round(
+    tournament: Tournament, db_session: Session, current_user: User, stage: int
+) -> list[Match]:
+    """
+    Pair and insert one round of a swiss tournament.
 
-    The function returns a list of all unique pairs (2-player combinations) 
-    that can be formed from the given list of players. Each pair is represented as a tuple.
+    Players are ranked with `swiss_ranking`. A bye is stored as an already decided match
+    without a second player, and the player who gets it is awarded the win points.
 
     Returns:
-        list[tuple[str, str]]: A list of tuples, where each tuple represents a unique pair of players.
+        list[Match]: A list of `Match` objects representing the matches of the round.
     """
-    return list(combinations(players, 2))
+    scores = dict(
+        db_session.query(TournamentParticipants.player_id, TournamentParticipants.score)
+        .filter(TournamentParticipants.tournament_id == tournament.id)
+        .all()
+    )
 
+    pairs, bye = pair_swiss_round(
+        swiss_ranking(scores, tournament.matches),
+        [(match.player_a_id, match.player_b_id) for match in tournament.matches],
+    )
 
-def delete_tournament(db_session, tournament_id):
-        tournament = get_tournament(db_session, tournament_id)
+    fixtures = [
+        {
+            "player_a_id": player_a_id,
+            "player_b_id": player_b_id,
+            "stage": stage,
+            "serial_number": serial_number,
+        }
+        for serial_number, (player_a_id, player_b_id) in enumerate(pairs)
+    ]
+    if bye is not None:
+        fixtures.append(
+            {
+                "player_a_id": bye,
+                "player_b_id": None,
+                "stage": stage,
+                "serial_number": len(pairs),
+                "result_code": 1,
+            }
+        )
+        db_session.query(TournamentParticipants).filter(
+            TournamentParticipants.tournament_id == tournament.id,
+            TournamentParticipants.player_id == bye,
+        ).update(
+            {TournamentParticipants.score: TournamentParticipants.score + (tournament.win_points or 0)},
+            synchronize_session=False,
+        )
 
-        db_session.delete(tournament)
-        db_session.commit()
+    _insert_matches(db_session, tournament, current_user, fixtures)
+    return (
+        db_session.query(Match)
+        .filter(Match.tournament_id == tournament.id, Match.stage == stage)
+        .order_by(Match.serial_number)
+        .all()
+    )
 
 
-def get_all_players(db: Session) -> list[Player]:
-    players = db.query(Player).order_by(Player.first_name).all()
-    
+def swiss_ranking(scores: dict[UUID, int], matches: Iterable[Match]) -> list[UUID]:
+    """
+    Rank the players of a swiss tournament using only the tournament's own matches.
+
+    Players are ranked by their tournament score, then by their Buchholz score (the sum of
+    the scores of the opponents they played), then by their wins and fewest losses in the
+    tournament, with the remaining ties broken randomly. A bye counts as a win, without an
+    opponent.
+
+    Args:
+        scores (dict[UUID, int]): The tournament score of every player.
+        matches (Iterable[Match]): The matches of the tournament; only decided ones count.
+
+    Returns:
+        list[UUID]: The players, first place first.
+    """
+    buchholz = dict.fromkeys(scores, 0)
+    wins = dict.fromkeys(scores, 0)
+    losses = dict.fromkeys(scores, 0)
+    for match in matches:
+        if not is_decided(match):
+            continue
+        player_a, player_b = match.player_a_id, match.player_b_id
+        if match.result_code == 1:
+            wins[player_a] = wins.get(player_a, 0) + 1
+            if player_b is not None:
+                losses[player_b] = losses.get(player_b, 0) + 1
+        elif match.result_code == 2:
+            wins[player_b] = wins.get(player_b, 0) + 1
+            losses[player_a] = losses.get(player_a, 0) + 1
+        if player_b is not None:
+            buchholz[player_a] = buchholz.get(player_a, 0) + (scores.get(player_b) or 0)
+            buchholz[player_b] = buchholz.get(player_b, 0) + (scores.get(player_a) or 0)
+
+    players = list(scores)
+    random.shuffle(players)
+    players.sort(
+        key=lambda player: (-(scores[player] or 0), -buchholz[player], -wins[player], losses[player])
+    )
+    return players
+
+
+def pair_swiss_round(
+    ranking: list[UUID], played: Iterable[tuple[UUID, UUID | None]]
+) -> tuple[list[tuple[UUID, UUID]], UUID | None]:
+    """
+    Pair one round of a swiss tournament without rematches.
+
+    `ranking` lists the players from the highest score down, so every score group is a
+    run of adjacent players. Each player is paired with the best ranked player they have
+    not met yet, which keeps pairs inside their score group and lets the odd player of a
+    group float down to the next one. The players already met are kept as one bitset
+    (a Python int) per player, so finding an opponent takes a few bitwise operations.
+    When the greedy choices leave the last players unpairable, the pairing backtracks.
+    With an odd number of players the lowest ranked player without a bye gets one.
+
+    Args:
+        ranking (list[UUID]): The players, ordered by their standing.
+        played (Iterable[tuple[UUID, UUID | None]]): The pairs that already played;
+            a pair without a second player is a bye.
+
+    Returns:
+        tuple[list[tuple[UUID, UUID]], UUID | None]: The pairs (higher ranked player first)
+        and the player with the bye, if any.
+
+    Raises:
+        InvalidRequest: If the players cannot be paired without a rematch.
+    """
+    positions = {player: position for position, player in enumerate(ranking)}
+    opponents = [0] * len(ranking)
+    had_bye = set()
+    for player_a, player_b in played:
+        position_a = positions.get(player_a)
+        if position_a is None:
+            continue
+        if player_b is None:
+            had_bye.add(position_a)
+            continue
+        position_b = positions.get(player_b)
+        if position_b is None:
+            continue
+        opponents[position_a] |= 1 << position_b
+        opponents[position_b] |= 1 << position_a
+
+    everyone = (1 << len(ranking)) - 1
+    if len(ranking) % 2:
+        candidates = [position for position in reversed(range(len(ranking))) if position not in had_bye]
+    else:
+        candidates = [None]
+
+    for bye in candidates:
+        unpaired = everyone if bye is None else everyone & ~(1 << bye)
+        pairs = _pair_without_rematches(opponents, unpaired)
+        if pairs is not None:
+            return (
+                [(ranking[position_a], ranking[position_b]) for position_a, position_b in pairs],
+                None if bye is None else ranking[bye],
+            )
+
+    raise InvalidRequest("Players cannot be paired without a rematch")
+
+
+def _pair_without_rematches(opponents: list[int], unpaired: int) -> list[tuple[int, int]] | None:
+    """
+    Pair the positions set in the `unpaired` bitset, avoiding the bits set in `opponents`.
+
+    The best ranked unpaired position always takes the best ranked allowed opponent. The
+    choices are kept on a stack, so a dead end resumes from the latest choice with its
+    next opponent instead of starting over.
+
+    Returns:
+        list[tuple[int, int]] | None: The paired positions, or None if no pairing exists.
+    """
+    choices = []
+    remaining = None
+    while unpaired:
+        position = (unpaired & -unpaired).bit_length() - 1
+        if remaining is None:
+            remaining = unpaired & ~opponents[position] & ~(1 << position)
+        if remaining:
+            opponent = remaining & -remaining
+            choices.append((position, opponent, remaining ^ opponent))
+            unpaired &= ~((1 << position) | opponent)
+            remaining = None
+            continue
+        if not choices:
+            return None
+        position, opponent, remaining = choices.pop()
+        unpaired |= (1 << position) | opponent
+
+    return [(position, opponent.bit_length() - 1) for position, opponent, _ in choices]
+
+
+def _create_groups_matches(
+    tournament: Tournament, db_session: Session, current_user: User
+) -> int:
+    """
+    Create the matches of a groups tournament: a round robin in every group, followed
+    by a knockout playoff between the best `group_qualifiers` players of each group.
+
+    The group round robins are played in parallel, stage by stage, and the playoff starts
+    after the longest of them. The playoff bracket is created up front; instead of players
+    its first matches hold the group standings they are drawn from (`source_a`/`source_b`,
+    e.g. "A1" for the winner of group A), which are replaced with players by `create_next_round`
+    once the group stage is finished. Group winners are seeded above the runners-up and the
+    qualifiers are placed by `place_qualifiers`, so players from the same group cannot meet
+    in their first playoff match.
+
+    Returns:
+        int: The number of matches created.
+    """
+
+    if not tournament.valid_number_of_players:
+        raise InvalidNumberOfPlayers(
+            number_of_players=len(tournament.participants), tournament_format="groups"
+        )
+
+    groups = divide_players_into_groups(
+        [player.id for player in seed_players(tournament.participants)],
+        tournament.num_groups,
+    )
+    for group_number, group in enumerate(groups):
+        db_session.query(TournamentParticipants).filter(
+            TournamentParticipants.tournament_id == tournament.id,
+            TournamentParticipants.player_id.in_(group),
+        ).update({TournamentParticipants.group_number: group_number}, synchronize_session=False)
+
+    qualifiers = place_qualifiers(len(groups), tournament.group_qualifiers)
+    playoff = (
+        {
+            "id": fixture["id"],
+            "source_a": fixture["player_a_id"],
+            "source_b": fixture["player_b_id"],
+            "stage": tournament.group_stages + fixture["stage"],
+            "serial_number": fixture["serial_number"],
+            "next_match_id": fixture["next_match_id"],
+        }
+        for fixture in build_knockout_bracket(qualifiers)
+    )
+
+    return _insert_matches(
+        db_session,
+        tournament,
+        current_user,
+        chain(_group_fixtures(groups), playoff),
+    )
+
+
+def place_qualifiers(num_groups: int, group_qualifiers: int) -> list[str]:
+    """
+    Order the group standings that qualify for the playoff for `build_knockout_bracket`.
+
+    The qualifiers are seeded by their position in the group: all group winners, then all
+    runners-up and so on. Within a position the groups follow a rotation or a reversal of
+    the group order, chosen so that no qualifier meets one from its own group in its first
+    playoff match, and so that qualifiers from the same group are as far apart in the
+    bracket as possible; with two qualifiers per group, the winner and the runner-up of a
+    group end up in opposite halves. With a single group this cannot be avoided.
+
+    Args:
+        num_groups (int): The number of groups.
+        group_qualifiers (int): How many players of each group qualify.
+
+    Returns:
+        list[str]: The group standings in seeding order, e.g. ["A1", "B1", "B2", "A2"].
+    """
+    num_entrants = num_groups * group_qualifiers
+    bracket_size = 1 << (num_entrants - 1).bit_length()
+    slots = {seed: slot for slot, seed in enumerate(seeding_order(bracket_size))}
+    opponents = _first_opponents(num_entrants)
+
+    rotations = [
+        [(group_number + shift) % num_groups for group_number in range(num_groups)]
+        for shift in range(num_groups)
+    ]
+    candidates = rotations + [rotation[::-1] for rotation in rotations]
+
+    seed_groups = []
+    group_slots = [[] for _ in range(num_groups)]
+
+    def placement_cost(first_seed: int, order: list[int]) -> tuple[int, int, int]:
+        conflicts = 0
+        meetings = []
+        for seed, group_number in enumerate(order, start=first_seed):
+            opponent = opponents[seed]
+            if opponent is not None and opponent < first_seed and seed_groups[opponent] == group_number:
+                conflicts += 1
+            # The stage at which two slots can meet is the highest bit in which they differ.
+            meetings.extend(
+                (slots[seed] ^ other_slot).bit_length() for other_slot in group_slots[group_number]
+            )
+        return conflicts, -min(meetings, default=0), -sum(meetings)
+
+    for position in range(group_qualifiers):
+        first_seed = position * num_groups
+        order = min(candidates, key=lambda order: placement_cost(first_seed, order))
+        for seed, group_number in enumerate(order, start=first_seed):
+            seed_groups.append(group_number)
+            group_slots[group_number].append(slots[seed])
+
+    return [
+        f"{group_label(group_number)}{seed // num_groups + 1}"
+        for seed, group_number in enumerate(seed_groups)
+    ]
+
+
+def _first_opponents(num_entrants: int) -> list[int | None]:
+    """
+    Return, for every seed of a bracket built by `build_knockout_bracket`, the seed it
+    meets in its first match, or None if that opponent is the winner of another match.
+
+    A seed facing a bye in the first stage meets its second stage opponent first, if that
+    one has a bye too.
+    """
+    bracket_size = 1 << (num_entrants - 1).bit_length()
+    order = seeding_order(bracket_size)
+    slots = {seed: slot for slot, seed in enumerate(order)}
+    opponents = []
+    for seed in range(num_entrants):
+        slot = slots[seed]
+        partner = order[slot ^ 1]
+        if partner < num_entrants:
+            opponents.append(partner)
+            continue
+        # With a bye, the first opponent is the one of the next stage, if it has a bye too.
+        next_pair_slot = (slot ^ 2) & ~1
+        next_pair = [
+            entrant
+            for entrant in order[next_pair_slot:next_pair_slot + 2]
+            if entrant < num_entrants
+        ]
+        opponents.append(next_pair[0] if len(next_pair) == 1 else None)
+
+    return opponents
+
+
+def divide_players_into_groups(players_ids: list[UUID], num_groups: int) -> list[list[UUID]]:
+    """
+    Deal the seeded players into `num_groups` balanced groups.
+
+    The players are dealt in snake order (A, B, C, C, B, A, ...), so every group gets a
+    similar mix of strong and weak players and the group sizes differ by at most one.
+    """
+    groups = [[] for _ in range(num_groups)]
+    for position, player_id in enumerate(players_ids):
+        lap, index = divmod(position, num_groups)
+        groups[index if lap % 2 == 0 else num_groups - 1 - index].append(player_id)
+
+    return groups
+
+
+def group_label(group_number: int) -> str:
+    """
+    Return the letter label of a group: A, B, ..., Z, AA, AB, ...
+    """
+    label = ""
+    group_number += 1
+    while group_number:
+        group_number, letter = divmod(group_number - 1, 26)
+        label = chr(ord("A") + letter) + label
+
+    return label
+
+
+def _group_fixtures(groups: list[list[UUID]]) -> Iterator[dict]:
+    """
+    Lazily generate the round robin fixtures of all groups, stage by stage.
+    """
+    schedules = [round_robin_stages(group) for group in groups]
+    stage = 0
+    while True:
+        stage_fixtures = [
+            (group_number, pair)
+            for group_number, schedule in enumerate(schedules)
+            for pair in next(schedule, [])
+        ]
+        if not stage_fixtures:
+            return
+        for serial_number, (group_number, (player_a_id, player_b_id)) in enumerate(stage_fixtures):
+            yield {
+                "player_a_id": player_a_id,
+                "player_b_id": player_b_id,
+                "stage": stage,
+                "serial_number": serial_number,
+                "group_number": group_number,
+            }
+        stage += 1
+
+
+def group_ranking(
+    points: dict[UUID, int], matches: Iterable[Match], win_points: int, draw_points: int
+) -> list[UUID]:
+    """
+    Order the players of a group by their place in it, using only the group's own matches.
+
+    Players are ordered by their tournament points, then by the points they earned against
+    the players level on points with them (head-to-head), then by their points difference
+    (points scored minus conceded in the group) and their wins in the group, and finally by lot.
+
+    Args:
+        points (dict[UUID, int]): The tournament points of every player of the group.
+        matches (Iterable[Match]): The decided matches of the group.
+        win_points (int): The points of a win.
+        draw_points (int): The points of a draw.
+
+    Returns:
+        list[UUID]: The players of the group, first place first.
+    """
+    head_to_head = dict.fromkeys(points, 0)
+    difference = dict.fromkeys(points, 0)
+    wins = dict.fromkeys(points, 0)
+    for match in matches:
+        player_a, player_b = match.player_a_id, match.player_b_id
+        if player_a not in points or player_b not in points:
+            continue
+        scored = (match.score_a or 0) - (match.score_b or 0)
+        difference[player_a] += scored
+        difference[player_b] -= scored
+        if match.result_code == 1:
+            wins[player_a] += 1
+            earned_a, earned_b = win_points, 0
+        elif match.result_code == 2:
+            wins[player_b] += 1
+            earned_a, earned_b = 0, win_points
+        else:
+            earned_a = earned_b = draw_points
+        if points[player_a] == points[player_b]:
+            head_to_head[player_a] += earned_a
+            head_to_head[player_b] += earned_b
+
+    players = list(points)
+    random.shuffle(players)
+    players.sort(
+        key=lambda player: (
+            -(points[player] or 0),
+            -head_to_head[player],
+            -difference[player],
+            -wins[player],
+        )
+    )
     return players
 
-# def _create_league_matches_with_groups(
-#     tournament: Tournament, db_session: Session, current_user: User
-# ):
-#     if len(tournament.participants) < 3:
-#         raise InvalidNumberOfPlayers(number_of_players=len(tournament.participants))
-#     if len(tournament.participants) >= 8:
-#         groups = divide_players_into_groups(tournament)
-#         all_matches = []
-#         for index, group in enumerate(groups):
-#             group_matches = []
-#             for i in range(len(group)):
-#                 for j in range(i + 1, len(group)):
-#                     # Create a match between players i and j
-#                     temp_match = _create_match(
-#                         db_session,
-#                         tournament,
-#                         current_user,
-#                         player_a_id=group[i],
-#                         player_b_id=group[j],
-#                         stage=index,
-#                         serial_number=i,
-#                     )
-#                     group_matches.append(temp_match)
-#             all_matches.append(group_matches)
-
-#     return all_matches
-
-
-# def divide_players_into_groups(tournament: Tournament) -> list[list[UUID]]:
-#     groups = []
-#     group_size = 4
-#     players_ids = tournament.participants
-#     random.shuffle(players_ids)
-
-#     # Step 1: Divide players into initial groups of 4
-#     for i in range(0, len(players_ids), group_size):
-#         groups.append(players_ids[i : i + group_size])
-
-#     # Step 2: Handle the last group if it has less than 3 players
-#     if len(groups[-1]) < 3:
-#         last_group = groups.pop()  # Remove the last group
-#         # Redistribute players from the last group to earlier groups
-#         for index, player_id in enumerate(last_group):
-#             groups[index].append(player_id)
-
-#     return groups
\ No newline at end of file
+
+def _draw_playoff(tournament: Tournament, db_session: Session) -> list[Match]:
+    """
+    Replace the group standings held by the first playoff matches with the players
+    who finished there, once every group match is finalized.
+
+    Group standings are ordered with `group_ranking`: tournament score, then head-to-head,
+    points difference and wins within the group, then by lot.
+
+    Returns:
+        list[Match]: A list of `Match` objects representing the playoff matches.
+
+    Raises:
+        InvalidRequest: If the group stage is not finished or the playoff is already drawn.
+    """
+    group_matches = [match for match in tournament.matches if match.group_number is not None]
+    playoff_matches = [match for match in tournament.matches if match.group_number is None]
+    if not all(is_decided(match) for match in group_matches):
+        raise InvalidRequest("Group stage is not finished")
+    if any(
+        (match.source_a and match.player_a_id) or (match.source_b and match.player_b_id)
+        for match in playoff_matches
+    ):
+        raise InvalidRequest("Playoff is already drawn")
+
+    groups = {}
+    for player_id, group_number, score in (
+        db_session.query(
+            TournamentParticipants.player_id,
+            TournamentParticipants.group_number,
+            TournamentParticipants.score,
+        )
+        .filter(TournamentParticipants.tournament_id == tournament.id)
+        .all()
+    ):
+        groups.setdefault(group_number, {})[player_id] = score
+
+    positions = {}
+    for group_number, points in groups.items():
+        ranking = group_ranking(
+            points,
+            [match for match in group_matches if match.group_number == group_number],
+            tournament.win_points or 0,
+            tournament.draw_points or 0,
+        )
+        for place, player_id in enumerate(ranking, start=1):
+            positions[f"{group_label(group_number)}{place}"] = player_id
+
+    for match in playoff_matches:
+        if match.source_a:
+            match.player_a_id = positions.get(match.source_a)
+        if match.source_b:
+            match.player_b_id = positions.get(match.source_b)
+    db_session.commit()
+
+    return sorted(playoff_matches, key=lambda match: (match.stage, match.serial_number))
+
+
+def delete_tournament(db_session, tournament_id):
+        tournament = get_tournament(db_session, tournament_id)
+
+        db_session.delete(tournament)
+        db_session.commit()
@@ -1,7 +1,7 @@
 from sqlalchemy.orm import Session
 import logging
 
-from typing import List
+from typing import Dict, List
 import uuid
 
 from src.common.custom_responses import AlreadyExists, NotFound, Unauthorized, BadRequest, ForbiddenAccess
@@ -369,31 +369,77 @@ def delete_user(db: Session, username: str, current_user: User) -> (str | NotFou
     if not user:
         return NotFound(key="Username", key_value=username)
 
-    requests = db.query(Requests).filter(Requests.user_id == user.id).all()
+    _detach_users(db, [user.id], current_user)
 
-    if requests:
-        for request in requests:
-            db.delete(request)
+    db.delete(user)
+    db.commit()
 
-    players = db.query(Player).filter(Player.user_id == user.id).all()
+    return f"User {user.username} successfully deleted"
 
-    if players:
-        for player in players:
-            player.user_id = None
 
-    tournaments = db.query(Tournament).filter(Tournament.author_id == user.id).all()
+def delete_users(db: Session, usernames: List[str], current_user: User) -> (Dict[str, str] |
+                                                                           Unauthorized |
+                                                                           ForbiddenAccess |
+                                                                           BadRequest):
 
-    if tournaments:
-        for tournament in tournaments:
-            tournament.author_id = current_user.id
+    """
+    Delete many users from the database in a single transaction.
 
-    # matches = db.query(Match).filter(Match.author_id == user.id).all()
-    #
-    # if matches:
-    #     for match in matches:
-    #         match.author_id = current_user.id
+    Parameters:
+        db (Session): An instance of the SQLAlchemy Session class.
+        usernames (List[str]): The usernames of the users to delete.
+        current_user (User): The user making the request.
 
-    db.delete(user)
-    db.commit()
+    Returns:
+        Dict[str, str]: The status of every requested username - "Deleted" or "Not Found".
+        Alternatively, an error message if the user is not authorized.
+    """
 
-    return f"User {user.username} successfully deleted"
+    if not current_user:
+        return Unauthorized()
+
+    if not current_user.role == Role.ADMIN:
+        return ForbiddenAccess()
+
+    if current_user.username in usernames:
+        return BadRequest("You cannot delete your own account")
+
+    users = db.query(User.id, User.username).filter(User.username.in_(usernames)).all()
+    found = {user.username: user.id for user in users}
+
+    if found:
+        user_ids = list(found.values())
+        _detach_users(db, user_ids, current_user)
+        db.query(User).filter(User.id.in_(user_ids)).delete(synchronize_session=False)
+        db.commit()
+
+    return {username: "Deleted" if username in found else "Not Found" for username in usernames}
+
+
+def _detach_users(db: Session, user_ids: List[uuid.UUID], current_user: User) -> None:
+
+    """
+    Remove or reassign every row that references the given users, using set-based statements.
+
+    Requests are deleted, linked players are unlinked and authored tournaments are
+    handed over to the current user. Nothing is committed here.
+
+    Parameters:
+        db (Session): An instance of the SQLAlchemy Session class.
+        user_ids (List[uuid.UUID]): The IDs of the users that are about to be deleted.
+        current_user (User): The user making the request.
+    """
+
+    db.query(Requests).filter(Requests.user_id.in_(user_ids)).delete(synchronize_session=False)
+
+    db.query(Player).filter(Player.user_id.in_(user_ids)).update(
+        {Player.user_id: None}, synchronize_session=False
+    )
+
+    db.query(Tournament).filter(Tournament.author_id.in_(user_ids)).update(
+        {Tournament.author_id: current_user.id}, synchronize_session=False
+    )
+
+    # db.query(Match).filter(Match.author_id.in_(user_ids)).update(
+    #     {Match.author_id: current_user.id}, synchronize_session=False
+    # )
@@ -1,5 +1,8 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import random
+
+from sqlalchemy import Delete, Insert, Update, create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
 
 from src.core.config import settings
 from src.models.base import Base
@@ -7,6 +10,8 @@ from src.models.base import Base
 from src.models.tournament import Tournament, TournamentFormat, TournamentParticipants
 from src.models.match import MatchFormat, Match, ResultCodes
 from src.models.player import Player
+from src.models.stats import PlayerStats, HeadToHead, ProjectionState, ConsumedMatch
+from src.models.rating import RatingHistory
 from src.models.user import User
 
 import logging
@@ -17,7 +22,47 @@ engine = create_engine(
     echo=True,
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+replica_engines = [
+    create_engine(url, echo=True) for url in settings.replica_urls
+]
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads to a replica and everything else to the primary.
+
+    Without a `replica` the session behaves like a plain session on the primary. With
+    one, statements go to the replica until the session writes: a flush, an INSERT /
+    UPDATE / DELETE or a `SELECT ... FOR UPDATE`. From then on the session sticks to the
+    primary, so reads inside a write transaction see its own changes. `wrote` tells
+    whether the session has written, for read-your-writes across requests.
+    """
+
+    def __init__(self, *args, replica: Engine | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replica = replica
+        self.wrote = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if (
+            self._flushing
+            or isinstance(clause, (Insert, Update, Delete))
+            or getattr(clause, "_for_update_arg", None) is not None
+        ):
+            self.wrote = True
+        if self.replica is None or self.wrote:
+            return super().get_bind(mapper, clause=clause, **kwargs)
+        return self.replica
+
+
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, bind=engine)
+
+
+def pick_replica() -> Engine | None:
+    """
+    Pick the replica for a read session, or None if there are no replicas.
+    """
+    return random.choice(replica_engines) if replica_engines else None
 
 
 def init_db():
@@ -1,3 +1,6 @@
+import os
+import threading
+import time
 import uuid
 
 from sqlalchemy import Column
@@ -6,6 +9,41 @@ from sqlalchemy.orm import declarative_base, declarative_mixin, declared_attr
 
 Base = declarative_base()
 
+_uuid7_lock = threading.Lock()
+_uuid7_last_ms = 0
+_uuid7_counter = 0
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+
+    The first 48 bits hold the Unix time in milliseconds, so new primary keys are
+    appended to the end of the B-tree index instead of being scattered over it.
+    The 12-bit counter keeps ids generated in the same millisecond increasing.
+    """
+    global _uuid7_last_ms, _uuid7_counter
+
+    with _uuid7_lock:
+        timestamp_ms = time.time_ns() // 1_000_000
+        if timestamp_ms > _uuid7_last_ms:
+            _uuid7_last_ms = timestamp_ms
+            _uuid7_counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            _uuid7_counter += 1
+            if _uuid7_counter > 0xFFF:
+                _uuid7_last_ms += 1
+                _uuid7_counter = 0
+        timestamp_ms = _uuid7_last_ms
+        counter = _uuid7_counter
+
+    value = (timestamp_ms & 0xFFFFFFFFFFFF) << 80
+    value |= 0x7 << 76
+    value |= counter << 64
+    value |= 0b10 << 62
+    value |= int.from_bytes(os.urandom(8), "big") & 0x3FFFFFFFFFFFFFFF
+    return uuid.UUID(int=value)
+
 
 @declarative_mixin
 class BaseMixin:
@@ -18,7 +56,7 @@ class BaseMixin:
         UUID(as_uuid=True),
         primary_key=True,
         index=True,
-        default=uuid.uuid4,
+        default=uuid7,
         unique=True,
         nullable=False,
     )
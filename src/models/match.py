@@ -1,22 +1,30 @@
-from src.models.base import Base
-import uuid
+from src.models.base import Base, uuid7
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
-    String
+    String,
+    func
 )
 from sqlalchemy.orm import relationship
 
 
 class Match(Base):
     __tablename__ = "matches"
+    __table_args__ = (
+        Index("ix_matches_finalized_at_id", "finalized_at", "id"),
+        # Scheduled matches of a player, or of a court of a tournament, still going on after a time.
+        Index("ix_matches_player_a_end_time", "player_a_id", "end_time"),
+        Index("ix_matches_player_b_end_time", "player_b_id", "end_time"),
+        Index("ix_matches_court_end_time", "tournament_id", "court", "end_time"),
+    )
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         unique=True,
         nullable=False,
     )
@@ -35,6 +43,13 @@ class Match(Base):
     tournament_id = Column(UUID, ForeignKey("tournaments.id"))
     stage = Column(Integer)
     serial_number = Column(Integer) 
+    next_match_id = Column(UUID, ForeignKey("matches.id"), nullable=True)
+    group_number = Column(Integer, nullable=True)
+    source_a = Column(String(10), nullable=True)
+    source_b = Column(String(10), nullable=True)
+    court = Column(Integer, nullable=True)
+    finalized_at = Column(DateTime, nullable=True)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
     tournament = relationship("Tournament", back_populates="matches")
     player_a = relationship("Player", foreign_keys=[player_a_id], back_populates="matches_as_a", lazy='select')
@@ -42,6 +57,21 @@ class Match(Base):
     match_format = relationship("MatchFormat", back_populates="matches")
     result = relationship("ResultCodes", back_populates="match")
 
+    __mapper_args__ = {"version_id_col": version}
+
+    @classmethod
+    def player_pair(cls):
+        """
+        The players of the match as an ordered pair, the same whichever side each one played on.
+        """
+        return (
+            func.least(cls.player_a_id, cls.player_b_id, type_=cls.player_a_id.type),
+            func.greatest(cls.player_a_id, cls.player_b_id, type_=cls.player_a_id.type),
+        )
+
+# Matches between two players, newest first (PostgreSQL only, SQLite has no least/greatest).
+Index("ix_matches_player_pair", *Match.player_pair(), Match.start_time, Match.id).ddl_if(dialect="postgresql")
+
 class MatchFormat(Base):
     __tablename__ = "match_format"
     id = Column(
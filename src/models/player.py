@@ -1,33 +1,60 @@
-from src.models.base import Base
-import uuid
+from src.models.base import Base, uuid7
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy import (
     Column,
+    Float,
     ForeignKey,
+    Index,
     Integer,
     String
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
+
+INITIAL_RATING = 1500.0
+
+def player_name_key(first_name: str, last_name: str) -> str:
+    """
+    Build the normalized, case-folded full name used to look players up by name.
+    """
+    return " ".join(f"{first_name} {last_name}".split()).casefold()
+
 
 class Player(Base):
     __tablename__ = "players"
+    __table_args__ = (
+        Index("ix_players_name_key_prefix", "name_key", postgresql_ops={"name_key": "text_pattern_ops"}),
+        Index("ix_players_rating", "rating"),
+    )
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         unique=True,
         nullable=False,
     )
     first_name = Column(String(50), nullable=False)
     last_name = Column(String(50), nullable=False)
+    name_key = Column(String(101), nullable=False, index=True)
     country = Column(String(50), nullable=True)
     team_id = Column(UUID, nullable=True)
+    # Running totals updated with every result, in its transaction, for the tournament
+    # standings tie-breaks. The career statistics are `PlayerStats`, derived from the
+    # finalized matches, which is authoritative when the two disagree.
     matches_played = Column(Integer, default=0, nullable=True)
     wins = Column(Integer, default=0, nullable=True)
     losses = Column(Integer, default=0, nullable=True)
     draws = Column(Integer, default=0, nullable=True)
+    rating = Column(Float, default=INITIAL_RATING, server_default=str(int(INITIAL_RATING)), nullable=False)
     user_id = Column(UUID, ForeignKey("users.id"), nullable=True)
 
     matches_as_a = relationship("Match", foreign_keys="Match.player_a_id", back_populates="player_a", lazy='dynamic')
     matches_as_b = relationship("Match", foreign_keys="Match.player_b_id", back_populates="player_b", lazy='dynamic')
     tournament = relationship("Tournament", secondary="tournament_participants", back_populates="participants")
+
+    @validates("first_name", "last_name")
+    def validate_name(self, key, value):
+        first_name = value if key == "first_name" else self.first_name
+        last_name = value if key == "last_name" else self.last_name
+        if first_name is not None and last_name is not None:
+            self.name_key = player_name_key(first_name, last_name)
+        return value
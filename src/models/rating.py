@@ -0,0 +1,31 @@
+from src.models.base import Base, uuid7
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index
+)
+
+
+class RatingHistory(Base):
+    """
+    Rating of a player before and after one of their finalized matches.
+    """
+    __tablename__ = "rating_history"
+    __table_args__ = (
+        Index("ix_rating_history_player_rated_at", "player_id", "rated_at"),
+    )
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid7,
+        unique=True,
+        nullable=False,
+    )
+    player_id = Column(UUID(as_uuid=True), ForeignKey("players.id", ondelete="CASCADE"), nullable=False)
+    match_id = Column(UUID(as_uuid=True), ForeignKey("matches.id", ondelete="CASCADE"), nullable=False)
+    rating_before = Column(Float, nullable=False)
+    rating_after = Column(Float, nullable=False)
+    rated_at = Column(DateTime, nullable=False)
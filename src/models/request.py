@@ -1,5 +1,4 @@
-from src.models.base import Base
-import uuid
+from src.models.base import Base, uuid7
 from enum import Enum as PyEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy import (
@@ -7,9 +6,10 @@ from sqlalchemy import (
     Column,
     Enum,
     ForeignKey,
-    DateTime
+    DateTime,
+    Index
 )
-from datetime import datetime
+from sqlalchemy.sql import func
 
 from src.models.player import Player
 
@@ -54,11 +54,14 @@ class Requests(Base):
     """
 
     __tablename__ = "requests"
+    __table_args__ = (
+        Index("ix_requests_status_created_at", "status", "created_at"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, unique=True, nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     type = Column(Enum(RequestType, name="request_enum"), nullable=False)
     reason = Column(Text, nullable=False)
-    created_at = Column(DateTime, default=datetime.now(), nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
     status = Column(Enum(RequestStatus, name="request_status_enum"),
                     default=RequestStatus.PENDING, nullable=False)
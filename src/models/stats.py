@@ -0,0 +1,90 @@
+from src.models.base import Base
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String
+)
+
+
+class PlayerStats(Base):
+    """
+    Career statistics of a player, derived from the finalized matches by `src.crud.stats`.
+    They are authoritative over the running totals kept on `Player`, and can always be
+    rebuilt from the matches.
+
+    The `*_rank` columns are the positions of the player on the leaderboard sorted by
+    rating, wins or win rate, recomputed whenever the statistics change.
+    """
+    __tablename__ = "player_stats"
+    player_id = Column(UUID(as_uuid=True), ForeignKey("players.id", ondelete="CASCADE"), primary_key=True)
+    matches_played = Column(Integer, default=0, nullable=False)
+    wins = Column(Integer, default=0, nullable=False)
+    losses = Column(Integer, default=0, nullable=False)
+    draws = Column(Integer, default=0, nullable=False)
+    # Positive for consecutive wins, negative for consecutive losses, 0 after a draw.
+    current_streak = Column(Integer, default=0, nullable=False)
+    longest_win_streak = Column(Integer, default=0, nullable=False)
+    longest_loss_streak = Column(Integer, default=0, nullable=False)
+    win_rate = Column(Float, default=0.0, nullable=False)
+    last_match_at = Column(DateTime, nullable=True)
+    rating_rank = Column(Integer, nullable=True, index=True)
+    wins_rank = Column(Integer, nullable=True, index=True)
+    win_rate_rank = Column(Integer, nullable=True, index=True)
+
+
+# The leaderboard orders, to find the nearest players of a changed player when re-ranking.
+Index("ix_player_stats_wins_order", PlayerStats.wins.desc(), PlayerStats.win_rate.desc(), PlayerStats.player_id)
+Index(
+    "ix_player_stats_win_rate_order",
+    PlayerStats.win_rate.desc(),
+    PlayerStats.matches_played.desc(),
+    PlayerStats.player_id,
+)
+
+
+class HeadToHead(Base):
+    """
+    Record of a player against one opponent. Every pair is stored from both sides.
+    """
+    __tablename__ = "head_to_head"
+    player_id = Column(UUID(as_uuid=True), ForeignKey("players.id", ondelete="CASCADE"), primary_key=True)
+    opponent_id = Column(UUID(as_uuid=True), ForeignKey("players.id", ondelete="CASCADE"), primary_key=True)
+    matches_played = Column(Integer, default=0, nullable=False)
+    wins = Column(Integer, default=0, nullable=False)
+    losses = Column(Integer, default=0, nullable=False)
+    draws = Column(Integer, default=0, nullable=False)
+    last_match_at = Column(DateTime, nullable=True)
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.matches_played if self.matches_played else 0.0
+
+
+class ProjectionState(Base):
+    """
+    High-water mark of a projection: the latest `finalized_at` it has consumed, and the
+    match it came from.
+    """
+    __tablename__ = "projection_state"
+    name = Column(String(50), primary_key=True)
+    last_finalized_at = Column(DateTime, nullable=True)
+    last_match_id = Column(UUID(as_uuid=True), nullable=True)
+
+
+class ConsumedMatch(Base):
+    """
+    A match a projection consumed less than its safety window behind the high-water mark.
+
+    `finalized_at` is stamped by the application before the commit, so matches do not
+    commit in `finalized_at` order. The projection re-reads the window behind its mark and
+    skips the matches recorded here; older rows are pruned.
+    """
+    __tablename__ = "consumed_matches"
+    projection = Column(String(50), primary_key=True)
+    match_id = Column(UUID(as_uuid=True), primary_key=True)
+    finalized_at = Column(DateTime, nullable=False, index=True)
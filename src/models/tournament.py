@@ -1,5 +1,4 @@
-from src.models.base import Base
-import uuid
+from src.models.base import Base, uuid7
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy import (
     Boolean,
@@ -12,6 +11,7 @@ from sqlalchemy import (
     Text,
 )
 from sqlalchemy.orm import relationship, validates
+from src.models.match import Match
 from sqlalchemy.sql import func
 
 
@@ -20,7 +20,7 @@ class Tournament(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         unique=True,
         nullable=False,
     )
@@ -32,6 +32,13 @@ class Tournament(Base):
     prize = Column(Integer, nullable=False)
     win_points = Column(Integer, nullable=True)
     draw_points = Column(Integer, nullable=True)
+    group_size = Column(Integer, default=4, nullable=True)
+    group_qualifiers = Column(Integer, default=2, nullable=True)
+    lazy_bracket = Column(Boolean, default=False, nullable=False)
+    # Settings of the last schedule, which later changes of a match time must respect too.
+    courts = Column(Integer, nullable=True)
+    rest_minutes = Column(Integer, default=0, nullable=False, server_default="0")
+    version = Column(Integer, nullable=False, default=1, server_default="1")
     author_id = Column(UUID, ForeignKey("users.id"), nullable=False)
 
     matches = relationship(
@@ -43,42 +50,76 @@ class Tournament(Base):
     format = relationship("TournamentFormat", back_populates="tournaments")
     match_format = relationship("MatchFormat", back_populates="tournaments")
 
+    __mapper_args__ = {"version_id_col": version}
+
     def __repr__(self):
         return f"Tournament '{self.name}', start date '{self.start_time}', end date '{self.end_time}')"
     
     @property
     def valid_number_of_players(self) -> bool:
-        if self.format_id == 0:
-            valid_count_players = (4, 8, 16, 32, 64, 128, 256, 512, 1024)
-            return len(self.participants) in valid_count_players
+        if self.format.type in ("knockout", "swiss"):
+            return len(self.participants) >= 2
+        elif self.format.type == "groups":
+            if not self.participants:
+                return False
+            smallest_group = len(self.participants) // self.num_groups
+            return (
+                smallest_group >= 3
+                and self.group_qualifiers < smallest_group
+                and self.num_groups * self.group_qualifiers >= 2
+            )
         else:
-            return len(self.participants) >= 4 and len(self.participants)%2 == 0
+            return len(self.participants) >= 3
+
+    @property
+    def bracket(self) -> list[Match]:
+        """
+        All matches of the tournament ordered by stage and serial number. The knockout
+        matches of a lazy bracket that are not created yet are included as unsaved
+        placeholders, so the full tree can be presented.
+        """
+        matches = sorted(self.matches, key=lambda match: (match.stage, match.serial_number))
+        if self.format.type != "knockout" or not self.lazy_bracket or not self.valid_number_of_players:
+            return matches
+
+        created = {(match.stage, match.serial_number) for match in matches}
+        bracket_size = 1 << self.num_stages
+        placeholders = [
+            Match(stage=stage, serial_number=serial_number, score_a=0, score_b=0)
+            for stage in range(1, self.num_stages)
+            for serial_number in range(bracket_size >> (stage + 1))
+            if (stage, serial_number) not in created
+        ]
+        return sorted(matches + placeholders, key=lambda match: (match.stage, match.serial_number))
+
+    @property
+    def num_groups(self) -> int:
+        return -(-len(self.participants) // self.group_size)
+
+    @property
+    def group_stages(self) -> int:
+        largest_group = -(-len(self.participants) // self.num_groups)
+        return largest_group - 1 + largest_group % 2
     
     @property
     def num_stages(self) -> int:
-        if self.format_id == 0:
-            if self.valid_number_of_players:
-                total_players = len(self.participants)
-                stages = 0
-                while total_players > 1:
-                    stages += 1
-                    total_players = total_players // 2
-                return stages
-            else:
-                return 0
+        if not self.valid_number_of_players:
+            return 0
+        if self.format.type in ("knockout", "swiss"):
+            return (len(self.participants) - 1).bit_length()
+        elif self.format.type == "groups":
+            return self.group_stages + (self.num_groups * self.group_qualifiers - 1).bit_length()
         else:
-            if self.valid_number_of_players:
-                return len(self.participants) - 1
-            else:
-                return 0
+            return len(self.participants) - 1 + len(self.participants) % 2
 
 
 class TournamentParticipants(Base):
     __tablename__ = "tournament_participants"
     tournament_id = Column(UUID, ForeignKey("tournaments.id"), primary_key=True)
     player_id = Column(UUID, ForeignKey("players.id"), primary_key=True)
-    score = Column(Integer, nullable=True)
+    score = Column(Integer, default=0, nullable=True)
     stage = Column(String(50), nullable=True)
+    group_number = Column(Integer, nullable=True)
 
 
 class TournamentFormat(Base):
@@ -1,5 +1,4 @@
-from src.models.base import Base
-import uuid
+from src.models.base import Base, uuid7
 from enum import Enum as PyEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy import (
@@ -29,7 +28,7 @@ class User(Base):
     """
 
     __tablename__ = "users"
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, unique=True, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, unique=True, nullable=False)
     username = Column(String(50), unique=True, nullable=False)
     password = Column(String)
     email = Column(String(50), unique=True, nullable=False)
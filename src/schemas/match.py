@@ -1,6 +1,6 @@
 from datetime import datetime, timedelta
-from pydantic import BaseModel, Field, field_validator, FieldValidationInfo
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator, FieldValidationInfo
+from typing import List, Optional
 import uuid
 
 class CreateMatchRequest(BaseModel):
@@ -106,6 +106,12 @@ class MatchResult(BaseModel):
             raise ValueError("Result must be 'player 1', 'player 2', or 'draw'")
         return value
 
+class MatchScoreEntry(MatchResult):
+    match_id: uuid.UUID = Field(description="Match ID")
+
+class BatchMatchResults(BaseModel):
+    results: List[MatchScoreEntry] = Field(description="Results of the matches to update")
+
 class MatchUpdateTime(BaseModel):
     start_time: datetime = Field(examples=["Format must be 'YYYY/MM/DD HH:MM'"], description="Updated match start time")
     end_time: Optional[datetime] = Field(examples=["Format must be 'YYYY/MM/DD HH:MM'"], description="Updated match end time")
@@ -148,3 +154,30 @@ class MatchResponse(CreateMatchRequest):
     tournament_id: Optional[uuid.UUID]
     stage: Optional[int]
     serial_number: Optional[int]
+
+
+class MatchOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    format_id: int
+    end_condition: Optional[int] = None
+    player_a_id: Optional[uuid.UUID] = None
+    player_b_id: Optional[uuid.UUID] = None
+    score_a: Optional[int] = None
+    score_b: Optional[int] = None
+    result_code: Optional[int] = None
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    prize: Optional[int] = None
+    author_id: Optional[uuid.UUID] = None
+    tournament_id: Optional[uuid.UUID] = None
+    stage: Optional[int] = None
+    serial_number: Optional[int] = None
+    next_match_id: Optional[uuid.UUID] = None
+    group_number: Optional[int] = None
+    source_a: Optional[str] = None
+    source_b: Optional[str] = None
+    court: Optional[int] = None
+    finalized_at: Optional[datetime] = None
+    version: int
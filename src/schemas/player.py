@@ -1,4 +1,5 @@
 from pydantic import BaseModel, Field, field_validator
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 import re
@@ -43,6 +44,13 @@ class PlayerUpdate(BaseModel):
     country: Optional[str] = None
 
 
+class PlayerSuggestion(BaseModel):
+    id: UUID
+    first_name: str
+    last_name: str
+    country: Optional[str] = None
+
+
 class PlayerResponse(CreatePlayerRequest):
     id: Optional[UUID]
     first_name: str
@@ -66,3 +74,66 @@ class ParticipantResponse(CreatePlayerRequest):
     stage: Optional[int] = None
     serial_number: Optional[int] = None
 
+
+class PlayerStatsResponse(BaseModel):
+    player_id: UUID
+    matches_played: int
+    wins: int
+    losses: int
+    draws: int
+    win_rate: float
+    current_streak: int = Field(description="Consecutive wins if positive, consecutive losses if negative")
+    longest_win_streak: int
+    longest_loss_streak: int
+    last_match_at: Optional[datetime] = None
+
+class HeadToHeadResponse(BaseModel):
+    player_id: UUID
+    opponent_id: UUID
+    matches_played: int
+    wins: int
+    losses: int
+    draws: int
+    win_rate: float
+    last_match_at: Optional[datetime] = None
+
+class MatchupMatch(BaseModel):
+    id: UUID
+    tournament_id: Optional[UUID] = None
+    player_a_id: UUID
+    player_b_id: UUID
+    score_a: Optional[int] = None
+    score_b: Optional[int] = None
+    result_code: Optional[int] = None
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    finalized_at: Optional[datetime] = None
+
+class MatchupResponse(BaseModel):
+    record: HeadToHeadResponse
+    total_matches: int
+    matches: list[MatchupMatch]
+
+class RatingChange(BaseModel):
+    match_id: UUID
+    rating_before: float
+    rating_after: float
+    rated_at: datetime
+
+class PlayerRatingResponse(BaseModel):
+    player_id: UUID
+    rating: float
+    history: list[RatingChange]
+
+class LeaderboardEntry(BaseModel):
+    rank: int
+    id: UUID
+    first_name: str
+    last_name: str
+    country: Optional[str] = None
+    rating: float
+    matches_played: int
+    wins: int
+    losses: int
+    draws: int
+    win_rate: float
@@ -1,7 +1,8 @@
 from pydantic import BaseModel, Field, field_validator
-from src.models.request import RequestType, RequestStatus
+from src.models.request import RequestType, RequestStatus, RequestAction
 from src.models.player import Player
 import uuid
+from typing import List
 from datetime import datetime
 
 
@@ -39,3 +40,13 @@ class RequestResponse(BaseModel):
     reason: str
     created_at: datetime
     status: RequestStatus
+
+
+class BatchRequestAction(BaseModel):
+
+    """
+    Schema for accepting or rejecting many requests at once.
+    """
+
+    request_ids: List[uuid.UUID] = Field(min_length=1, max_length=1000)
+    action: RequestAction
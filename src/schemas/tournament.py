@@ -1,12 +1,12 @@
 from datetime import datetime
-from pydantic import BaseModel, Field, field_validator, FieldValidationInfo
+from pydantic import BaseModel, ConfigDict, Field, field_validator, FieldValidationInfo
 from typing import Optional, List
 from uuid import UUID
 
 
 class TournamentSchema(BaseModel):
     name: str = Field(min_length=5, max_length=50, examples=["Black Doll Winter 2024"])
-    format: str = Field(examples=["Format must be 'league' or 'knockout'"])
+    format: str = Field(examples=["Format must be 'league', 'knockout', 'swiss' or 'groups'"])
     match_format: str = Field(
         examples=["Format must be 'time' or 'score'"]  # names are suggestion
     )
@@ -19,11 +19,21 @@ class TournamentSchema(BaseModel):
     draw_points: int = Field(
         ge=0, description="How many points the players get on draw"
     )
+    group_size: int = Field(
+        default=4, ge=3, description="Maximum number of players in a group (groups format)"
+    )
+    group_qualifiers: int = Field(
+        default=2, ge=1, description="How many players of each group go to the playoff (groups format)"
+    )
+    lazy_bracket: bool = Field(
+        default=False,
+        description="Create knockout matches only once both of their players are known (knockout format)",
+    )
 
     @field_validator("format")
     def validate_format(cls, value):
-        if value not in ["league", "knockout"]:
-            raise ValueError("Tournament format must be 'league' or 'knockout'")
+        if value not in ["league", "knockout", "swiss", "groups"]:
+            raise ValueError("Tournament format must be 'league', 'knockout', 'swiss' or 'groups'")
         return value
 
     @field_validator("match_format")
@@ -132,12 +142,31 @@ class UpdateTournamentRequest(BaseModel):
         return value
 
 
+class ScheduleRequest(BaseModel):
+    slot_minutes: int = Field(gt=0, description="Length of a match slot in minutes")
+    courts: int = Field(default=1, gt=0, description="How many matches can be played at the same time")
+    rest_minutes: int = Field(
+        default=0, ge=0, description="Minimum time in minutes between two matches of a player"
+    )
+
+
 class UpdateTournamentResponse(UpdateTournamentRequest):
     tournament_id: UUID
     name: str
     format: str
 
 
+class TournamentParticipantEntry(BaseModel):
+    player_id: UUID
+    full_name: str
+
+
+class TournamentMatchEntry(BaseModel):
+    # Matches of a lazy bracket that are not created yet have no id.
+    match_id: Optional[UUID] = None
+    match_name: str
+
+
 class CreateTournamentResponse(BaseModel):
     tournament_id: UUID
     name: str
@@ -151,5 +180,24 @@ class CreateTournamentResponse(BaseModel):
     author_id: UUID
     total_participants: int
     total_matches: int
-    participants: list
-    matches: list
+    participants: list[TournamentParticipantEntry]
+    matches: list[TournamentMatchEntry]
+
+
+class TournamentOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    name: str
+    format_id: int
+    match_format_id: int
+    start_time: datetime
+    end_time: datetime
+    prize: int
+    win_points: Optional[int] = None
+    draw_points: Optional[int] = None
+    group_size: Optional[int] = None
+    group_qualifiers: Optional[int] = None
+    lazy_bracket: bool
+    version: int
+    author_id: UUID
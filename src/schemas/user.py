@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field, field_validator
 from src.models.user import Role
-from typing import Optional
+from typing import List, Optional
 import re
 
 
@@ -131,3 +131,12 @@ class UpdateUserRequest(BaseModel):
         if not re.match(r"[^@]+@[^@]+\.[^@]+", value):
             raise ValueError("Invalid email address")
         return value
+
+
+class DeleteUsersRequest(BaseModel):
+
+    """
+    Schema for deleting many users at once.
+    """
+
+    usernames: List[str] = Field(min_length=1, max_length=1000, examples=[["johndoe", "janedoe"]])
@@ -6,7 +6,7 @@ from starlette.responses import RedirectResponse
 from uuid import UUID
 
 from src.core.auth import get_current_user
-from src.api.deps import get_db
+from src.api.deps import get_db, get_read_db
 from src.crud import tournaments
 from src.models.user import User, Role
 from src.schemas.tournament import (
@@ -30,7 +30,7 @@ def list_tournaments(
     limit: int = Query(default=10, ge=1, le=100),
     sort: Literal["asc", "desc"] | None = Query(default=None),
     search: str | None = Query(default=None),
-    db_session: Session = Depends(get_db),
+    db_session: Session = Depends(get_read_db),
 ):
     flash_message = request.cookies.get("flash_message")
     token = request.cookies.get("token")
@@ -57,7 +57,7 @@ def list_tournaments(
 def get_tournament_html(
     request: Request,
     tournament_id: UUID,
-    db_session: Session = Depends(get_db),
+    db_session: Session = Depends(get_read_db),
 ):
     flash_message = request.cookies.get("flash_message")
     token = request.cookies.get("token")
@@ -77,6 +77,7 @@ def get_tournament_html(
             "user": user,
             "flash_message": flash_message,
             "tournament": tournament,
+            "participants": tournaments.read_participants(db_session, tournament_id),
         },
     )
     response.delete_cookie("flash_message")
@@ -158,6 +159,7 @@ def submit_tournament(
     prize: str = Form(...),
     win_points: str = Form(...),
     draw_points: str = Form(...),
+    lazy_bracket: bool = Form(False),
     session: Session = Depends(get_db),
 ):
     token = request.cookies.get("token")
@@ -183,6 +185,7 @@ def submit_tournament(
             prize=prize,
             win_points=win_points,
             draw_points=draw_points,
+            lazy_bracket=lazy_bracket,
         )
     except ValidationError as e:
         response = RedirectResponse(url="/tournament/create", status_code=302)
@@ -280,6 +283,58 @@ def tournament_create_matches_html(
     return response
 
 
+@tournament_router.get("/{tournament_id}/next_round")
+def tournament_next_round_html(
+    request: Request,
+    tournament_id: UUID,
+    db_session: Session = Depends(get_db),
+):
+    flash_message = request.cookies.get("flash_message")
+    token = request.cookies.get("token")
+    user = get_current_user(token, db_session)
+
+    if user is None:
+        response = RedirectResponse(url="/", status_code=302)
+        response.set_cookie(key="flash_message", value="User not authenticated")
+        return response
+
+    tournament = tournaments.get_tournament(db_session, tournament_id)
+
+    if tournament is None:
+        response = RedirectResponse(url="/", status_code=302)
+        response.set_cookie(key="flash_message", value="Tournament not found")
+        return response
+
+    if not tournaments.can_update_tournament(user, tournament):
+        response = RedirectResponse(url="/", status_code=302)
+        response.set_cookie(key="flash_message", value="User not authorized")
+        return response
+
+    try:
+        tournaments.create_next_round(
+            tournament_id=tournament_id, db_session=db_session, current_user=user
+        )
+    except custom_exceptions.InvalidRequest as e:
+        response = RedirectResponse(
+            url=f"/tournament/{tournament_id}/detail", status_code=302
+        )
+        response.set_cookie(key="flash_message", value=f"{e}")
+        return response
+
+    response = templates.TemplateResponse(
+        request=request,
+        name="tournament.html",
+        context={
+            "title": "Tournaments",
+            "user": user,
+            "flash_message": flash_message,
+            "tournament": tournament,
+        },
+    )
+    response.delete_cookie("flash_message")
+    return response
+
+
 @tournament_router.get("/{tournament_id}/delete/player/{player_id}/")
 def delete_player_html(
     request: Request,
@@ -481,8 +536,6 @@ def add_participant_in_tournament_html(
         response.set_cookie(key="flash_message", value="User not authorized")
         return response
 
-    players = tournaments.get_all_players(db_session)
-
     response = templates.TemplateResponse(
         request=request,
         name="add_participant_in_tournament.html",
@@ -490,7 +543,6 @@ def add_participant_in_tournament_html(
             "title": "Add Participant",
             "flash_message": flash_message,
             "tournament": tournament,
-            "players": players,
         },
     )
     response.delete_cookie("flash_message")
@@ -541,8 +593,8 @@ def submit_add_participant(
         return response
 
     if participants:
-        participants = tournaments.get_tournament_participants_by_id(
-            session, participants
+        result = tournaments.add_participants_by_id(
+            session, tournament_id, participants
         )
     else:
         try:
@@ -552,9 +604,7 @@ def submit_add_participant(
             response.set_cookie(key="flash_message", value=f"{e}")
             return response
 
-        participants = [participant]
-
-    result = tournaments.add_participants(session, tournament_id, participants)
+        result = tournaments.add_participants(session, tournament_id, [participant])
     flash_message = " | ".join(
         f"{participant['first_name']} {participant['last_name']} {participant['status'].lower()}"
         for participant in result.values()
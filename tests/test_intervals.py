@@ -0,0 +1,67 @@
+import unittest
+from src.common.intervals import IntervalIndex
+
+
+class IntervalIndex_Should(unittest.TestCase):
+
+    def setUp(self):
+        self.index = IntervalIndex()
+        self.index.add("player", 10, 20, "m1")
+        self.index.add("player", 30, 40, "m2")
+
+    def test_overlapping_returns_the_interval(self):
+        self.assertEqual(self.index.overlapping("player", 15, 25), (10, 20, "m1"))
+        self.assertEqual(self.index.overlapping("player", 25, 35), (30, 40, "m2"))
+
+    def test_touching_intervals_do_not_overlap(self):
+        self.assertIsNone(self.index.overlapping("player", 20, 30))
+        self.assertIsNone(self.index.overlapping("player", 0, 10))
+        self.assertIsNone(self.index.overlapping("court", 0, 100))
+
+    def test_remove(self):
+        self.assertTrue(self.index.remove("player", 10, "m1"))
+        self.assertFalse(self.index.remove("player", 10, "m1"))
+        self.assertIsNone(self.index.overlapping("player", 15, 25))
+
+
+    def test_nested_intervals(self):
+        index = IntervalIndex()
+        index.add("court", 0, 100, "long")
+        index.add("court", 10, 20, "short")
+
+        self.assertEqual(index.overlapping("court", 50, 60), (0, 100, "long"))
+        self.assertIn(index.overlapping("court", 15, 16)[2], ("long", "short"))
+        self.assertIsNone(index.overlapping("court", 100, 110))
+
+    def test_overlapping_stored_intervals(self):
+        index = IntervalIndex()
+        index.add("court", 0, 50, "m1")
+        index.add("court", 40, 45, "m2")
+        index.add("court", 44, 60, "m3")
+
+        self.assertEqual(index.overlapping("court", 55, 70), (44, 60, "m3"))
+        self.assertEqual(index.overlapping("court", 46, 47), (44, 60, "m3"))
+        self.assertIsNone(index.overlapping("court", 60, 70))
+
+        index.remove("court", 44, "m3")
+        self.assertEqual(index.overlapping("court", 46, 47), (0, 50, "m1"))
+        index.remove("court", 0, "m1")
+        self.assertIsNone(index.overlapping("court", 46, 47))
+
+    def test_matches_a_linear_scan(self):
+        intervals = [((start * 7) % 50, (start * 7) % 50 + (start * 13) % 30 + 1, start) for start in range(40)]
+        index = IntervalIndex()
+        for start, end, value in intervals:
+            index.add("key", start, end, value)
+
+        for query_start in range(0, 80, 3):
+            for length in (1, 4, 9):
+                query_end = query_start + length
+                expected = any(start < query_end and end > query_start for start, end, _ in intervals)
+                found = index.overlapping("key", query_start, query_end)
+                self.assertEqual(found is not None, expected, (query_start, query_end))
+                if found:
+                    self.assertTrue(found[0] < query_end and found[1] > query_start)
+
+if __name__ == "__main__":
+    unittest.main()
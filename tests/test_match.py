@@ -1,13 +1,18 @@
+import asyncio
 import uuid
 import unittest
 from datetime import datetime, timedelta
 from fastapi import HTTPException
-from src.models.match import Match
+from src.models.match import Match, ResultCodes
 from src.models.player import Player
 from src.models.user import User
-from src.schemas.match import CreateMatchRequest, MatchResult, MatchUpdateTime
-from src.crud.matches import create_match, read_match_by_id, read_all_matches, update_match_score, update_match_date, delete_match, update_player_stats_after_match
+from src.models.tournament import Tournament
+from src.schemas.match import CreateMatchRequest, MatchOut, MatchResult, MatchScoreEntry, MatchUpdateTime
+from src.crud.matches import create_match, read_match_by_id, read_all_matches, update_match_score, update_match_scores, update_match_date, finalize_match, delete_match, update_player_stats_after_match, read_matches_between
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+from src.common.custom_exceptions import InvalidRequest, VersionConflict
+from main import app
 
 
 class MatchCRUD_Should(unittest.TestCase):
@@ -65,10 +70,32 @@ class MatchCRUD_Should(unittest.TestCase):
             read_match_by_id(self.mock_db_session, uuid.uuid4())
 
     def test_read_all_matches(self):
-        self.mock_db_session.query().all.return_value = [self.match]
+        row = unittest.mock.MagicMock(_mapping={"id": self.match.id, "player_a_id": self.match.player_a_id})
+        self.mock_db_session.query.return_value.all.return_value = [row]
         matches = read_all_matches(self.mock_db_session)
-        self.assertEqual(len(matches), 1)
-        self.assertEqual(matches[0].id, self.match.id)
+        self.assertEqual(matches, [{"id": self.match.id, "player_a_id": self.match.player_a_id}])
+        selected = [column.key for column in self.mock_db_session.query.call_args[0]]
+        self.assertEqual(selected, list(MatchOut.model_fields))
+
+    def test_read_matches_between(self):
+        query = self.mock_db_session.query.return_value.filter.return_value
+        query.count.return_value = 1
+        query.order_by.return_value.offset.return_value.limit.return_value.all.return_value = [self.match]
+
+        total, matches = read_matches_between(self.mock_db_session, self.match.player_b_id, self.match.player_a_id, offset=0, limit=5)
+
+        self.assertEqual(total, 1)
+        self.assertEqual(matches, [self.match])
+        pair_filter = str(self.mock_db_session.query.return_value.filter.call_args[0][0])
+        self.assertIn("least", pair_filter)
+        query.order_by.return_value.offset.assert_called_once_with(0)
+        query.order_by.return_value.offset.return_value.limit.assert_called_once_with(5)
+
+    def test_read_matches_between_same_player(self):
+        with self.assertRaises(HTTPException) as context:
+            read_matches_between(self.mock_db_session, self.match.player_a_id, self.match.player_a_id)
+
+        self.assertEqual(context.exception.status_code, 400)
 
     def test_update_match_score(self):
         updates = MatchResult(score_a=3, score_b=1, result_code="player 1")
@@ -86,6 +113,139 @@ class MatchCRUD_Should(unittest.TestCase):
         with self.assertRaises(HTTPException):
             update_match_score(self.match.id, updates, self.mock_db_session, mock_current_user)
 
+    def test_update_match_score_outdated_version(self):
+        updates = MatchResult(score_a=3, score_b=1, result_code="player 1")
+        self.match.version = 2
+        self.mock_db_session.query().filter().first.return_value = self.match
+        mock_current_user = User(id=uuid.uuid4(), username="testuser", role='ADMIN')
+        with self.assertRaises(VersionConflict):
+            update_match_score(self.match.id, updates, self.mock_db_session, mock_current_user, expected_version=1)
+
+        self.mock_db_session.commit.assert_not_called()
+
+    def test_update_match_score_concurrent_update(self):
+        updates = MatchResult(score_a=3, score_b=1, result_code="player 1")
+        self.mock_db_session.query().filter().first.return_value = self.match
+        self.mock_db_session.commit.side_effect = StaleDataError()
+        mock_current_user = User(id=uuid.uuid4(), username="testuser", role='ADMIN')
+        with self.assertRaises(StaleDataError) as context:
+            update_match_score(self.match.id, updates, self.mock_db_session, mock_current_user)
+
+        response = asyncio.run(app.exception_handlers[StaleDataError](None, context.exception))
+        self.assertEqual(response.status_code, 412)
+
+    def test_update_match_scores(self):
+        self.match.format_id = 2
+        player_a = Player(id=self.match.player_a_id, matches_played=0, wins=0, losses=0, draws=0)
+        player_b = Player(id=self.match.player_b_id, matches_played=0, wins=0, losses=0, draws=0)
+        self.mock_db_session.query().filter().order_by().with_for_update().all.side_effect = [
+            [self.match],
+            [player_a, player_b],
+            [],
+        ]
+        self.mock_db_session.query().filter().all.return_value = []
+        self.mock_db_session.query().all.return_value = [ResultCodes(id=1, result="player 1")]
+        mock_current_user = User(id=uuid.uuid4(), username="testuser", role='ADMIN')
+        missing_id = uuid.uuid4()
+
+        result = update_match_scores(
+            self.mock_db_session,
+            [
+                MatchScoreEntry(match_id=self.match.id, score_a=3, score_b=1, result_code="player 1"),
+                MatchScoreEntry(match_id=missing_id, score_a=3, score_b=1, result_code="player 1"),
+                MatchScoreEntry(match_id=self.match.id, score_a=3, score_b=1, result_code="player 1"),
+            ],
+            mock_current_user,
+        )
+
+        self.assertEqual(result, {str(self.match.id): "Updated", str(missing_id): "Match not found"})
+        self.assertEqual(self.match.result_code, 1)
+        self.assertEqual((player_a.wins, player_b.losses), (1, 1))
+        self.mock_db_session.commit.assert_called_once()
+
+    def test_update_match_scores_finalizes_scored_matches_once(self):
+        self.match.format_id = 2
+        self.match.result_code = 2
+        finalized = Match(id=uuid.uuid4(), player_a_id=uuid.uuid4(), player_b_id=uuid.uuid4(), result_code=1, finalized_at=datetime.now())
+        player_a = Player(id=self.match.player_a_id, matches_played=0, wins=0, losses=0, draws=0)
+        player_b = Player(id=self.match.player_b_id, matches_played=0, wins=0, losses=0, draws=0)
+        self.mock_db_session.query().filter().order_by().with_for_update().all.side_effect = [
+            [self.match, finalized],
+            [player_a, player_b],
+            [],
+        ]
+        self.mock_db_session.query().filter().all.return_value = []
+        self.mock_db_session.query().all.return_value = [ResultCodes(id=1, result="player 1")]
+        mock_current_user = User(id=uuid.uuid4(), username="testuser", role='ADMIN')
+
+        result = update_match_scores(
+            self.mock_db_session,
+            [
+                MatchScoreEntry(match_id=self.match.id, score_a=3, score_b=1, result_code="player 1"),
+                MatchScoreEntry(match_id=finalized.id, score_a=3, score_b=1, result_code="player 1"),
+            ],
+            mock_current_user,
+        )
+
+        self.assertEqual(
+            result,
+            {str(self.match.id): "Updated", str(finalized.id): "Match is already finalized"},
+        )
+        self.assertIsNotNone(self.match.finalized_at)
+        self.assertEqual((player_a.wins, player_b.losses), (1, 1))
+
+    def test_update_match_scores_locks_matches_then_players_in_id_order(self):
+        self.match.format_id = 2
+        players = [Player(id=self.match.player_a_id), Player(id=self.match.player_b_id)]
+        self.mock_db_session.query.reset_mock()
+        self.mock_db_session.query().filter().order_by().with_for_update().all.side_effect = [
+            [self.match],
+            players,
+            [],
+        ]
+        self.mock_db_session.query().all.return_value = []
+        mock_current_user = User(id=uuid.uuid4(), username="testuser", role='ADMIN')
+
+        update_match_scores(
+            self.mock_db_session,
+            [MatchScoreEntry(match_id=self.match.id, score_a=1, score_b=3, result_code="player 1")],
+            mock_current_user,
+        )
+
+        locked = [
+            call.args[0]
+            for call in self.mock_db_session.query.call_args_list
+            if call.args and call.args[0] in (Match, Player)
+        ]
+        self.assertEqual(locked, [Match, Player])
+        orders = [
+            str(call.args[0])
+            for call in self.mock_db_session.query().filter().order_by.call_args_list
+            if call.args
+        ]
+        self.assertEqual(orders[:2], ["Match.id", "Player.id"])
+
+    def test_update_match_scores_invalid_result(self):
+        self.match.format_id = 2
+        players = [Player(id=self.match.player_a_id), Player(id=self.match.player_b_id)]
+        self.mock_db_session.query().filter().order_by().with_for_update().all.side_effect = [
+            [self.match],
+            players,
+            [],
+        ]
+        self.mock_db_session.query().filter().all.return_value = []
+        self.mock_db_session.query().all.return_value = []
+        mock_current_user = User(id=uuid.uuid4(), username="testuser", role='ADMIN')
+
+        result = update_match_scores(
+            self.mock_db_session,
+            [MatchScoreEntry(match_id=self.match.id, score_a=1, score_b=3, result_code="player 1")],
+            mock_current_user,
+        )
+
+        self.assertEqual(result, {str(self.match.id): "Invalid result"})
+        self.assertIsNone(self.match.result_code)
+
     def test_update_match_date(self):
         updates = MatchUpdateTime(start_time=datetime.now() + timedelta(days=1), end_time=datetime.now() + timedelta(days=1, minutes=90))
         self.mock_db_session.query().filter().first.return_value = self.match
@@ -94,6 +254,72 @@ class MatchCRUD_Should(unittest.TestCase):
         self.assertEqual(updated_match.start_time, updates.start_time)
         self.assertEqual(updated_match.end_time, updates.end_time)
 
+    def test_update_match_date_player_conflict(self):
+        start_time = datetime.now() + timedelta(days=1)
+        updates = MatchUpdateTime(start_time=start_time, end_time=start_time + timedelta(minutes=90))
+        self.mock_db_session.query().filter().first.return_value = self.match
+        other = Match(
+            id=uuid.uuid4(),
+            player_a_id=self.match.player_a_id,
+            player_b_id=uuid.uuid4(),
+            start_time=start_time + timedelta(minutes=30),
+            end_time=start_time + timedelta(minutes=120),
+        )
+        self.mock_db_session.query().filter().all.return_value = [other]
+        mock_current_user = User(id=uuid.uuid4(), username="testuser", role='ADMIN')
+        with self.assertRaises(HTTPException) as context:
+            update_match_date(self.mock_db_session, self.match.id, updates, mock_current_user)
+
+        self.assertEqual(context.exception.status_code, 409)
+
+    def test_update_match_date_keeps_the_rest_of_the_tournament(self):
+        start_time = datetime.now() + timedelta(days=1)
+        updates = MatchUpdateTime(start_time=start_time, end_time=start_time + timedelta(minutes=60))
+        self.match.tournament_id = uuid.uuid4()
+        self.match.tournament = Tournament(id=self.match.tournament_id, courts=None, rest_minutes=30)
+        self.mock_db_session.query().filter().first.return_value = self.match
+        previous = Match(
+            id=uuid.uuid4(),
+            player_a_id=uuid.uuid4(),
+            player_b_id=self.match.player_b_id,
+            start_time=start_time - timedelta(minutes=80),
+            end_time=start_time - timedelta(minutes=20),
+        )
+        self.mock_db_session.query().filter().all.return_value = [previous]
+        mock_current_user = User(id=uuid.uuid4(), username="testuser", role='ADMIN')
+        with self.assertRaises(HTTPException) as context:
+            update_match_date(self.mock_db_session, self.match.id, updates, mock_current_user)
+
+        self.assertEqual(context.exception.status_code, 409)
+
+    def test_update_match_date_counts_matches_without_court(self):
+        start_time = datetime.now() + timedelta(days=1)
+        updates = MatchUpdateTime(start_time=start_time, end_time=start_time + timedelta(minutes=60))
+        self.match.tournament_id = uuid.uuid4()
+        self.match.tournament = Tournament(id=self.match.tournament_id, courts=2, rest_minutes=0)
+        self.mock_db_session.query().filter().first.return_value = self.match
+        others = [
+            Match(
+                id=uuid.uuid4(),
+                player_a_id=uuid.uuid4(),
+                player_b_id=uuid.uuid4(),
+                tournament_id=self.match.tournament_id,
+                court=court,
+                start_time=start_time + timedelta(minutes=30),
+                end_time=start_time + timedelta(minutes=90),
+            )
+            for court in (1, None)
+        ]
+        self.mock_db_session.query().filter().all.return_value = others
+        mock_current_user = User(id=uuid.uuid4(), username="testuser", role='ADMIN')
+        with self.assertRaises(HTTPException) as context:
+            update_match_date(self.mock_db_session, self.match.id, updates, mock_current_user)
+        self.assertEqual(context.exception.status_code, 409)
+
+        others.pop()
+        updated_match = update_match_date(self.mock_db_session, self.match.id, updates, mock_current_user)
+        self.assertEqual(updated_match.court, 2)
+
     def test_delete_match(self):
         self.mock_db_session.query().filter().first.return_value = self.match
         mock_current_user = User(id=uuid.uuid4(), username="testuser", role='ADMIN')
@@ -107,14 +333,100 @@ class MatchCRUD_Should(unittest.TestCase):
             delete_match(self.mock_db_session, uuid.uuid4(), mock_current_user)
 
     def test_update_player_stats_after_match(self):
-        self.mock_db_session.query().filter().first.side_effect = [self.match, Player(id=uuid.uuid4()), Player(id=uuid.uuid4())] 
+        self.match.result_code = 1
+        players = [
+            Player(id=player_id, matches_played=0, wins=0, losses=0, draws=0)
+            for player_id in (self.match.player_a_id, self.match.player_b_id)
+        ]
+        self.mock_db_session.query().filter_by().with_for_update().first.return_value = self.match
+        self.mock_db_session.query().filter().order_by().with_for_update().all.return_value = players
         mock_current_user = User(id=uuid.uuid4(), username="testuser", role='ADMIN')
         result = update_player_stats_after_match(self.mock_db_session, self.match.id, mock_current_user)
         self.assertEqual(result['detail'], "Player statistics updated successfully")
 
+    def test_update_player_stats_without_result(self):
+        self.mock_db_session.query().filter_by().with_for_update().first.return_value = self.match
+        mock_current_user = User(id=uuid.uuid4(), username="testuser", role='ADMIN')
+        with self.assertRaises(HTTPException) as context:
+            update_player_stats_after_match(self.mock_db_session, self.match.id, mock_current_user)
+
+        self.assertEqual(context.exception.status_code, 406)
+
+    def test_finalize_match(self):
+        self.match.format_id = 2
+        player_a = Player(id=self.match.player_a_id, matches_played=0, wins=0, losses=0, draws=0)
+        player_b = Player(id=self.match.player_b_id, matches_played=0, wins=0, losses=0, draws=0)
+        self.mock_db_session.query().filter().with_for_update().first.return_value = self.match
+        self.mock_db_session.query().filter().order_by().with_for_update().all.return_value = [player_a, player_b]
+        self.mock_db_session.query().filter().first.return_value = ResultCodes(id=2, result="player 2")
+        mock_current_user = User(id=uuid.uuid4(), username="testuser", role='ADMIN')
+
+        result = finalize_match(
+            self.mock_db_session, self.match.id, MatchResult(score_a=1, score_b=3, result_code="player 2"), mock_current_user
+        )
+
+        self.assertEqual((result.score_a, result.score_b, result.result_code), (1, 3, 2))
+        self.assertIsNotNone(result.finalized_at)
+        self.assertEqual((player_a.losses, player_b.wins), (1, 1))
+        self.mock_db_session.commit.assert_called_once()
+
+    def test_concurrent_finalize_and_bulk_scores_answer_precondition_failed(self):
+        self.match.format_id = 2
+        player_a = Player(id=self.match.player_a_id, matches_played=0, wins=0, losses=0, draws=0)
+        player_b = Player(id=self.match.player_b_id, matches_played=0, wins=0, losses=0, draws=0)
+        self.mock_db_session.query().filter().with_for_update().first.return_value = self.match
+        self.mock_db_session.query().filter().order_by().with_for_update().all.side_effect = [
+            [player_a, player_b],
+            [self.match],
+            [player_a, player_b],
+            [],
+        ]
+        self.mock_db_session.query().filter().first.return_value = ResultCodes(id=2, result="player 2")
+        self.mock_db_session.query().filter().all.return_value = []
+        self.mock_db_session.query().all.return_value = [ResultCodes(id=2, result="player 2")]
+        self.mock_db_session.commit.side_effect = StaleDataError()
+        mock_current_user = User(id=uuid.uuid4(), username="testuser", role='ADMIN')
+        handler = app.exception_handlers[StaleDataError]
+
+        with self.assertRaises(StaleDataError) as finalize:
+            finalize_match(
+                self.mock_db_session, self.match.id, MatchResult(score_a=1, score_b=3, result_code="player 2"), mock_current_user
+            )
+        self.match.result_code = self.match.finalized_at = None
+        with self.assertRaises(StaleDataError) as bulk:
+            update_match_scores(
+                self.mock_db_session,
+                [MatchScoreEntry(match_id=self.match.id, score_a=1, score_b=3, result_code="player 2")],
+                mock_current_user,
+            )
+
+        for context in (finalize, bulk):
+            response = asyncio.run(handler(None, context.exception))
+            self.assertEqual(response.status_code, 412)
+
+    def test_version_conflict_answers_precondition_failed(self):
+        handler = app.exception_handlers[VersionConflict]
+
+        response = asyncio.run(handler(None, VersionConflict(key="tournament", key_value="1")))
+
+        self.assertEqual(response.status_code, 412)
+        self.assertNotIsInstance(VersionConflict("tournament", "1"), InvalidRequest)
+
+    def test_finalize_match_twice(self):
+        self.match.finalized_at = datetime.now()
+        self.mock_db_session.query().filter().with_for_update().first.return_value = self.match
+        mock_current_user = User(id=uuid.uuid4(), username="testuser", role='ADMIN')
+        with self.assertRaises(HTTPException) as context:
+            finalize_match(
+                self.mock_db_session, self.match.id, MatchResult(score_a=1, score_b=3, result_code="player 2"), mock_current_user
+            )
+
+        self.assertEqual(context.exception.status_code, 409)
+        self.mock_db_session.commit.assert_not_called()
+
     def test_update_player_stats_not_found(self):
 
-        self.mock_db_session.query().filter_by().first.side_effect = [None, None, None]
+        self.mock_db_session.query().filter_by().with_for_update().first.return_value = None
         mock_current_user = User(id=uuid.uuid4(), username="testuser", role='ADMIN')
         with self.assertRaises(HTTPException) as context:
             update_player_stats_after_match(self.mock_db_session, self.match.id, mock_current_user)
@@ -13,7 +13,9 @@ from src.crud.players import (
     read_current_user_player_profile,
     read_all_players,
     delete_player,
-    update_player_with_user
+    update_player_with_user,
+    search_players,
+    clear_search_cache
 )
 
 
@@ -180,4 +182,32 @@ class PlayerCRUD_Should(unittest.TestCase):
             update_player_with_user(self.db_session, player.id, uuid4())
 
         assert excinfo.exception.status_code == 404
-        assert excinfo.exception.detail == "User not found"
\ No newline at end of file
+        assert excinfo.exception.detail == "User not found"
+
+    def test_search_players_prefix(self):
+        clear_search_cache()
+        row = MagicMock()
+        row._mapping = {"id": self.player_data["id"], "first_name": "John", "last_name": "Doe", "country": "USA"}
+        query = self.db_session.query.return_value.filter.return_value.order_by.return_value.limit.return_value
+        query.all.return_value = [row]
+
+        result = search_players(self.db_session, "  JOHN  d", limit=5)
+
+        assert result == [row._mapping]
+        filter_clause = self.db_session.query.return_value.filter.call_args[0][0]
+        assert filter_clause.right.value == "john d%"
+        self.db_session.query.return_value.filter.return_value.order_by.return_value.limit.assert_called_once_with(5)
+
+    def test_search_players_uses_cache(self):
+        clear_search_cache()
+        query = self.db_session.query.return_value.filter.return_value.order_by.return_value.limit.return_value
+        query.all.return_value = []
+
+        search_players(self.db_session, "jo")
+        search_players(self.db_session, "Jo")
+
+        query.all.assert_called_once()
+
+        clear_search_cache()
+        search_players(self.db_session, "jo")
+        assert query.all.call_count == 2
@@ -0,0 +1,82 @@
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from src.crud.ratings import elo_ratings, expected_score, rate_match, read_player_rating, recompute_ratings
+from src.crud.tournaments import seed_players
+from src.models.match import Match
+from src.models.player import Player
+from src.models.rating import RatingHistory
+from src.models.stats import ProjectionState
+
+
+class RatingsCRUD_Should(unittest.TestCase):
+
+    def setUp(self):
+        """Set up required objects before each test."""
+        self.db_session = MagicMock(spec=Session)
+        self.player_1 = Player(id=uuid4(), first_name="John", last_name="Doe", rating=1500.0)
+        self.player_2 = Player(id=uuid4(), first_name="Jane", last_name="Doe", rating=1500.0)
+        self.match = Match(
+            id=uuid4(),
+            player_a_id=self.player_1.id,
+            player_b_id=self.player_2.id,
+            result_code=1,
+            finalized_at=datetime(2030, 1, 1),
+        )
+
+    def test_expected_score(self):
+        self.assertEqual(expected_score(1500, 1500), 0.5)
+        self.assertAlmostEqual(expected_score(1900, 1500), 10 / 11)
+
+    def test_elo_ratings(self):
+        self.assertEqual(elo_ratings(1500, 1500, 1), (1516, 1484))
+        self.assertEqual(elo_ratings(1500, 1500, 2), (1484, 1516))
+        self.assertEqual(elo_ratings(1500, 1500, 3), (1500, 1500))
+
+    def test_elo_ratings_keep_the_total(self):
+        rating_a, rating_b = elo_ratings(1700, 1400, 2)
+        self.assertAlmostEqual(rating_a + rating_b, 3100)
+        self.assertGreater(rating_b - 1400, 16)
+
+    def test_recompute_ratings_locks_before_replaying(self):
+        self.db_session.query.return_value.filter.return_value.yield_per.return_value = []
+
+        recompute_ratings(self.db_session)
+
+        queried = [call.args[0] for call in self.db_session.query.call_args_list if call.args]
+        self.assertEqual(queried[:3], [ProjectionState, Player.id, RatingHistory])
+        self.db_session.query.return_value.order_by.assert_any_call(Player.id)
+        self.db_session.query.return_value.order_by.return_value.with_for_update.assert_called()
+        self.db_session.commit.assert_called_once()
+
+    def test_rate_match(self):
+        rate_match(self.db_session, self.match, self.player_1, self.player_2)
+
+        self.assertEqual(self.player_1.rating, 1516)
+        self.assertEqual(self.player_2.rating, 1484)
+        history = self.db_session.add_all.call_args[0][0]
+        self.assertEqual(len(history), 2)
+        self.assertTrue(all(isinstance(entry, RatingHistory) for entry in history))
+        self.assertEqual((history[0].rating_before, history[0].rating_after), (1500, 1516))
+        self.assertEqual(history[1].rated_at, self.match.finalized_at)
+
+    def test_read_player_rating_not_found(self):
+        self.db_session.query.return_value.filter.return_value.scalar.return_value = None
+
+        with self.assertRaises(HTTPException) as context:
+            read_player_rating(self.db_session, uuid4())
+
+        self.assertEqual(context.exception.status_code, 404)
+
+    def test_seed_players_by_rating(self):
+        self.player_2.rating = 1600.0
+        unrated = Player(id=uuid4(), first_name="New", last_name="Player")
+
+        self.assertEqual(
+            seed_players([self.player_1, unrated, self.player_2])[0], self.player_2
+        )
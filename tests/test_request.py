@@ -1,11 +1,13 @@
 import unittest
 from unittest.mock import MagicMock
 from uuid import uuid4
-from src.models.request import RequestType, RequestAction, Requests
+from datetime import datetime
+from src.models.request import RequestType, RequestAction, RequestStatus, Requests
 from src.models.user import User, Role
 from src.models.player import Player
 from src.schemas.request import CreateRequest, RequestResponse
-from src.crud.requests import creating_request, view_requests, open_request, accept_request, reject_request
+from src.crud.requests import (creating_request, view_requests, open_request, accept_request, reject_request,
+                               count_requests_by_status, moderate_requests)
 from src.common.custom_responses import Unauthorized, NotFound, BadRequest, ForbiddenAccess
 
 
@@ -108,10 +110,38 @@ class RequestCRUDShould(unittest.TestCase):
 
         current_user = self.mock_user
         current_user.role = Role.ADMIN
-        self.db.query.return_value.all.return_value = []
+        self.db.query.return_value.order_by.return_value.offset.return_value.limit.return_value.all.return_value = []
         response = view_requests(self.db, current_user, None)
         self.assertIsInstance(response, NotFound)
 
+    def test_view_requests_paginated(self):
+
+        current_user = self.mock_user
+        current_user.role = Role.ADMIN
+        request = Requests(id=uuid4(), user_id=uuid4(), type=RequestType.PROMOTE, reason="Promote me",
+                           created_at=datetime.now(), status=RequestStatus.PENDING)
+        query = self.db.query.return_value.filter.return_value
+        query.order_by.return_value.offset.return_value.limit.return_value.all.return_value = [request]
+        response = view_requests(self.db, current_user, RequestStatus.PENDING, offset=10, limit=5)
+        self.assertEqual(len(response), 1)
+        self.assertIsInstance(response[0], RequestResponse)
+        query.order_by.return_value.offset.assert_called_once_with(10)
+        query.order_by.return_value.offset.return_value.limit.assert_called_once_with(5)
+
+    def test_count_requests_by_status(self):
+
+        current_user = self.mock_user
+        current_user.role = Role.ADMIN
+        self.db.query.return_value.group_by.return_value.all.return_value = [(RequestStatus.PENDING, 3)]
+        response = count_requests_by_status(self.db, current_user)
+        self.assertEqual(response, {"Pending": 3, "Accepted": 0, "Rejected": 0})
+
+    def test_count_requests_by_status_forbidden(self):
+
+        current_user = self.mock_user
+        response = count_requests_by_status(self.db, current_user)
+        self.assertIsInstance(response, ForbiddenAccess)
+
     def test_open_request_unauthorized(self):
 
         current_user = None
@@ -153,6 +183,44 @@ class RequestCRUDShould(unittest.TestCase):
         response = reject_request(self.db, request)
         self.assertEqual(response, f"{request.type.value} from {mock_user.username} rejected")
 
+    def test_moderate_requests_reject(self):
+        current_user = self.mock_user
+        current_user.role = Role.ADMIN
+        request = Requests(id=uuid4(), user_id=uuid4(), type=RequestType.PROMOTE, reason="Promote me",
+                           status=RequestStatus.PENDING)
+        missing_id = uuid4()
+        self.db.query.return_value.filter.return_value.all.return_value = [request]
+
+        response = moderate_requests(self.db, [request.id, missing_id], current_user, RequestAction.REJECT)
+
+        self.assertEqual(response, {str(request.id): "Rejected", str(missing_id): "Not Found"})
+        self.db.commit.assert_called_once()
+
+    def test_moderate_requests_accept(self):
+        current_user = self.mock_user
+        current_user.role = Role.ADMIN
+        user = User(id=uuid4(), username="linked_user", role=Role.USER)
+        promote = Requests(id=uuid4(), user_id=user.id, type=RequestType.PROMOTE, reason="Promote me",
+                           status=RequestStatus.PENDING)
+        link = Requests(id=uuid4(), user_id=user.id, type=RequestType.LINK, reason="John Doe",
+                        status=RequestStatus.PENDING)
+        done = Requests(id=uuid4(), user_id=user.id, type=RequestType.DEMOTE, reason="Demote me",
+                        status=RequestStatus.ACCEPTED)
+        player = Player(id=uuid4(), first_name="John", last_name="Doe", user_id=None)
+        self.db.query.return_value.filter.return_value.all.side_effect = [[promote, link, done], [user], [player]]
+
+        response = moderate_requests(self.db, [promote.id, link.id, done.id], current_user, RequestAction.ACCEPT)
+
+        self.assertEqual(response, {str(promote.id): "Accepted", str(link.id): "Accepted",
+                                    str(done.id): "Already processed"})
+        self.db.bulk_update_mappings.assert_called_once_with(Player, [{"id": player.id, "user_id": user.id}])
+        self.db.commit.assert_called_once()
+
+    def test_moderate_requests_forbidden(self):
+        current_user = self.mock_user
+        response = moderate_requests(self.db, [uuid4()], current_user, RequestAction.ACCEPT)
+        self.assertIsInstance(response, ForbiddenAccess)
+
 
 if __name__ == '__main__':
     unittest.main()
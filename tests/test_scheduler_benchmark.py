@@ -0,0 +1,90 @@
+import os
+import unittest
+import time
+from src.crud import tournaments
+
+
+# Player counts checked on every run: even and odd, with and without a bye.
+PLAYER_COUNTS = (2, 3, 8, 9, 16, 31, 64, 128, 255)
+
+# Large player counts, only checked by the benchmark.
+BENCHMARK_PLAYER_COUNTS = (512, 1024, 2048)
+
+# Seconds allowed for generating the schedule of 2048 players (~2M fixtures).
+TIME_BUDGET = 5.0
+
+# The benchmark is wall-clock based, so it only runs when asked for: RUN_BENCHMARKS=1 pytest
+RUN_BENCHMARKS = bool(os.getenv("RUN_BENCHMARKS"))
+
+
+def benchmark(scheduler, players, rounds: int = 3) -> float:
+    """
+    Run the scheduler to exhaustion `rounds` times and return the best wall time in seconds.
+    """
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in scheduler(players):
+            pass
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+class ScheduleAssertions:
+
+    def assert_valid_schedule(self, scheduler, number_of_players):
+        players = list(range(number_of_players))
+        stages = list(scheduler(players))
+
+        expected_stages = number_of_players - 1 + number_of_players % 2
+        self.assertEqual(len(stages), expected_stages)
+
+        met = set()
+        for stage in stages:
+            playing = set()
+            for player_a, player_b in stage:
+                self.assertNotEqual(player_a, player_b)
+                self.assertNotIn(player_a, playing, "Player plays twice in one stage")
+                self.assertNotIn(player_b, playing, "Player plays twice in one stage")
+                playing.add(player_a)
+                playing.add(player_b)
+
+                pair = (player_a, player_b) if player_a < player_b else (player_b, player_a)
+                self.assertNotIn(pair, met, "Pair meets more than once")
+                met.add(pair)
+            self.assertEqual(len(playing), number_of_players - number_of_players % 2)
+
+        self.assertEqual(len(met), number_of_players * (number_of_players - 1) // 2)
+
+
+class Scheduler_Should(ScheduleAssertions, unittest.TestCase):
+
+    def test_round_robin_stages_keep_invariants(self):
+        for number_of_players in PLAYER_COUNTS:
+            with self.subTest(players=number_of_players):
+                self.assert_valid_schedule(tournaments.round_robin_stages, number_of_players)
+
+    def test_split_in_stages_uses_round_robin_stages(self):
+        players = list(range(31))
+
+        self.assertEqual(
+            tournaments.split_in_stages(players), list(tournaments.round_robin_stages(players))
+        )
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, "set RUN_BENCHMARKS=1 to run the scheduler benchmark")
+class SchedulerBenchmark_Should(ScheduleAssertions, unittest.TestCase):
+
+    def test_round_robin_stages_keep_invariants_for_large_leagues(self):
+        for number_of_players in BENCHMARK_PLAYER_COUNTS:
+            with self.subTest(players=number_of_players):
+                self.assert_valid_schedule(tournaments.round_robin_stages, number_of_players)
+
+    def test_round_robin_stages_fit_time_budget(self):
+        seconds = benchmark(tournaments.round_robin_stages, list(range(2048)))
+
+        self.assertLess(seconds, TIME_BUDGET)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import json
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+from src.common.serialization import list_adapter, list_response, rows_response
+from src.schemas.match import MatchOut
+from src.schemas.tournament import TournamentOut
+
+
+class Serialization_Should(unittest.TestCase):
+
+    def setUp(self):
+        """Set up required objects before each test."""
+        self.match = {
+            "id": uuid4(),
+            "format_id": 1,
+            "player_a_id": uuid4(),
+            "player_b_id": uuid4(),
+            "start_time": datetime(2030, 1, 1, 10, 30),
+            "finalized_at": None,
+            "version": 2,
+        }
+
+    def test_list_adapter_is_built_once_per_model(self):
+        self.assertIs(list_adapter(MatchOut), list_adapter(MatchOut))
+        self.assertIsNot(list_adapter(MatchOut), list_adapter(TournamentOut))
+
+    def test_list_response_reads_attributes(self):
+        response = list_response(MatchOut, [SimpleNamespace(**{field: None for field in MatchOut.model_fields} | self.match)])
+
+        body = json.loads(response.body)
+        self.assertEqual(response.media_type, "application/json")
+        self.assertEqual(list(body[0]), list(MatchOut.model_fields))
+        self.assertEqual(body[0]["id"], str(self.match["id"]))
+
+    def test_rows_response_matches_the_schema_serialization(self):
+        row = {field: None for field in MatchOut.model_fields} | self.match
+
+        response = rows_response([row])
+
+        self.assertEqual(json.loads(response.body), [MatchOut.model_validate(row).model_dump(mode="json")])
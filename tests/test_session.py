@@ -0,0 +1,57 @@
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from sqlalchemy import create_engine, select, update
+
+from src.api.deps import LAST_WRITE_COOKIE, wrote_recently
+from src.database.session import RoutingSession
+from src.models.player import Player
+
+
+class RoutingSession_Should(unittest.TestCase):
+
+    def setUp(self):
+        """Set up required objects before each test."""
+        self.primary = create_engine("sqlite://")
+        self.replica = create_engine("sqlite://")
+
+    def test_reads_go_to_the_replica(self):
+        session = RoutingSession(bind=self.primary, replica=self.replica)
+
+        self.assertIs(session.get_bind(clause=select(Player)), self.replica)
+        self.assertFalse(session.wrote)
+
+    def test_without_a_replica_everything_goes_to_the_primary(self):
+        session = RoutingSession(bind=self.primary)
+
+        self.assertIs(session.get_bind(clause=select(Player)), self.primary)
+
+    def test_sticks_to_the_primary_after_a_write(self):
+        session = RoutingSession(bind=self.primary, replica=self.replica)
+
+        self.assertIs(session.get_bind(clause=update(Player).values(rating=1500.0)), self.primary)
+        self.assertTrue(session.wrote)
+        self.assertIs(session.get_bind(clause=select(Player)), self.primary)
+
+    def test_locking_reads_go_to_the_primary(self):
+        session = RoutingSession(bind=self.primary, replica=self.replica)
+
+        self.assertIs(session.get_bind(clause=select(Player).with_for_update()), self.primary)
+        self.assertTrue(session.wrote)
+
+
+class WroteRecently_Should(unittest.TestCase):
+
+    def request(self, cookies):
+        return MagicMock(cookies=cookies)
+
+    def test_recent_write(self):
+        self.assertTrue(wrote_recently(self.request({LAST_WRITE_COOKIE: str(time.time() - 1)})))
+
+    def test_old_write(self):
+        self.assertFalse(wrote_recently(self.request({LAST_WRITE_COOKIE: str(time.time() - 3600)})))
+
+    def test_missing_or_invalid_cookie(self):
+        self.assertFalse(wrote_recently(self.request({})))
+        self.assertFalse(wrote_recently(self.request({LAST_WRITE_COOKIE: "invalid"})))
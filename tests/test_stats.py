@@ -0,0 +1,253 @@
+import random
+import unittest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.crud.stats import (
+    StatsProjection,
+    get_head_to_head,
+    get_player_stats,
+    match_outcomes,
+    read_leaderboard,
+    read_player_rank,
+    refresh_player_stats,
+    refresh_ranks,
+)
+from src.models.base import Base
+from src.models.match import Match
+from src.models.player import Player
+from src.models.stats import PlayerStats
+
+
+class StatsCRUD_Should(unittest.TestCase):
+
+    def setUp(self):
+        """Set up required objects before each test."""
+        self.db_session = MagicMock(spec=Session)
+        self.player_a = uuid4()
+        self.player_b = uuid4()
+        self.start = datetime(2030, 1, 1)
+
+    def match(self, result_code, minutes=0):
+        return SimpleNamespace(
+            id=uuid4(),
+            player_a_id=self.player_a,
+            player_b_id=self.player_b,
+            result_code=result_code,
+            finalized_at=self.start + timedelta(minutes=minutes),
+        )
+
+    def test_match_outcomes(self):
+        self.assertEqual(match_outcomes(1), ("wins", "losses"))
+        self.assertEqual(match_outcomes(2), ("losses", "wins"))
+        self.assertEqual(match_outcomes(3), ("draws", "draws"))
+
+    def test_projection_counts_results_and_streaks(self):
+        projection = StatsProjection()
+        for minutes, result_code in enumerate([1, 1, 1, 3, 2, 2, 1]):
+            projection.apply(self.match(result_code, minutes))
+
+        player_a = projection.players[self.player_a]
+        self.assertEqual(
+            (player_a["matches_played"], player_a["wins"], player_a["losses"], player_a["draws"]),
+            (7, 4, 2, 1),
+        )
+        self.assertEqual(player_a["win_rate"], 4 / 7)
+        self.assertEqual(player_a["current_streak"], 1)
+        self.assertEqual(player_a["longest_win_streak"], 3)
+        self.assertEqual(player_a["longest_loss_streak"], 2)
+        self.assertEqual(player_a["last_match_at"], self.start + timedelta(minutes=6))
+
+        player_b = projection.players[self.player_b]
+        self.assertEqual(player_b["current_streak"], -1)
+        self.assertEqual(player_b["longest_win_streak"], 2)
+
+        head_to_head = projection.pairs[(self.player_a, self.player_b)]
+        reverse = projection.pairs[(self.player_b, self.player_a)]
+        self.assertEqual((head_to_head["wins"], head_to_head["losses"]), (4, 2))
+        self.assertEqual((reverse["wins"], reverse["losses"]), (2, 4))
+
+    def test_projection_continues_from_loaded_rows(self):
+        projection = StatsProjection()
+        row = MagicMock(
+            _mapping={
+                "player_id": self.player_a,
+                "matches_played": 5,
+                "wins": 2,
+                "losses": 3,
+                "draws": 0,
+                "current_streak": -3,
+                "longest_win_streak": 2,
+                "longest_loss_streak": 3,
+                "last_match_at": self.start,
+            },
+            player_id=self.player_a,
+        )
+        self.db_session.query.return_value.filter.return_value = [row]
+
+        projection.load(self.db_session, [self.match(2)])
+        projection.apply(self.match(2))
+
+        player_a = projection.players[self.player_a]
+        self.assertIn(self.player_a, projection.loaded_players)
+        self.assertEqual(player_a["matches_played"], 6)
+        self.assertEqual(player_a["current_streak"], -4)
+        self.assertEqual(player_a["longest_loss_streak"], 4)
+
+    def test_scoped_projection_only_counts_scoped_players(self):
+        projection = StatsProjection(players=[self.player_a])
+        projection.apply(self.match(1))
+
+        self.assertIn(self.player_a, projection.players)
+        self.assertNotIn(self.player_b, projection.players)
+        self.assertIn((self.player_b, self.player_a), projection.pairs)
+
+    def test_get_player_stats(self):
+        stats = PlayerStats(player_id=self.player_a, matches_played=4, wins=3, win_rate=0.75)
+        self.db_session.query.return_value.filter.return_value.first.return_value = stats
+
+        result = get_player_stats(self.db_session, self.player_a)
+
+        self.assertEqual(result, stats)
+
+    def test_get_player_stats_without_matches(self):
+        self.db_session.query.return_value.filter.return_value.first.side_effect = [
+            None,
+            (self.player_a,),
+        ]
+
+        result = get_player_stats(self.db_session, self.player_a)
+
+        self.assertEqual(result.matches_played, 0)
+        self.assertEqual(result.win_rate, 0.0)
+
+    def test_get_player_stats_player_not_found(self):
+        self.db_session.query.return_value.filter.return_value.first.return_value = None
+
+        with self.assertRaises(HTTPException) as context:
+            get_player_stats(self.db_session, self.player_a)
+
+        self.assertEqual(context.exception.status_code, 404)
+
+    def test_get_head_to_head_player_not_found(self):
+        self.db_session.query.return_value.filter.return_value.first.return_value = None
+        self.db_session.query.return_value.filter.return_value.count.return_value = 1
+
+        with self.assertRaises(HTTPException) as context:
+            get_head_to_head(self.db_session, self.player_a, self.player_b)
+
+        self.assertEqual(context.exception.status_code, 404)
+
+
+    def test_refresh_ranks_updates_every_sort_key(self):
+        refresh_ranks(self.db_session)
+
+        statements = [str(call[0][0]) for call in self.db_session.execute.call_args_list]
+        self.assertEqual(len(statements), 3)
+        for rank_column in ("rating_rank", "wins_rank", "win_rate_rank"):
+            self.assertTrue(any(f"SET {rank_column}=" in statement for statement in statements))
+        self.assertTrue(all("row_number() OVER" in statement for statement in statements))
+
+    def test_read_leaderboard_reads_a_rank_range(self):
+        row = MagicMock(_mapping={"rank": 11, "id": self.player_a})
+        query = self.db_session.query.return_value.join.return_value
+        query.filter.return_value.order_by.return_value.all.return_value = [row]
+
+        result = read_leaderboard(self.db_session, "wins", offset=10, limit=5)
+
+        self.assertEqual(result, [{"rank": 11, "id": self.player_a}])
+        rank_filter = query.filter.call_args[0][0]
+        self.assertIn("wins_rank BETWEEN", str(rank_filter))
+        self.assertEqual(rank_filter.right.clauses[0].value, 11)
+        self.assertEqual(rank_filter.right.clauses[1].value, 15)
+
+    def test_read_player_rank_not_ranked(self):
+        query = self.db_session.query.return_value.join.return_value
+        query.filter.return_value.first.return_value = MagicMock(rank=None)
+
+        with self.assertRaises(HTTPException) as context:
+            read_player_rank(self.db_session, self.player_a, "win_rate")
+
+        self.assertEqual(context.exception.status_code, 404)
+
+
+class RefreshPlayerStats_Should(unittest.TestCase):
+
+    def setUp(self):
+        """Set up required objects before each test."""
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.db_session = Session(bind=engine)
+        self.players = [Player(first_name="Ann", last_name="Lee"), Player(first_name="Bob", last_name="Ray")]
+        self.db_session.add_all(self.players)
+        self.db_session.commit()
+        self.start = datetime(2030, 1, 1)
+
+    def tearDown(self):
+        self.db_session.close()
+
+    def commit_match(self, minutes):
+        self.db_session.add(
+            Match(
+                player_a_id=self.players[0].id,
+                player_b_id=self.players[1].id,
+                format_id=1,
+                score_a=1,
+                score_b=0,
+                result_code=1,
+                stage=1,
+                serial_number=1,
+                finalized_at=self.start + timedelta(minutes=minutes),
+            )
+        )
+        self.db_session.commit()
+
+    def test_counts_a_match_committed_after_later_ones(self):
+        for minutes in (5, 6, 7):
+            self.commit_match(minutes)
+        self.assertEqual(refresh_player_stats(self.db_session), 3)
+
+        self.commit_match(1)
+
+        self.assertEqual(refresh_player_stats(self.db_session), 1)
+        self.assertEqual(refresh_player_stats(self.db_session), 0)
+        stats = self.db_session.get(PlayerStats, self.players[0].id)
+        self.assertEqual((stats.matches_played, stats.wins), (4, 4))
+
+    def test_refreshing_the_ranks_of_changed_players_matches_a_full_refresh(self):
+        rng = random.Random(7)
+        players = [Player(first_name="Ann", last_name="Lee", rating=rng.choice([1400.0, 1500.0])) for _ in range(30)]
+        self.db_session.add_all(players)
+        self.db_session.flush()
+        stats = [PlayerStats(player_id=player.id, matches_played=0, wins=0, losses=0, draws=0, win_rate=0.0) for player in players]
+        self.db_session.add_all(stats)
+        refresh_ranks(self.db_session)
+        self.db_session.commit()
+
+        for _ in range(30):
+            changed = rng.sample(range(len(players)), 3)
+            for index in changed:
+                players[index].rating = rng.choice([1400.0, 1500.0, 1600.0])
+                stats[index].matches_played += rng.randint(0, 3)
+                stats[index].wins = rng.randint(0, stats[index].matches_played)
+                stats[index].win_rate = stats[index].wins / stats[index].matches_played if stats[index].matches_played else 0.0
+            self.db_session.commit()
+
+            refresh_ranks(self.db_session, [players[index].id for index in changed])
+            ranks = self.ranks()
+            refresh_ranks(self.db_session)
+            self.assertEqual(ranks, self.ranks())
+
+    def ranks(self):
+        self.db_session.expire_all()
+        return {
+            row.player_id: (row.rating_rank, row.wins_rank, row.win_rate_rank)
+            for row in self.db_session.query(PlayerStats)
+        }
+
@@ -6,13 +6,15 @@ from sqlalchemy import and_
 from src.crud import tournaments
 from src.models.tournament import Tournament, TournamentParticipants
 from src.models.player import Player
+from src.models.match import Match
 from src.models.user import User
 from src.schemas.tournament import (
     TournamentSchema,
     CreateTournamentResponse,
     Participant,
+    UpdateTournamentRequest,
 )
-from src.common.custom_exceptions import NotFound
+from src.common.custom_exceptions import NotFound, InvalidRequest, VersionConflict
 from pydantic import ValidationError
 from uuid import uuid4
 
@@ -94,7 +96,7 @@ class TournamentCRUD_Should(unittest.TestCase):
         self.assertTrue(
             any(
                 error["loc"] == ("format",)
-                and "Tournament format must be 'league' or 'knockout'" in error["msg"]
+                and "Tournament format must be 'league', 'knockout', 'swiss' or 'groups'" in error["msg"]
                 for error in validation_error.errors()
             ),
             "Did not find expected error message for invalid format",
@@ -363,7 +365,7 @@ class TournamentCRUD_Should(unittest.TestCase):
         test_player.last_name = "Smith"
 
         mock_query = mock_db_session.query.return_value
-        mock_query.filter.return_value.first.return_value = test_player
+        mock_query.filter.return_value.order_by.return_value.first.return_value = test_player
 
         # Search with different casing
         search_participant = Participant(first_name="jAnE", last_name="sMiTh")
@@ -384,16 +386,10 @@ class TournamentCRUD_Should(unittest.TestCase):
         filter_str = str(filter_args)
 
         self.assertTrue(
-            "like" in filter_str.lower(), "Query should use LIKE for partial matching"
-        )
-        self.assertTrue(
-            "players.first_name" in filter_str,
-            "Filter should be applied on the first_name column",
-        )
-        self.assertTrue(
-            "players.last_name" in filter_str,
-            "Filter should be applied on the last_name column",
+            "players.name_key" in filter_str,
+            "Filter should be applied on the indexed name_key column",
         )
+        self.assertEqual(filter_args.right.value, "jane smith")
 
     def test_get_participant_not_found(self):
         """
@@ -404,7 +400,7 @@ class TournamentCRUD_Should(unittest.TestCase):
 
         # Mock query chain to simulate no matching player found
         mock_query = mock_db_session.query.return_value
-        mock_query.filter.return_value.first.return_value = None  # No result
+        mock_query.filter.return_value.order_by.return_value.first.return_value = None  # No result
 
         # Search participant with case-insensitive mismatched details
         search_participant = Participant(first_name="Nonexistent", last_name="Player")
@@ -589,6 +585,452 @@ class TournamentCRUD_Should(unittest.TestCase):
             # Verify the result is None
             self.assertIsNotNone(result)
 
+    def test_add_participants_by_id(self):
+        """
+        Test that selected players are loaded with one query, inserted with one
+        statement and reported as added or already registered.
+        """
+        # Arrange
+        mock_db_session = Mock(spec=Session)
+        mock_tournament_id = uuid4()
+        new_player = MagicMock(id=uuid4(), first_name="John", last_name="Doe")
+        existing_player = MagicMock(id=uuid4(), first_name="Jane", last_name="Smith")
+
+        mock_query = mock_db_session.query.return_value
+        mock_query.filter.return_value.all.return_value = [new_player, existing_player]
+        mock_db_session.execute.return_value.scalars.return_value = [new_player.id]
+
+        # Act
+        result = tournaments.add_participants_by_id(
+            mock_db_session, mock_tournament_id, [new_player.id, existing_player.id]
+        )
+
+        # Assert
+        mock_db_session.query.assert_called_once()
+        mock_db_session.execute.assert_called_once()
+        mock_db_session.commit.assert_called_once()
+        statement = str(mock_db_session.execute.call_args[0][0])
+        self.assertIn("INSERT INTO tournament_participants", statement)
+        self.assertEqual(result[new_player.id]["status"], "Added")
+        self.assertEqual(result[existing_player.id]["status"], "Already exists")
+        self.assertEqual(result[existing_player.id]["first_name"], "Jane")
+
+    def test_add_participants_by_id_unknown_players(self):
+        """
+        Test that nothing is inserted when none of the IDs exist.
+        """
+        mock_db_session = Mock(spec=Session)
+        mock_db_session.query.return_value.filter.return_value.all.return_value = []
+
+        result = tournaments.add_participants_by_id(mock_db_session, uuid4(), [uuid4()])
+
+        self.assertEqual(result, {})
+        mock_db_session.execute.assert_not_called()
+
+    def test_delete_players(self):
+        """
+        Test that names are resolved once and removed with a single DELETE ... RETURNING.
+        """
+        mock_db_session = Mock(spec=Session)
+        registered = MagicMock(id=uuid4(), name_key="john doe")
+        not_registered = MagicMock(id=uuid4(), name_key="jane smith")
+        mock_db_session.query.return_value.filter.return_value.order_by.return_value.all.return_value = [
+            registered,
+            not_registered,
+        ]
+        mock_db_session.execute.return_value.scalars.return_value = [registered.id]
+
+        result = tournaments.delete_players(
+            mock_db_session,
+            uuid4(),
+            [
+                Participant(first_name="John", last_name="Doe"),
+                Participant(first_name="Jane", last_name="Smith"),
+                Participant(first_name="Missing", last_name="Player"),
+            ],
+        )
+
+        self.assertEqual(
+            result,
+            {
+                "John Doe": {"status": "Deleted"},
+                "Jane Smith": {"status": "Not Found"},
+                "Missing Player": {"status": "Not Found"},
+            },
+        )
+        mock_db_session.execute.assert_called_once()
+        self.assertIn(
+            "DELETE FROM tournament_participants",
+            str(mock_db_session.execute.call_args[0][0]),
+        )
+        mock_db_session.commit.assert_called_once()
+
+    def test_delete_players_removes_one_of_two_homonyms(self):
+        """
+        Test that a name shared by two players removes only the one registration picks.
+        """
+        mock_db_session = Mock(spec=Session)
+        first = MagicMock(id=uuid4(), name_key="john smith")
+        homonym = MagicMock(id=uuid4(), name_key="john smith")
+        mock_db_session.query.return_value.filter.return_value.order_by.return_value.all.return_value = [
+            first,
+            homonym,
+        ]
+        mock_db_session.execute.return_value.scalars.return_value = [first.id]
+
+        result = tournaments.delete_players(
+            mock_db_session, uuid4(), [Participant(first_name="John", last_name="Smith")]
+        )
+
+        self.assertEqual(result, {"John Smith": {"status": "Deleted"}})
+        delete_statement = mock_db_session.execute.call_args[0][0]
+        removed = delete_statement.whereclause.clauses[1].right.value
+        self.assertEqual(list(removed), [first.id])
+
+    @patch("src.crud.tournaments.get_tournament")
+    def test_create_next_round_waits_for_finalized_matches(self, mock_get_tournament):
+        players = [uuid4() for _ in range(3)]
+        scored = Match(player_a_id=players[0], player_b_id=players[1], stage=0, result_code=1)
+        bye = Match(player_a_id=players[2], player_b_id=None, stage=0, result_code=1)
+        tournament = MagicMock(spec=Tournament, num_stages=3, matches=[scored, bye])
+        tournament.format.type = "swiss"
+        mock_get_tournament.return_value = tournament
+
+        with self.assertRaises(InvalidRequest) as context:
+            tournaments.create_next_round(uuid4(), self.mock_db_session, self.mock_user)
+
+        self.assertEqual(str(context.exception), "Current round is not finished")
+        self.assertFalse(tournaments.is_decided(scored))
+        self.assertTrue(tournaments.is_decided(bye))
+        scored.finalized_at = datetime.now()
+        self.assertTrue(tournaments.is_decided(scored))
+
+    @patch("src.crud.tournaments.get_tournament")
+    def test_draw_playoff_waits_for_finalized_group_matches(self, mock_get_tournament):
+        players = [uuid4() for _ in range(3)]
+        group_matches = [
+            Match(player_a_id=players[0], player_b_id=players[1], stage=0, group_number=0, result_code=1, finalized_at=datetime.now()),
+            Match(player_a_id=players[1], player_b_id=players[2], stage=1, group_number=0, result_code=2),
+        ]
+        playoff = Match(stage=2, serial_number=0, source_a="A1", source_b="A2")
+        tournament = MagicMock(spec=Tournament, matches=[*group_matches, playoff])
+        tournament.format.type = "groups"
+        mock_get_tournament.return_value = tournament
+
+        with self.assertRaises(InvalidRequest) as context:
+            tournaments.create_next_round(uuid4(), self.mock_db_session, self.mock_user)
+
+        self.assertEqual(str(context.exception), "Group stage is not finished")
+        self.assertIsNone(playoff.player_a_id)
+        self.mock_db_session.commit.assert_not_called()
+
+    @patch("src.crud.tournaments.get_tournament")
+    def test_update_tournament_outdated_version(self, mock_get_tournament):
+        mock_get_tournament.return_value = MagicMock(spec=Tournament, version=3)
+
+        with self.assertRaises(VersionConflict):
+            tournaments.update_tournament(
+                uuid4(),
+                UpdateTournamentRequest(
+                    name=None, start_time=None, end_time=None, prize=100
+                ),
+                self.mock_db_session,
+                expected_version=2,
+            )
+
+        self.mock_db_session.commit.assert_not_called()
+
+    def test_read_participants(self):
+        """
+        Test that the participants are read with one query and returned as plain dicts.
+        """
+        row = MagicMock(_mapping={"id": uuid4(), "first_name": "John", "score": 3, "wins": 2})
+        query = self.mock_db_session.query.return_value.join.return_value.outerjoin.return_value
+        query.filter.return_value.order_by.return_value.offset.return_value.limit.return_value = [row]
+
+        result = tournaments.read_participants(
+            self.mock_db_session, uuid4(), offset=10, limit=5
+        )
+
+        self.assertEqual(result, [row._mapping])
+        self.assertIsInstance(result[0], dict)
+        self.mock_db_session.query.assert_called_once()
+        order = [str(clause) for clause in query.filter.return_value.order_by.call_args[0]]
+        self.assertIn("coalesce(tournament_participants.score", order[0])
+        self.assertTrue(order[0].endswith("DESC"))
+        query.filter.return_value.order_by.return_value.offset.assert_called_once_with(10)
+
+    def test_round_robin_stages_odd_number_of_players(self):
+        """
+        Test that an odd number of players gets one bye per stage and every pair meets once.
+        """
+        players = [uuid4() for _ in range(5)]
+
+        stages = tournaments.split_in_stages(players)
+
+        self.assertEqual(len(stages), 5)
+        pairs = [frozenset(pair) for stage in stages for pair in stage]
+        self.assertEqual(len(pairs), 10)
+        self.assertEqual(len(set(pairs)), 10)
+        for stage in stages:
+            self.assertEqual(len(stage), 2)
+
+    def test_round_robin_stages_home_away_balance(self):
+        """
+        Test that every player is at home in half of their matches, +/- one.
+        """
+        players = list(range(8))
+
+        home_matches = {player: 0 for player in players}
+        for stage in tournaments.round_robin_stages(players):
+            for home_player, _ in stage:
+                home_matches[home_player] += 1
+
+        self.assertTrue(all(3 <= count <= 4 for count in home_matches.values()))
+
+
+    def test_seeding_order_keeps_top_seeds_apart(self):
+        """
+        Test the standard seeding order of an eight player bracket.
+        """
+        self.assertEqual(tournaments.seeding_order(8), [0, 7, 3, 4, 1, 6, 2, 5])
+        self.assertEqual(tournaments.seeding_order(1), [0])
+
+    def test_build_knockout_bracket_with_byes(self):
+        """
+        Test that byes go to the top seeds and every match is linked to the match it feeds.
+        """
+        players = list(range(6))
+
+        bracket = tournaments.build_knockout_bracket(players)
+
+        by_id = {match["id"]: match for match in bracket}
+        first_stage = [match for match in bracket if match["stage"] == 0]
+        self.assertEqual(len(bracket), 5)
+        self.assertEqual(len(first_stage), 2)
+        self.assertEqual(
+            {frozenset((m["player_a_id"], m["player_b_id"])) for m in first_stage},
+            {frozenset((3, 4)), frozenset((2, 5))},
+        )
+        semi_finals = [match for match in bracket if match["stage"] == 1]
+        self.assertEqual({m["player_a_id"] for m in semi_finals}, {0, 1})
+        self.assertEqual({m["player_b_id"] for m in semi_finals}, {None})
+
+        final = bracket[0]
+        self.assertEqual(final["stage"], 2)
+        self.assertIsNone(final["next_match_id"])
+        for match in bracket[1:]:
+            next_match = by_id[match["next_match_id"]]
+            self.assertEqual(next_match["stage"], match["stage"] + 1)
+            self.assertEqual(next_match["serial_number"], match["serial_number"] // 2)
+
+    def test_build_knockout_bracket_power_of_two(self):
+        """
+        Test that a full bracket has no byes and n - 1 matches.
+        """
+        bracket = tournaments.build_knockout_bracket(list(range(16)))
+
+        self.assertEqual(len(bracket), 15)
+        self.assertEqual(len([match for match in bracket if match["stage"] == 0]), 8)
+        self.assertTrue(
+            all(match["player_a_id"] is not None for match in bracket if match["stage"] == 0)
+        )
+
+    def test_swiss_ranking_breaks_ties_on_tournament_results(self):
+        a, b, c, d = (uuid4() for _ in range(4))
+        now = datetime.now()
+        matches = [
+            Match(player_a_id=a, player_b_id=b, result_code=1, finalized_at=now),
+            Match(player_a_id=c, player_b_id=d, result_code=1, finalized_at=now),
+            Match(player_a_id=a, player_b_id=d, result_code=2, finalized_at=now),
+            Match(player_a_id=c, player_b_id=b, result_code=2, finalized_at=now),
+            Match(player_a_id=a, player_b_id=c, result_code=1),
+        ]
+
+        ranking = tournaments.swiss_ranking({a: 3, b: 3, c: 3, d: 6}, matches)
+
+        # a and c played d (6 points), b played a and c (3 points each).
+        self.assertEqual(ranking[0], d)
+        self.assertEqual(set(ranking[1:3]), {a, c})
+        self.assertEqual(ranking[3], b)
+
+    def test_pair_swiss_round_backtracks_to_avoid_rematch(self):
+        """
+        Test that the pairing backtracks when the greedy choice leaves a rematch.
+        """
+        pairs, bye = tournaments.pair_swiss_round([0, 1, 2, 3], [(2, 3)])
+
+        self.assertEqual(pairs, [(0, 2), (1, 3)])
+        self.assertIsNone(bye)
+
+    def test_pair_swiss_round_gives_bye_to_lowest_ranked_without_bye(self):
+        """
+        Test that the bye goes to the lowest ranked player who has not had one.
+        """
+        pairs, bye = tournaments.pair_swiss_round([0, 1, 2, 3, 4], [(4, None)])
+
+        self.assertEqual(bye, 3)
+        self.assertEqual(pairs, [(0, 1), (2, 4)])
+
+    def test_pair_swiss_round_without_valid_pairing(self):
+        """
+        Test that InvalidRequest is raised when every pairing is a rematch.
+        """
+        with self.assertRaises(InvalidRequest):
+            tournaments.pair_swiss_round([0, 1, 2, 3], [(0, 1), (0, 2), (0, 3)])
+
+    def test_divide_players_into_groups_snake_order(self):
+        """
+        Test that seeded players are dealt into balanced groups in snake order.
+        """
+        groups = tournaments.divide_players_into_groups(list(range(10)), 3)
+
+        self.assertEqual(groups, [[0, 5, 6], [1, 4, 7], [2, 3, 8, 9]])
+
+    def test_place_qualifiers_keeps_groups_apart_in_first_matches(self):
+        """
+        Test that no first playoff match is between two qualifiers of the same group.
+        """
+        for num_groups in range(2, 17):
+            for group_qualifiers in range(1, 6):
+                with self.subTest(groups=num_groups, qualifiers=group_qualifiers):
+                    qualifiers = tournaments.place_qualifiers(num_groups, group_qualifiers)
+                    self.assertEqual(len(set(qualifiers)), num_groups * group_qualifiers)
+
+                    for fixture in tournaments.build_knockout_bracket(qualifiers):
+                        sources = [fixture["player_a_id"], fixture["player_b_id"]]
+                        if None in sources:
+                            continue
+                        groups = [source.rstrip("0123456789") for source in sources]
+                        self.assertNotEqual(groups[0], groups[1], f"{sources} meet first")
+
+    def test_place_qualifiers_puts_winner_and_runner_up_in_opposite_halves(self):
+        """
+        Test that with two qualifiers per group they can only meet in the final.
+        """
+        for num_groups in range(2, 17):
+            with self.subTest(groups=num_groups):
+                qualifiers = tournaments.place_qualifiers(num_groups, 2)
+                bracket_size = 1 << (len(qualifiers) - 1).bit_length()
+                slots = [
+                    qualifiers[seed] if seed < len(qualifiers) else None
+                    for seed in tournaments.seeding_order(bracket_size)
+                ]
+                top_half = set(slots[: bracket_size // 2])
+                for group_number in range(num_groups):
+                    label = tournaments.group_label(group_number)
+                    self.assertNotEqual(f"{label}1" in top_half, f"{label}2" in top_half)
+
+    def test_group_ranking_breaks_ties_within_the_group(self):
+        a, b, c, d = (uuid4() for _ in range(4))
+
+        def match(player_a, player_b, result_code, score_a, score_b):
+            return Match(player_a_id=player_a, player_b_id=player_b, result_code=result_code, score_a=score_a, score_b=score_b)
+
+        matches = [
+            match(a, b, 2, 0, 1),
+            match(c, d, 1, 5, 0),
+            match(a, c, 1, 5, 0),
+            match(b, d, 2, 0, 1),
+            match(a, d, 1, 1, 0),
+            match(b, c, 2, 0, 1),
+        ]
+        points = {a: 6, b: 3, c: 6, d: 3}
+
+        ranking = tournaments.group_ranking(points, matches, win_points=3, draw_points=1)
+
+        # a and c are level on points and a beat c; b and d are level and d beat b.
+        self.assertEqual(ranking, [a, c, d, b])
+
+    def test_group_ranking_uses_difference_then_wins(self):
+        a, b, c = (uuid4() for _ in range(3))
+        matches = [
+            Match(player_a_id=a, player_b_id=b, result_code=3, score_a=2, score_b=2),
+            Match(player_a_id=a, player_b_id=c, result_code=1, score_a=9, score_b=0),
+            Match(player_a_id=b, player_b_id=c, result_code=1, score_a=1, score_b=0),
+        ]
+
+        ranking = tournaments.group_ranking({a: 4, b: 4, c: 0}, matches, win_points=3, draw_points=1)
+
+        self.assertEqual(ranking, [a, b, c])
+
+    def test_group_label(self):
+        """
+        Test the letter labels of the groups.
+        """
+        self.assertEqual(
+            [tournaments.group_label(number) for number in (0, 25, 26, 27, 701, 702)],
+            ["A", "Z", "AA", "AB", "ZZ", "AAA"],
+        )
+
+    def test_group_fixtures_round_robin_in_every_group(self):
+        """
+        Test that every pair of a group meets once and groups play their stages in parallel.
+        """
+        groups = [[1, 2, 3], [4, 5, 6, 7]]
+
+        fixtures = list(tournaments._group_fixtures(groups))
+
+        self.assertEqual(len(fixtures), 3 + 6)
+        self.assertEqual({fixture["stage"] for fixture in fixtures}, {0, 1, 2})
+        for fixture in fixtures:
+            group = groups[fixture["group_number"]]
+            self.assertIn(fixture["player_a_id"], group)
+            self.assertIn(fixture["player_b_id"], group)
+
+    def test_create_next_knockout_match_waits_for_sibling(self):
+        """
+        Test that a lazy bracket does not create the next match before the sibling is decided.
+        """
+        tournament = MagicMock(spec=Tournament, id=uuid4(), num_stages=3)
+        match = Match(stage=0, serial_number=2, player_a_id=uuid4(), player_b_id=uuid4(), result_code=1)
+        sibling = Match(stage=0, serial_number=3, player_a_id=uuid4(), player_b_id=uuid4())
+        self.mock_db_session.query().filter().first.side_effect = [None, sibling]
+
+        result = tournaments.create_next_knockout_match(self.mock_db_session, tournament, match)
+
+        self.assertIsNone(result)
+        self.mock_db_session.add.assert_not_called()
+
+    def test_create_next_knockout_match_with_both_winners(self):
+        """
+        Test that the next match is created with both winners once the sibling is decided.
+        """
+        tournament = MagicMock(spec=Tournament, id=uuid4(), num_stages=3, match_format_id=1)
+        match = Match(stage=0, serial_number=3, player_a_id=uuid4(), player_b_id=uuid4(), result_code=2)
+        sibling = Match(stage=0, serial_number=2, player_a_id=uuid4(), player_b_id=uuid4(), result_code=1)
+        self.mock_db_session.query().filter().first.side_effect = [None, sibling]
+
+        result = tournaments.create_next_knockout_match(self.mock_db_session, tournament, match)
+
+        self.assertEqual((result.stage, result.serial_number), (1, 1))
+        self.assertEqual(result.player_a_id, sibling.player_a_id)
+        self.assertEqual(result.player_b_id, match.player_b_id)
+        self.mock_db_session.add.assert_called_once_with(result)
+
+    def test_insert_matches_streams_batches_without_orm_objects(self):
+        """
+        Test that fixtures are inserted batch by batch with executemany and no Match objects.
+        """
+        tournament = MagicMock(spec=Tournament, id=uuid4(), match_format_id=1)
+        fixtures = (
+            {"player_a_id": uuid4(), "player_b_id": uuid4(), "stage": 0, "serial_number": number}
+            for number in range(5)
+        )
+
+        inserted = tournaments._insert_matches(
+            self.mock_db_session, tournament, self.mock_user, fixtures, batch_size=2
+        )
+
+        self.assertEqual(inserted, 5)
+        batches = [call_args[0][1] for call_args in self.mock_db_session.execute.call_args_list]
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        for row in (row for batch in batches for row in batch):
+            self.assertEqual(set(row), set(tournaments.FIXTURE_COLUMNS) | {"format_id", "score_a", "score_b", "author_id", "tournament_id"})
+            self.assertIsNotNone(row["id"])
+        self.mock_db_session.add_all.assert_not_called()
+        self.mock_db_session.query.assert_not_called()
+        self.mock_db_session.commit.assert_called_once()
 
 if __name__ == "__main__":
     unittest.main()
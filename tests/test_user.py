@@ -7,7 +7,7 @@ from src.models.user import User, Role
 from src.schemas.user import CreateUserRequest, LoginRequest, UpdateEmailRequest, UpdateUserRequest, UserResponse
 from src.crud.users import (is_admin, is_director, username_exists,
                             email_exists, create_user, login_user,
-                            get_user_by_id, update_email, delete_user)
+                            get_user_by_id, update_email, delete_user, delete_users)
 from src.common.custom_responses import AlreadyExists, NotFound, Unauthorized, ForbiddenAccess, BadRequest
 
 
@@ -104,6 +104,28 @@ class UserCRUDShould(unittest.TestCase):
         response = delete_user(self.db, "nonexistent_user", self.current_user)
         self.assertIsInstance(response, NotFound)
 
+    def test_delete_users_success(self):
+        deleted_user = User(id=uuid4(), username="spam_user")
+        self.db.query.return_value.filter.return_value.all.return_value = [deleted_user]
+        response = delete_users(self.db, ["spam_user", "missing_user"], self.current_user)
+        self.assertEqual(response, {"spam_user": "Deleted", "missing_user": "Not Found"})
+        self.db.commit.assert_called_once()
+
+    def test_delete_users_none_found(self):
+        self.db.query.return_value.filter.return_value.all.return_value = []
+        response = delete_users(self.db, ["missing_user"], self.current_user)
+        self.assertEqual(response, {"missing_user": "Not Found"})
+        self.db.commit.assert_not_called()
+
+    def test_delete_users_self(self):
+        response = delete_users(self.db, [self.current_user.username], self.current_user)
+        self.assertIsInstance(response, BadRequest)
+
+    def test_delete_users_forbidden(self):
+        self.current_user.role = Role.USER
+        response = delete_users(self.db, ["spam_user"], self.current_user)
+        self.assertIsInstance(response, ForbiddenAccess)
+
 
 if __name__ == "__main__":
     unittest.main()